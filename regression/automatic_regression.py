@@ -40,6 +40,10 @@ modules = [
     'scripts/dynamic_stability/dynamicstability.py',
     'scripts/weights/weights.py',
     'scripts/DC_10_noise/DC_10_noise.py',
+    'scripts/airframe_noise/airframe_noise.py',
+    'scripts/noise_metrics/noise_metrics.py',
+    'scripts/noise_trajectory/noise_trajectory.py',
+    'scripts/noise_footprint/noise_footprint.py',
     'scripts/B737/mission_B737.py',
     'scripts/Embraer_E190_constThr/mission_Embraer_E190_constThr.py',
     'scripts/concorde/concorde.py',
@@ -50,6 +54,7 @@ modules = [
     'scripts/solar_radiation/solar_radiation.py',
     'scripts/propeller/propeller.py',
     'scripts/aerodynamics/aerodynamics.py',
+    'scripts/aerodynamics/aerodas.py',
     #'scripts/aerodynamics_super/aerodynamics_super.py',
     'scripts/battery/battery.py',
     'scripts/cmalpha/cmalpha.py',
@@ -61,8 +66,23 @@ modules = [
     'scripts/variable_cruise_distance/variable_cruise_distance.py',
     'scripts/noise_optimization/Noise_Test.py',
     'scripts/Regional_Jet_Optimization/Optimize2.py',
+    'scripts/evaluation_cache/evaluation_cache.py',
+    'scripts/optimization_aliases/optimization_aliases.py',
+    'scripts/nexus_batch/nexus_batch.py',
+    'scripts/surrogate_sampling/surrogate_sampling.py',
+    'scripts/carpet_plot/carpet_plot.py',
+    'scripts/expected_improvement/expected_improvement.py',
+    'scripts/optimization_history/optimization_history.py',
+    'scripts/trust_region/trust_region_levels.py',
+    'scripts/optimized_climb/optimized_climb.py',
+    'scripts/adaptive_refinement/adaptive_refinement.py',
+    'scripts/dense_output/dense_output.py',
+    'scripts/all_at_once/all_at_once.py',
+    'scripts/mission_sweep/mission_sweep.py',
+    'scripts/process_plan/process_plan.py',
     'scripts/industrial_costs/industrial_costs.py',
     'scripts/sizing_loop/sizing_loop.py',
+    'scripts/sizing_database/sizing_database.py',
     'scripts/lifting_line/lifting_line.py',
     'scripts/sweeps/test_sweeps.py',
 ]
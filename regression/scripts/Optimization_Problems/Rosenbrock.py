@@ -0,0 +1,105 @@
+# Rosenbrock.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" setup file for a Nexus around the Rosenbrock function, shared by the optimization regressions
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses import Process
+from SUAVE.Optimization import Nexus
+
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Define the Problem
+# ----------------------------------------------------------------------
+
+def rosenbrock_setup(number_of_inputs=2, initial=0.5, bounds=(-1.,2.), input_scaling=1., objective_scaling=1.,
+                     coefficient=100., radius=2., constraints=None, delay=0., failure=None, low_fidelity=False):
+    """ The chained Rosenbrock function of x1 ... xn,
+            rosenbrock    = (1-x1)**2 + coefficient*sum((x[i+1]-x[i]**2)**2)
+        with the outputs
+            radius_margin = radius - sum(x**2)
+            x_sum         = sum(x)
+
+        initial and input_scaling are one value for every input or one for each. constraints are rows of the
+        constraint table, by default radius_margin > 0. The analysis takes delay seconds, and raises an error when
+        x1 and x2 are both above the corner given by failure. With low_fidelity, fidelity level 1 is a model that
+        misses some of the physics.
+    """
+
+    nexus = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    initial       = np.ones(number_of_inputs) * initial
+    input_scaling = np.ones(number_of_inputs) * input_scaling
+    tags          = ['x' + str(i+1) for i in range(number_of_inputs)]
+
+    #   [ tag, initial, (lb,ub), scaling, units ]
+    problem.inputs = np.array([[tags[i], initial[i], bounds, input_scaling[i], Units.less] for i in range(number_of_inputs)])
+
+    # [ tag, scaling, units ]
+    problem.objective = np.array([
+        [ 'rosenbrock', objective_scaling, Units.less ]
+    ])
+
+    # [ tag, sense, edge, scaling, units ]
+    if constraints is None:
+        constraints = [[ 'radius_margin' , '>', 0., 1., Units.less]]
+    problem.constraints = np.array(constraints)
+
+    # [ 'alias' , ['data.path1.name','data.path2.name'] ]
+    problem.aliases = [[tag, 'design.' + tag] for tag in tags] + [
+        [ 'rosenbrock'   , 'summary.rosenbrock'   ],
+        [ 'radius_margin', 'summary.radius_margin'],
+        [ 'x_sum'        , 'summary.x_sum'        ],
+    ]
+
+    nexus.design  = Data()
+    nexus.summary = Data()
+    nexus.rosenbrock = Data()
+    nexus.rosenbrock.tags         = tags
+    nexus.rosenbrock.coefficient  = coefficient
+    nexus.rosenbrock.radius       = radius
+    nexus.rosenbrock.delay        = delay
+    nexus.rosenbrock.failure      = failure
+    nexus.rosenbrock.low_fidelity = low_fidelity
+
+    nexus.procedure = Process()
+    nexus.procedure.analytic = analytic
+
+    return nexus
+
+def analytic(nexus):
+
+    settings = nexus.rosenbrock
+    x        = np.array([nexus.design[tag] for tag in settings.tags])
+
+    # stands in for an expensive analysis
+    if settings.delay:
+        time.sleep(settings.delay)
+
+    if settings.failure is not None and x[0] > settings.failure[0] and x[1] > settings.failure[1]:
+        raise ValueError('analysis did not converge')
+
+    f     = (1.-x[0])**2 + settings.coefficient*np.sum((x[1:]-x[:-1]**2)**2)
+    x_sum = np.sum(x)
+
+    # the low fidelity model misses some of the physics
+    if settings.low_fidelity and nexus.fidelity_level == 1:
+        f     = 0.5*f + 2.*x[0] - 1.
+        x_sum = x_sum + 0.1*x[0]*x[1]
+
+    nexus.summary.rosenbrock    = f
+    nexus.summary.radius_margin = settings.radius - np.sum(x**2)
+    nexus.summary.x_sum         = x_sum
+
+    return nexus
@@ -0,0 +1,120 @@
+# adaptive_refinement.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Core import Data
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, chebyshev_coefficients, chebyshev_interpolation
+
+import numpy as np
+
+import sys
+#import vehicle file
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    # --------------------------------------------------------------------
+    # Chebyshev coefficients and interpolation
+    # --------------------------------------------------------------------
+
+    x,D,I = chebyshev_data(9)
+    f     = np.exp(x)[:,None]*np.array([[1.,2.]])
+
+    a = chebyshev_coefficients(f)
+    x_new = np.linspace(0,1,7)
+    P = chebyshev_interpolation(9,x_new)
+
+    f_series = np.polynomial.chebyshev.chebval(1.-2.*x_new,a[:,0])
+    f_interp = np.dot(P,f)
+    f_truth  = np.exp(x_new)[:,None]*np.array([[1.,2.]])
+
+    assert(np.max(np.abs(f_series-f_truth[:,0]))<1e-9), 'Adaptive refinement regression failed at coefficient test'
+    assert(np.max(np.abs(f_interp-f_truth))<1e-9), 'Adaptive refinement regression failed at interpolation test'
+    assert(np.abs(a[-1,0])<1e-8), 'Adaptive refinement regression failed at coefficient decay test'
+
+    # --------------------------------------------------------------------
+    # Fly the 737 mission with fixed and adaptive control points
+    # --------------------------------------------------------------------
+
+    fuel_fixed, evaluations_fixed, points_fixed = fly_mission(False)
+    fuel,       evaluations,       points       = fly_mission(True)
+
+    print 'fixed fuel burn    = ', fuel_fixed, ' with ', evaluations_fixed, ' iterations'
+    print 'adaptive fuel burn = ', fuel, ' with ', evaluations, ' iterations'
+    print 'adaptive control points = ', points
+
+    # the same fuel burn
+    assert(np.abs((fuel-fuel_fixed)/fuel_fixed)<1e-5), 'Adaptive refinement regression failed at fuel burn test'
+
+    # for less work
+    assert(evaluations < evaluations_fixed*0.75), 'Adaptive refinement regression failed at iteration count test'
+
+    # only the segments that need more points get them
+    points_r = [5, 9, 5, 5, 9, 5, 5, 5, 5]
+    assert(points == points_r), 'Adaptive refinement regression failed at control point test'
+
+    fuel_r = 17814.23721156
+    assert(np.abs((fuel-fuel_r)/fuel_r)<1e-6), 'Adaptive refinement regression failed at fuel burn value test'
+
+    return
+
+# ----------------------------------------------------------------------
+#   Fly the Mission
+# ----------------------------------------------------------------------
+
+def fly_mission(adaptive):
+
+    # vehicle data
+    vehicle  = vehicle_setup()
+    configs  = mission_B737.configs_setup(vehicle)
+
+    # vehicle analyses
+    configs_analyses = mission_B737.analyses_setup(configs)
+    analyses = SUAVE.Analyses.Analysis.Container()
+    analyses.configs = configs_analyses
+
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    configs_analyses.finalize()
+
+    mission = mission_B737.mission_setup(configs_analyses)
+
+    # count the iterations of every segment
+    evaluations = Data()
+    evaluations.count = 0
+    def count_evaluations(segment,state):
+        evaluations.count += 1
+
+    for segment in mission.segments.values():
+        segment.process.iterate.residuals.count = count_evaluations
+        if adaptive:
+            segment.state.numerics.number_control_points = 5
+            segment.state.numerics.adaptive_refinement   = True
+
+    results = mission.evaluate()
+
+    fuel   = results.segments[0].conditions.weights.total_mass[0,0] - results.segments[-1].conditions.weights.total_mass[-1,0]
+    points = [segment.numerics.number_control_points for segment in results.segments.values()]
+
+    return fuel, evaluations.count, points
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Adaptive refinement test passed!'
@@ -0,0 +1,148 @@
+# aerodas.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Core import Data
+
+import numpy as np
+
+import time
+import sys
+#import vehicle file
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    # initialize the vehicle
+    vehicle = vehicle_setup()
+
+    # initalize the aero model
+    aerodynamics = SUAVE.Analyses.Aerodynamics.AERODAS()
+    aerodynamics.geometry = vehicle
+    aerodynamics.initialize()
+
+    #no of test points
+    test_num = 11
+
+    # sweep through pre and post stall for both signs of the angle of attack
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(test_num)
+
+    state.conditions.freestream.reynolds_number   = np.linspace(1e6,8e6,test_num)[:,None]
+    state.conditions.aerodynamics.angle_of_attack = np.linspace(-40,100,test_num)[:,None] * Units.deg
+
+    aerodynamics.evaluate(state)
+
+    # --------------------------------------------------------------------
+    # Test the totals and the per wing coefficients
+    # --------------------------------------------------------------------
+
+    lift   = state.conditions.aerodynamics.lift_coefficient
+    drag   = state.conditions.aerodynamics.drag_coefficient
+    pre_cl = state.conditions.aerodynamics.pre_stall_coefficients.main_wing.lift_coefficient
+    post_cd= state.conditions.aerodynamics.post_stall_coefficients.horizontal_stabilizer.drag_coefficient
+
+    lift_r = np.array([-1.169196270556, -1.046938177888, -1.331285792208,  0.221898658928,
+                        1.74223542623 ,  1.104255357781,  1.165008895625,  1.023615654832,
+                        0.70353623978 ,  0.235111489435, -0.309609575735])[:,None]
+    drag_r = np.array([6.482168781823e-01, 2.693003758757e-01, 3.979610060234e-02,
+                       1.706027895359e-03, 6.998870048329e-02, 3.780291259062e-01,
+                       7.520415579585e-01, 1.100404725939e+00, 1.409039084754e+00,
+                       1.665472379903e+00, 1.859342257470e+00])[:,None]
+    pre_cl_r = np.array([ 2.850594007315e+06,  5.266330537819e+02, -1.082461286132e+00,
+                          1.804279079151e-01,  1.410469418130e+00, -9.180541034621e+03,
+                         -1.907765693750e+07, -4.714850228513e+09, -3.519011345150e+11,
+                         -1.217638011176e+13, -2.465844796119e+14])[:,None]
+
+    print 'lift = ', lift
+    print 'drag = ', drag
+    print 'post stall horizontal tail drag = ', post_cd
+
+    lift_test   = np.abs((lift-lift_r)/lift)
+    drag_test   = np.abs((drag-drag_r)/drag)
+    pre_cl_test = np.abs((pre_cl-pre_cl_r)/pre_cl)
+
+    assert(np.max(lift_test)<1e-6), 'AERODAS regression failed at lift test'
+    assert(np.max(drag_test)<1e-6), 'AERODAS regression failed at drag test'
+    assert(np.max(pre_cl_test)<1e-6), 'AERODAS regression failed at pre stall lift test'
+
+    # --------------------------------------------------------------------
+    # Fly the 737 mission with AERODAS
+    # --------------------------------------------------------------------
+
+    configs, analyses = full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+
+    mission = analyses.missions.base
+
+    t0 = time.time()
+    results = mission.evaluate()
+    t1 = time.time()
+
+    print 'AERODAS 737 mission time: ' + str(t1-t0) + ' s'
+
+    landing_mass   = results.segments[-1].conditions.weights.total_mass[-1,0]
+    landing_mass_r = 74175.84042880211
+
+    print 'landing mass = ', landing_mass
+
+    mass_test = np.abs((landing_mass-landing_mass_r)/landing_mass_r)
+
+    assert(mass_test<1e-6), 'AERODAS regression failed at mission test'
+
+    return
+
+# ----------------------------------------------------------------------
+#   Analysis Setup
+# ----------------------------------------------------------------------
+
+def full_setup():
+
+    # vehicle data
+    vehicle  = vehicle_setup()
+    configs  = mission_B737.configs_setup(vehicle)
+
+    # vehicle analyses, the 737 analyses with AERODAS swapped in
+    configs_analyses = SUAVE.Analyses.Analysis.Container()
+    for tag,config in configs.items():
+        analysis = mission_B737.base_analysis(config)
+
+        aerodynamics = SUAVE.Analyses.Aerodynamics.AERODAS()
+        aerodynamics.geometry = config
+        analysis.aerodynamics = aerodynamics
+
+        configs_analyses[tag] = analysis
+
+    # mission analyses
+    mission  = mission_B737.mission_setup(configs_analyses)
+    missions_analyses = mission_B737.missions_setup(mission)
+
+    analyses = SUAVE.Analyses.Analysis.Container()
+    analyses.configs  = configs_analyses
+    analyses.missions = missions_analyses
+
+    return configs, analyses
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'AERODAS test passed!'
@@ -0,0 +1,121 @@
+# airframe_noise.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+
+import numpy as np
+import time
+
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_clean_wing
+from SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_landing_gear import noise_landing_gear
+from SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_leading_edge_slat import noise_leading_edge_slat
+from SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_trailing_edge_flap import noise_trailing_edge_flap
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
+                          2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
+
+    velocity  = 70.
+    viscosity = 1.9e-4
+    deltaw    = 0.05
+
+    # three observer positions along an approach
+    theta    = np.array([0.3,1.2,2.5])
+    phi      = np.array([0.,0.4,1.0])
+    distance = np.array([1500.,800.,3000.])
+    M        = np.array([0.2,0.22,0.25])
+
+    # --------------------------------------------------------------------
+    # Test the components over the trajectory against the truth values
+    # --------------------------------------------------------------------
+
+    SPL_wing = noise_clean_wing(1300.,110.,0,1,deltaw,velocity,viscosity,M,phi,theta,distance,frequency)
+    SPL_slat = noise_leading_edge_slat(SPL_wing,1300.,110.,velocity,deltaw,viscosity,M,phi,theta,distance,frequency)
+    SPL_gear = noise_landing_gear(3.5,6.,2,M,velocity,phi,theta,distance,frequency)
+    SPL_flap = noise_trailing_edge_flap(150.,4.,0.5,2,velocity,M,phi,theta,distance,frequency)
+
+    bands = [0,12,23]
+
+    truth = Data()
+    truth.wing = np.array([[32.779800223963, 33.085310700325,  9.173855800132],
+                           [47.327825457931, 45.268086978312, 21.210657859394],
+                           [21.465699637717, 14.874601497726, -9.410152672453]])
+    truth.slat = np.array([[35.805251471866, 43.863182596627, 25.362401009117],
+                           [50.358426920739, 56.866758579288, 37.49444649067 ],
+                           [24.511982515778, 27.768902223027,  6.876209765446]])
+    truth.gear = np.array([[48.779367836771, 44.671625478192, 17.768875476712],
+                           [53.267598263174, 51.383027893446, 24.628096910844],
+                           [39.802431035901, 42.406635497159, 24.768981961194]])
+    truth.flap = np.array([[45.725868907297, 42.80859660149 , 11.453588012697],
+                           [61.986889076699, 59.965747999411, 29.954936253398],
+                           [19.303229935172, 19.127914638804, -8.114158435828]])
+
+    error = Data()
+    error.wing = np.max(np.abs(SPL_wing[:,bands]-truth.wing))
+    error.slat = np.max(np.abs(SPL_slat[:,bands]-truth.slat))
+    error.gear = np.max(np.abs(SPL_gear[:,bands]-truth.gear))
+    error.flap = np.max(np.abs(SPL_flap[:,bands]-truth.flap))
+
+    print 'Errors:'
+    print error
+
+    for k,v in error.items():
+        assert(np.abs(v)<1e-9)
+
+    # --------------------------------------------------------------------
+    # Test a full trajectory in one call against one position at a time
+    # --------------------------------------------------------------------
+
+    n_steps  = 200
+    theta    = np.linspace(5.,175.,n_steps) * np.pi/180.
+    phi      = np.linspace(0.,60.,n_steps) * np.pi/180.
+    distance = np.linspace(4000.,400.,n_steps)
+    M        = np.linspace(0.2,0.25,n_steps)
+    deltaw   = np.linspace(0.05,0.06,n_steps)
+
+    def components(i):
+        if i is None:
+            i = slice(None)
+        wing   = noise_clean_wing(1300.,110.,0,1,deltaw[i],velocity,viscosity,M[i],phi[i],theta[i],distance[i],frequency)
+        vt     = noise_clean_wing(300.,25.,0,0,deltaw[i],velocity,viscosity,M[i],phi[i],theta[i],distance[i],frequency)
+        slat   = noise_leading_edge_slat(wing,1300.,110.,velocity,deltaw[i],viscosity,M[i],phi[i],theta[i],distance[i],frequency)
+        gear_2 = noise_landing_gear(3.5,6.,2,M[i],velocity,phi[i],theta[i],distance[i],frequency)
+        gear_4 = noise_landing_gear(3.5,6.,4,M[i],velocity,phi[i],theta[i],distance[i],frequency)
+        flap_2 = noise_trailing_edge_flap(150.,4.,0.5,2,velocity,M[i],phi[i],theta[i],distance[i],frequency)
+        flap_3 = noise_trailing_edge_flap(150.,4.,0.5,3,velocity,M[i],phi[i],theta[i],distance[i],frequency)
+        return np.array([wing,vt,slat,gear_2,gear_4,flap_2,flap_3])
+
+    t0 = time.time()
+    SPL_stepped = np.concatenate([components(i) for i in xrange(n_steps)],axis=1)
+    t1 = time.time()
+    SPL_array   = components(None)
+    t2 = time.time()
+
+    print 'Airframe noise for ' + str(n_steps) + ' positions: one at a time ' + str(t1-t0) + ' s, trajectory arrays ' + str(t2-t1) + ' s'
+
+    assert(SPL_array.shape == (7,n_steps,24))
+    assert(np.max(np.abs(SPL_array-SPL_stepped))<1e-10)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Airframe noise test passed!'
@@ -0,0 +1,104 @@
+# all_at_once.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Core import Data
+
+import numpy as np
+
+import sys
+#import vehicle file
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    # the 737 mission one segment at a time, then all at once
+    fuel_sequential, evaluations_sequential, converged_sequential = fly_mission(False)
+    fuel,            evaluations,            converged            = fly_mission(True)
+
+    print 'sequential fuel burn  = ', fuel_sequential, ' with ', evaluations_sequential, ' segment iterations'
+    print 'all at once fuel burn = ', fuel, ' with ', evaluations, ' segment iterations'
+
+    assert(converged), 'All at once regression failed at convergence test'
+
+    # the same mission
+    assert(np.abs((fuel-fuel_sequential)/fuel_sequential)<1e-8), 'All at once regression failed at fuel burn test'
+
+    # a dense jacobian of the whole mission takes over 2800 segment iterations
+    assert(evaluations < 600), 'All at once regression failed at segment iteration test'
+
+    fuel_r = 17814.26526102
+    assert(np.abs((fuel-fuel_r)/fuel_r)<1e-8), 'All at once regression failed at fuel burn value test'
+
+    return
+
+# ----------------------------------------------------------------------
+#   Fly the Mission
+# ----------------------------------------------------------------------
+
+def fly_mission(all_at_once):
+
+    # vehicle data
+    vehicle  = vehicle_setup()
+    configs  = mission_B737.configs_setup(vehicle)
+
+    # vehicle analyses
+    configs_analyses = mission_B737.analyses_setup(configs)
+    analyses = SUAVE.Analyses.Analysis.Container()
+    analyses.configs = configs_analyses
+
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    configs_analyses.finalize()
+
+    sequential = mission_B737.mission_setup(configs_analyses)
+
+    if all_at_once:
+        mission = SUAVE.Analyses.Mission.All_At_Once()
+        mission.tag = 'all_at_once'
+    else:
+        mission = SUAVE.Analyses.Mission.Sequential_Segments()
+        mission.tag = 'sequential'
+
+    # count the iterations of every segment
+    evaluations = Data()
+    evaluations.count = 0
+    def count_evaluations(segment,state):
+        evaluations.count += 1
+
+    for segment in sequential.segments.values():
+        segment.state.numerics.number_control_points = 8
+        segment.process.iterate.residuals.count = count_evaluations
+        mission.append_segment(segment)
+
+    results = mission.evaluate()
+
+    fuel = results.segments[0].conditions.weights.total_mass[0,0] - results.segments[-1].conditions.weights.total_mass[-1,0]
+
+    if all_at_once:
+        converged = mission.state.numerics.converged
+    else:
+        converged = all([segment.state.numerics.converged for segment in mission.segments.values()])
+
+    return fuel, evaluations.count, converged
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'All at once test passed!'
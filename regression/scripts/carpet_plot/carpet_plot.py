@@ -0,0 +1,215 @@
+# carpet_plot.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses import Process
+from SUAVE.Optimization import Nexus, carpet_plot
+from SUAVE.Optimization.carpet_plot import read_carpet_plot
+
+import numpy as np
+import time
+import os
+
+import sys
+#import vehicle file
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+sys.path.append('../Optimization_Problems')
+from Boeing_737 import vehicle_setup
+from Rosenbrock import rosenbrock_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    filename = 'carpet_plot.txt'
+    if os.path.exists(filename):
+        os.remove(filename)
+
+    number_of_points = 6
+
+    # --------------------------------------------------------------------
+    # Run the grid in this process and on worker processes
+    # --------------------------------------------------------------------
+
+    t0 = time.time()
+    serial   = carpet_plot(setup(), number_of_points, plot_obj = 0, plot_const = 0)
+    t1 = time.time()
+    parallel = carpet_plot(setup(), number_of_points, plot_obj = 0, plot_const = 0, processes = 4, filename = filename)
+    t2 = time.time()
+
+    print 'Carpet plot of ' + str(number_of_points**2) + ' cells: serial ' + str(t1-t0) + ' s, 4 processes ' + str(t2-t1) + ' s'
+
+    x1, x2 = np.meshgrid(serial.inputs[0,:],serial.inputs[1,:])
+    truth  = (1.-x1)**2 + 100.*(x2-x1**2)**2
+
+    # the cell where the analysis fails is left empty
+    failed = (x1 > 1.5) & (x2 > 1.5)
+
+    assert(np.sum(np.isnan(serial.objective)) == 1)
+    assert(np.all(np.isnan(serial.objective[failed])))
+    assert(np.max(np.abs(serial.objective[~failed]-truth[~failed])/truth[~failed]) < 1e-12)
+    assert(np.all(serial.objective[~failed] == parallel.objective[~failed]))
+    assert(np.all(serial.constraint_val[:,~failed] == parallel.constraint_val[:,~failed]))
+
+    # every cell was written as it finished
+    header, cells = read_carpet_plot(filename)
+    assert(len(cells) == number_of_points**2)
+    assert(np.all(header == [number_of_points, 0, 1, -1., 2., -1., 2.]))
+
+    # --------------------------------------------------------------------
+    # Resume an interrupted grid, with a cell written twice
+    # --------------------------------------------------------------------
+
+    lines = open(filename).readlines()
+    open(filename,'w').writelines(lines[:21] + [lines[5]] + [lines[21][:10]])
+
+    problem = setup()
+    resumed = carpet_plot(problem, number_of_points, plot_obj = 0, plot_const = 0, filename = filename)
+
+    print 'Cells run after the restart = ', problem.evaluation_count
+
+    # the failed cell is run again if it was in the file
+    n_failed_done = np.sum([np.isnan(cell[2]) for cell in read_carpet_plot(filename)[1][:20]])
+    assert(problem.evaluation_count == number_of_points**2-20+n_failed_done)
+    assert(np.all(resumed.objective[~failed] == serial.objective[~failed]))
+    assert(np.all(np.isnan(resumed.objective[failed])))
+
+    # a grid that is complete except for the failed cell runs only that cell
+    problem = setup()
+    carpet_plot(problem, number_of_points, plot_obj = 0, plot_const = 0, filename = filename)
+    assert(problem.evaluation_count == 1)
+
+    # a different grid is not mixed in
+    try:
+        carpet_plot(setup(), number_of_points+1, plot_obj = 0, plot_const = 0, filename = filename)
+        raised = False
+    except ValueError:
+        raised = True
+    assert(raised), 'Carpet plot regression failed at grid header test'
+
+    os.remove(filename)
+
+    # --------------------------------------------------------------------
+    # Mission cells start from the cell next to them
+    # --------------------------------------------------------------------
+
+    problem, evaluations = mission_problem()
+    unknowns = [np.copy(segment.state.unknowns.pack_array()) for segment in problem.missions.base.segments.values()]
+
+    cold = carpet_plot(problem, 3, plot_obj = 0, plot_const = 0, warm_start = False)
+    evaluations_cold  = evaluations.count
+    evaluations.count = 0
+
+    warm = carpet_plot(problem, 3, plot_obj = 0, plot_const = 0)
+    evaluations_warm  = evaluations.count
+
+    print 'Mission carpet plot segment iterations: cold ', evaluations_cold, ', warm ', evaluations_warm
+    print 'landing mass = ', warm.objective
+
+    assert(evaluations_warm < evaluations_cold), 'Carpet plot regression failed at warm start test'
+    assert(np.max(np.abs(warm.objective-cold.objective)/cold.objective) < 1e-4), 'Carpet plot regression failed at warm start value test'
+
+    # the segments are left as they were
+    for k,segment in enumerate(problem.missions.base.segments.values()):
+        assert(np.all(segment.state.unknowns.pack_array() == unknowns[k])), 'Carpet plot regression failed at segment test'
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup():
+
+    # the analysis fails in the cell at the top corner of the grid
+    return rosenbrock_setup(objective_scaling = 100., delay = 0.02, failure = (1.5, 1.5))
+
+# ----------------------------------------------------------------------
+#   Mission Problem
+# ----------------------------------------------------------------------
+
+def mission_problem():
+
+    nexus = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    #   [ tag       , initial, (lb,ub)         , scaling , units ]
+    problem.inputs = np.array([
+        [ 'speed'   ,  230.  , ( 225. , 235. ) ,   1.   , Units['m/s']],
+        [ 'distance',  4600. , ( 4500., 4700.) ,   1.   , Units.km],
+    ])
+
+    # [ tag, scaling, units ]
+    problem.objective = np.array([
+        [ 'landing_mass', 1., Units.kg ]
+    ])
+
+    # [ tag, sense, edge, scaling, units ]
+    problem.constraints = np.array([
+        [ 'landing_mass', '>', 0., 1., Units.kg],
+    ])
+
+    # [ 'alias' , ['data.path1.name','data.path2.name'] ]
+    problem.aliases = [
+        [ 'speed'        , 'missions.base.segments.cruise.air_speed' ],
+        [ 'distance'     , 'missions.base.segments.cruise.distance'  ],
+        [ 'landing_mass' , 'summary.landing_mass'                    ],
+    ]
+
+    # vehicle data
+    vehicle  = vehicle_setup()
+    configs  = mission_B737.configs_setup(vehicle)
+
+    # vehicle analyses
+    configs_analyses = mission_B737.analyses_setup(configs)
+    analyses = SUAVE.Analyses.Analysis.Container()
+    analyses.configs = configs_analyses
+
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    configs_analyses.finalize()
+
+    nexus.missions      = SUAVE.Analyses.Mission.Mission.Container()
+    nexus.missions.base = mission_B737.mission_setup(configs_analyses)
+    nexus.summary       = Data()
+
+    nexus.procedure = Process()
+    nexus.procedure.mission = fly_mission
+
+    # count the iterations of every segment
+    evaluations = Data()
+    evaluations.count = 0
+    def count_evaluations(segment,state):
+        evaluations.count += 1
+
+    for segment in nexus.missions.base.segments.values():
+        segment.process.iterate.residuals.count = count_evaluations
+
+    return nexus, evaluations
+
+def fly_mission(nexus):
+
+    results = nexus.missions.base.evaluate()
+
+    nexus.summary.landing_mass = results.segments[-1].conditions.weights.total_mass[-1,0]
+
+    return nexus
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Carpet plot test passed!'
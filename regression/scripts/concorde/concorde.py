@@ -60,7 +60,9 @@ def main():
 
     # These functions analyze the mission
     mission = analyses.missions.base
+    t0 = time.time()
     results = mission.evaluate()
+    print 'Concorde mission time: ' + str(time.time()-t0) + ' s'
     
     # load older results
     #save_results(results)
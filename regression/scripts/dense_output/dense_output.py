@@ -0,0 +1,121 @@
+# dense_output.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Core import Data
+
+import numpy as np
+
+import sys
+#import vehicle file
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    # the 737 mission, and the same mission with 33 points in every segment
+    results      = fly_mission(None)
+    results_fine = fly_mission(33)
+
+    # --------------------------------------------------------------------
+    # Each segment interpolated to the fine points
+    # --------------------------------------------------------------------
+
+    for segment, segment_fine in zip(results.segments.values(),results_fine.segments.values()):
+        time       = segment_fine.conditions.frames.inertial.time[:,0]
+        conditions = segment.interpolate(time=time)
+
+        for name in ['weights.total_mass','freestream.altitude','aerodynamics.lift_coefficient','propulsion.throttle']:
+            value      = eval('conditions.'+name)
+            value_fine = eval('segment_fine.conditions.'+name)
+            error      = np.max(np.abs(value-value_fine))/np.max(np.abs(value_fine))
+            assert(error<1e-6), 'Dense output regression failed at ' + name + ' in ' + segment.tag
+
+    # --------------------------------------------------------------------
+    # The whole mission
+    # --------------------------------------------------------------------
+
+    # the control points come back
+    time       = np.vstack([segment.conditions.frames.inertial.time for segment in results.segments.values()])[:,0]
+    mass       = np.vstack([segment.conditions.weights.total_mass for segment in results.segments.values()])[:,0]
+    conditions = results.interpolate(time=time)
+    assert(np.max(np.abs(conditions.weights.total_mass[:,0]-mass))<1e-6), 'Dense output regression failed at control point test'
+
+    # every 30 seconds, the first climb is at 6 m/s
+    time       = np.arange(0.,time[-1],30.)
+    conditions = results.interpolate(time=time)
+    altitude   = conditions.freestream.altitude[:,0]
+
+    print 'altitude every 30 s = ', altitude
+
+    assert(len(altitude)==len(time)), 'Dense output regression failed at mission test'
+    assert(np.all(np.isfinite(conditions.aerodynamics.lift_coefficient))), 'Dense output regression failed at mission test'
+
+    altitude_r = 1800.
+    assert(np.abs((altitude[10]-altitude_r)/altitude_r)<1e-6), 'Dense output regression failed at altitude test'
+
+    # by distance, which gives back the times of the distances
+    distance   = np.vstack([segment.conditions.frames.inertial.position_vector for segment in results_fine.segments.values()])[1:-1,0]
+    time_fine  = np.vstack([segment.conditions.frames.inertial.time for segment in results_fine.segments.values()])[1:-1,0]
+    conditions = results.interpolate(distance=distance)
+
+    assert(np.max(np.abs(conditions.frames.inertial.position_vector[:,0]-distance))<1e-3), 'Dense output regression failed at distance test'
+    assert(np.max(np.abs(conditions.frames.inertial.time[:,0]-time_fine))<1e-6), 'Dense output regression failed at distance time test'
+
+    # only inside the mission
+    try:
+        results.interpolate(time=[-1.])
+        raise AssertionError('Dense output regression failed at range test')
+    except ValueError:
+        pass
+
+    return
+
+# ----------------------------------------------------------------------
+#   Fly the Mission
+# ----------------------------------------------------------------------
+
+def fly_mission(number_control_points):
+
+    # vehicle data
+    vehicle  = vehicle_setup()
+    configs  = mission_B737.configs_setup(vehicle)
+
+    # vehicle analyses
+    configs_analyses = mission_B737.analyses_setup(configs)
+    analyses = SUAVE.Analyses.Analysis.Container()
+    analyses.configs = configs_analyses
+
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    configs_analyses.finalize()
+
+    mission = mission_B737.mission_setup(configs_analyses)
+
+    if number_control_points is not None:
+        for segment in mission.segments.values():
+            segment.state.numerics.number_control_points = number_control_points
+
+    results = mission.evaluate()
+
+    return results
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Dense output test passed!'
@@ -0,0 +1,116 @@
+# evaluation_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Optimization import Evaluation_Cache
+import SUAVE.Optimization.Package_Setups.scipy_setup as scipy_setup
+
+import numpy as np
+import os
+
+import sys
+sys.path.append('../Optimization_Problems')
+from Rosenbrock import rosenbrock_setup
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    filename = 'evaluation_cache.sqlite'
+    if os.path.exists(filename):
+        os.remove(filename)
+
+    # --------------------------------------------------------------------
+    # Optimize without and with the evaluation cache
+    # --------------------------------------------------------------------
+
+    plain  = setup()
+    x_plain = scipy_setup.SciPy_Solve(plain)
+
+    cached = setup()
+    cached.evaluation_cache = Evaluation_Cache()
+    cached.evaluation_cache.filename      = filename
+    cached.evaluation_cache.stored_values = ['summary.wing_weight']
+    x_cached = scipy_setup.SciPy_Solve(cached)
+
+    print 'Evaluations without the cache = ', plain.evaluation_count
+    print 'Evaluations with the cache    = ', cached.evaluation_count
+    print 'Optimum = ', x_cached
+
+    x_truth = np.array([0.6054802053567467, 0.36523105141971673])
+
+    assert(np.all(x_plain == x_cached))
+    assert(np.max(np.abs(x_cached-x_truth))<1e-6)
+    assert(cached.evaluation_count < plain.evaluation_count)
+    assert(cached.evaluation_count == cached.evaluation_cache.misses)
+
+    # --------------------------------------------------------------------
+    # Restart the optimization from the database
+    # --------------------------------------------------------------------
+
+    restart = setup()
+    restart.evaluation_cache = Evaluation_Cache()
+    restart.evaluation_cache.filename      = filename
+    restart.evaluation_cache.stored_values = ['summary.wing_weight']
+    x_restart = scipy_setup.SciPy_Solve(restart)
+
+    print 'Evaluations after the restart = ', restart.evaluation_count
+
+    assert(restart.evaluation_count == 0)
+    assert(np.all(x_restart == x_cached))
+
+    # the chosen summary values come back with the cached designs
+    assert(restart.summary.wing_weight == cached.summary.wing_weight)
+    assert(len(restart.evaluation_cache.stored_evaluations()) == cached.evaluation_count)
+
+    # --------------------------------------------------------------------
+    # The memory store keeps the most recently used designs
+    # --------------------------------------------------------------------
+
+    lru = setup()
+    lru.evaluation_cache = Evaluation_Cache()
+    lru.evaluation_cache.max_size = 2
+
+    # the last design is dropped when a third comes in, the first is kept by reusing it
+    for x in [[1.,1.],[0.5,0.5],[1.,1.],[0.2,0.3],[1.,1.],[0.5,0.5]]:
+        lru.objective(x)
+
+    assert(len(lru.evaluation_cache.evaluations) == 2)
+    assert(lru.evaluation_count == 4)
+    assert(lru.evaluation_cache.hits == 2)
+
+    os.remove(filename)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup():
+
+    nexus = rosenbrock_setup(radius = 0.5)
+    nexus.procedure.wing_weight = wing_weight
+
+    return nexus
+
+def wing_weight(nexus):
+
+    # an array value for the cache to store
+    nexus.summary.wing_weight = np.array([nexus.design.x1*nexus.design.x2])
+
+    return nexus
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Evaluation cache test passed!'
@@ -0,0 +1,129 @@
+# expected_improvement.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Optimization.Package_Setups import additive_setup
+from SUAVE.Methods.Utilities.latin_hypercube_sampling import latin_hypercube_sampling
+
+from sklearn import gaussian_process
+import numpy as np
+import time
+import sys
+import os
+
+sys.path.append('../Optimization_Problems')
+from Rosenbrock import rosenbrock_setup
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    np.random.seed(1)
+
+    problem = setup()
+    con     = problem.optimization_problem.constraints
+    lb      = np.array([-1.,-1.])
+    ub      = np.array([ 2., 2.])
+
+    # --------------------------------------------------------------------
+    # Additive corrections, as in Additive_Solve
+    # --------------------------------------------------------------------
+
+    x_samples = latin_hypercube_sampling(2,10,bounds=(lb,ub),criterion='center')
+    f = np.zeros([2,10])
+    g = np.zeros([2,10,1])
+    for level in [1,2]:
+        problem.fidelity_level = level
+        for ii,x in enumerate(x_samples):
+            f[level-1,ii]   = problem.objective(x)
+            g[level-1,ii,:] = problem.all_constraints(x)
+
+    f_surrogate = gaussian_process.GaussianProcessRegressor().fit(x_samples,f[1]-f[0])
+    g_surrogate = gaussian_process.GaussianProcessRegressor().fit(x_samples,g[1]-g[0])
+    fstar       = np.min(f[1])
+
+    problem.fidelity_level = 1
+
+    # --------------------------------------------------------------------
+    # The batch matches the one point function used by the optimizers
+    # --------------------------------------------------------------------
+
+    X = latin_hypercube_sampling(2,200,bounds=(lb,ub),criterion='random')
+
+    t0 = time.time()
+    sys.stdout = open(os.devnull,'w')
+    single = [additive_setup.evaluate_expected_improvement(x,problem,f_surrogate,g_surrogate,fstar,con) for x in X]
+    sys.stdout = sys.__stdout__
+    t1 = time.time()
+    EI, const, success = additive_setup.evaluate_expected_improvement_batch(X,problem,f_surrogate,g_surrogate,fstar,con)
+    t2 = time.time()
+
+    print 'Expected improvement of 200 points: one at a time ' + str(t1-t0) + ' s, batched ' + str(t2-t1) + ' s'
+
+    assert(np.all(success))
+    assert(np.max(np.abs(EI + np.array([s[0] for s in single]))) < 1e-12)
+    assert(np.max(np.abs(const[:,0] - np.array([s[1][0] for s in single]))) < 1e-12)
+
+    # the corrected '>' constraint x_sum > 0.4, scaled by 2, is negative when feasible
+    x_sum = (X[:,0] + X[:,1] + 0.1*X[:,0]*X[:,1])/2. + g_surrogate.predict(X)[:,0]
+    assert(np.max(np.abs(const[:,0] - (0.2 - x_sum))) < 1e-12)
+
+    # no uncertainty, the improvement is what is below fstar
+    EI_known = additive_setup.expected_improvement(np.array([1.,3.]),np.array([0.,0.]),2.)
+    assert(np.all(EI_known == np.array([1.,0.])))
+
+    # --------------------------------------------------------------------
+    # Maximum expected improvement
+    # --------------------------------------------------------------------
+
+    t0 = time.time()
+    EI_max, x_max = additive_setup.maximize_expected_improvement(problem,f_surrogate,g_surrogate,fstar,con,lb,ub,
+                                                                 num_candidates=2000,num_starts=3)
+    t1 = time.time()
+
+    print 'Maximum expected improvement ' + str(EI_max) + ' at ' + str(x_max) + ' in ' + str(t1-t0) + ' s'
+
+    # a dense grid of the feasible space
+    x0_grid, x1_grid = np.meshgrid(np.linspace(lb[0],ub[0],101),np.linspace(lb[1],ub[1],101))
+    X_grid = np.vstack((x0_grid.flatten(),x1_grid.flatten())).T
+    EI_grid, const_grid, success = additive_setup.evaluate_expected_improvement_batch(X_grid,problem,f_surrogate,
+                                                                                      g_surrogate,fstar,con)
+    EI_grid_max = np.max(EI_grid[const_grid[:,0] <= 0.])
+
+    print 'Best expected improvement on a 101x101 grid ' + str(EI_grid_max)
+
+    EI_check, const_check, success = additive_setup.evaluate_expected_improvement_batch(x_max,problem,f_surrogate,
+                                                                                        g_surrogate,fstar,con)
+
+    assert(EI_check[0] == EI_max)
+    assert(const_check[0,0] <= 0.)
+    assert(EI_max >= 0.999*EI_grid_max)
+    assert(np.all(x_max >= lb) and np.all(x_max <= ub))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup():
+
+    # [ tag, sense, edge, scaling, units ]
+    constraints = [[ 'x_sum' , '>', 0.4, 2., Units.less]]
+
+    return rosenbrock_setup(objective_scaling = 10., coefficient = 10., constraints = constraints, low_fidelity = True)
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Expected improvement test passed!'
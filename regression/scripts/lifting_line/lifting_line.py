@@ -1,7 +1,7 @@
 # lifting_line.py
 # 
 # Created:  Nov 2017, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 #
 
 # ----------------------------------------------------------------------
@@ -16,6 +16,7 @@ import numpy as np
 import copy, time
 import random
 from SUAVE.Attributes.Gases.Air import Air
+from SUAVE.Methods.Aerodynamics.Lifting_Line import lifting_line as LL
 import sys
 #import vehicle file
 sys.path.append('../Vehicles')
@@ -117,6 +118,33 @@ def main():
     #print lift_test
         
     assert(np.max(lift_test)<1e-4), 'Aero regression failed at compute lift test'    
+    
+    # --------------------------------------------------------------------
+    # Benchmark the factored solve against a single angle at a time
+    # --------------------------------------------------------------------
+    
+    wing     = vehicle.wings.main_wing
+    settings = aerodynamics.process.compute.lift.inviscid_wings.settings
+    
+    for n_points in [16,1000]:
+        konditions = Data()
+        konditions.aerodynamics = Data()
+        alphas = np.linspace(-.174,.174,n_points)[:,None]
+        
+        t0 = time.time()
+        konditions.aerodynamics.angle_of_attack = alphas
+        CL_all, CD_all = LL(konditions,settings,wing)
+        t1 = time.time()
+        
+        CL_one = np.zeros(n_points)
+        for i in xrange(n_points):
+            konditions.aerodynamics.angle_of_attack = alphas[i]
+            CL_one[i] = LL(konditions,settings,wing)[0]
+        t2 = time.time()
+        
+        print 'Lifting line, ' + str(n_points) + ' points: all at once ' + str(t1-t0) + ' s, one at a time ' + str(t2-t1) + ' s'
+        
+        assert(np.max(np.abs(CL_all-CL_one))<1e-10), 'Aero regression failed at lifting line vectorization test'
 
 if __name__ == '__main__':
 
@@ -0,0 +1,142 @@
+# mission_sweep.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Core import Data
+from SUAVE.Methods.Missions import mission_sweep
+
+import numpy as np
+
+import sys
+#import vehicle file
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    mission, evaluations = mission_setup()
+
+    # the cruise holds its altitude once it has been flown, so it is swept with the climb
+    altitude   = ['segments.climb_3.altitude_end','segments.cruise.altitude']
+    speed      = 'segments.cruise.air_speed'
+    outputs    = ['segments[-1].conditions.weights.total_mass[-1,0]']
+    altitudes  = np.array([10.668, 11.5, 12.5]) * Units.km
+
+    unknowns = deepcopy_unknowns(mission)
+    climb_end = mission.segments.climb_3.altitude_end
+    cruise    = mission.segments.cruise.altitude
+
+    # --------------------------------------------------------------------
+    # Each altitude from the defaults
+    # --------------------------------------------------------------------
+
+    landing_mass_cold = []
+    for value in altitudes:
+        sweep = mission_sweep(mission, altitude, [value], outputs)
+        landing_mass_cold.append(sweep.outputs[outputs[0]][0])
+    evaluations_cold  = evaluations.count
+    evaluations.count = 0
+
+    # --------------------------------------------------------------------
+    # All of them, started from each other
+    # --------------------------------------------------------------------
+
+    sweep        = mission_sweep(mission, altitude, altitudes, outputs)
+    landing_mass = sweep.outputs[outputs[0]]
+
+    print 'landing mass from the defaults    = ', landing_mass_cold, ' with ', evaluations_cold, ' segment iterations'
+    print 'landing mass from the last solves = ', landing_mass, ' with ', evaluations.count, ' segment iterations'
+
+    assert(np.all(sweep.converged)), 'Mission sweep regression failed at convergence test'
+    assert(sweep.solves == len(altitudes)), 'Mission sweep regression failed at solve count test'
+    assert(np.max(np.abs(landing_mass-landing_mass_cold)/landing_mass)<1e-6), 'Mission sweep regression failed at landing mass test'
+    assert(evaluations.count < evaluations_cold), 'Mission sweep regression failed at segment iteration test'
+
+    landing_mass_r = np.array([61201.53463759, 60762.47584669, 60123.79062398])
+    assert(np.max(np.abs(landing_mass-landing_mass_r)/landing_mass_r)<1e-6), 'Mission sweep regression failed at landing mass value test'
+
+    # the segments are left as they were
+    for tag,segment in mission.segments.items():
+        for key,unknown in segment.state.unknowns.items():
+            assert(np.all(unknown == unknowns[tag][key])), 'Mission sweep regression failed at segment test'
+
+    # and so are the swept parameters
+    assert(mission.segments.climb_3.altitude_end == climb_end), 'Mission sweep regression failed at parameter test'
+    assert(mission.segments.cruise.altitude == cruise), 'Mission sweep regression failed at parameter test'
+
+    # --------------------------------------------------------------------
+    # Past what the engines can do, the steps are cut back and then given up
+    # --------------------------------------------------------------------
+
+    sweep = mission_sweep(mission, speed, [290., 320.], outputs, minimum_step = 0.25)
+
+    print 'fast cruise converged = ', sweep.converged, ' in ', sweep.solves, ' solves'
+
+    assert(sweep.converged[0] and not sweep.converged[1]), 'Mission sweep regression failed at failure test'
+    assert(sweep.results[1] is None), 'Mission sweep regression failed at failure test'
+    assert(np.isnan(sweep.outputs[outputs[0]][1])), 'Mission sweep regression failed at failure test'
+    assert(sweep.solves > 2), 'Mission sweep regression failed at step cutting test'
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def mission_setup():
+
+    # vehicle data
+    vehicle  = vehicle_setup()
+    configs  = mission_B737.configs_setup(vehicle)
+
+    # vehicle analyses
+    configs_analyses = mission_B737.analyses_setup(configs)
+    analyses = SUAVE.Analyses.Analysis.Container()
+    analyses.configs = configs_analyses
+
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    configs_analyses.finalize()
+
+    mission = mission_B737.mission_setup(configs_analyses)
+
+    # count the iterations of every segment
+    evaluations = Data()
+    evaluations.count = 0
+    def count_evaluations(segment,state):
+        evaluations.count += 1
+
+    for segment in mission.segments.values():
+        segment.process.iterate.residuals.count = count_evaluations
+
+    return mission, evaluations
+
+def deepcopy_unknowns(mission):
+
+    unknowns = Data()
+    for tag,segment in mission.segments.items():
+        unknowns[tag] = Data()
+        for key,unknown in segment.state.unknowns.items():
+            unknowns[tag][key] = np.copy(unknown)
+
+    return unknowns
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Mission sweep test passed!'
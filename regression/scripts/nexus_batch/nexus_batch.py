@@ -0,0 +1,97 @@
+# nexus_batch.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+
+import numpy as np
+import time
+
+import sys
+sys.path.append('../Optimization_Problems')
+from Rosenbrock import rosenbrock_setup
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    # a sample over the design space, with a corner where the analysis fails
+    X = np.array([[x1,x2] for x1 in np.linspace(-1.,2.,5) for x2 in np.linspace(-1.,2.,4)])
+
+    # --------------------------------------------------------------------
+    # Evaluate one design at a time
+    # --------------------------------------------------------------------
+
+    nexus = setup()
+
+    objective   = np.zeros(len(X))
+    constraints = np.zeros((len(X),1))
+    failed      = []
+
+    t0 = time.time()
+    for ii,x in enumerate(X):
+        try:
+            objective[ii]   = nexus.objective(x)
+            constraints[ii] = nexus.all_constraints(x)
+        except ValueError:
+            failed.append(ii)
+    t1 = time.time()
+
+    # --------------------------------------------------------------------
+    # Evaluate the batch in this process and on worker processes
+    # --------------------------------------------------------------------
+
+    serial   = setup().evaluate_batch(X)
+    t2 = time.time()
+
+    nexus    = setup()
+    parallel = nexus.evaluate_batch(X,processes=4)
+    t3 = time.time()
+
+    print 'Evaluating ' + str(len(X)) + ' designs: one at a time ' + str(t1-t0) + ' s, batch ' + str(t2-t1) + \
+          ' s, batch on 4 processes ' + str(t3-t2) + ' s'
+
+    success = np.ones(len(X),dtype=bool)
+    success[failed] = False
+
+    assert(len(failed) == 2)
+    assert(np.all(serial.success == success))
+    assert(np.all(parallel.success == success))
+    assert(np.all(np.isnan(parallel.objective[failed])))
+    assert('ValueError' in parallel.errors[failed[0]])
+    assert(parallel.errors[0] is None)
+
+    # the designs come back in order, the same as one at a time
+    assert(np.all(serial.objective[success] == objective[success]))
+    assert(np.all(parallel.objective[success] == objective[success]))
+    assert(np.all(parallel.constraints[success] == constraints[success]))
+    assert(parallel.constraints.shape == (len(X),1))
+
+    # the runs made by the workers are counted
+    assert(nexus.evaluation_count == len(X))
+
+    assert(np.all(parallel.objective[[0,5]] == [404.,1.953125]))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup():
+
+    # the analysis fails in a corner of the design space
+    return rosenbrock_setup(radius = 0.5, delay = 0.02, failure = (1.5, 0.5))
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Nexus batch test passed!'
@@ -0,0 +1,140 @@
+# noise_footprint.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Core import Data
+
+import numpy as np
+import multiprocessing
+import time
+import sys
+
+from SUAVE.Methods.Geometry.Two_Dimensional.Planform import wing_planform
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_footprint
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_counterplot
+
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    config, analyses, segment = setup()
+
+    # --------------------------------------------------------------------
+    # Test a small grid against one microphone at a time
+    # --------------------------------------------------------------------
+
+    x_mic, y_mic = np.meshgrid(np.linspace(-6000.,0.,4),np.linspace(0.,1500.,3))
+
+    footprint = noise_airframe_footprint(config,analyses,segment,x_mic,y_mic)
+
+    EPNL  = np.zeros_like(x_mic)
+    SENEL = np.zeros_like(x_mic)
+    for i in xrange(x_mic.shape[0]):
+        for j in xrange(x_mic.shape[1]):
+            analyses.mic_array = [x_mic[i,j],0.,y_mic[i,j]]
+            noise_counterplot(segment,analyses,config)
+            EPNL[i,j],_,SENEL[i,j] = noise_airframe_Fink(config,analyses,segment)
+
+    print 'EPNL contour  = ', footprint.EPNL
+    print 'SENEL contour = ', footprint.SENEL
+
+    assert(footprint.EPNL.shape == x_mic.shape)
+    assert(np.max(np.abs(footprint.EPNL-EPNL))<1e-10)
+    assert(np.max(np.abs(footprint.SENEL-SENEL))<1e-10)
+
+    EPNL_truth  = np.array([[ 89.6344517485222 ,  90.95347425579574,  92.27268643678838,  96.93606367198952],
+                            [ 86.30748276534527,  93.2387890187057 ,  98.52323022897241,  97.3124435945222 ],
+                            [ 89.9801145624996 ,  93.03245419023587,  94.71097909235749,  92.2741492087666 ]])
+    SENEL_truth = np.array([[ 82.56480456450915,  84.46681400324417,  88.3161938963689 ,  89.48349621575969],
+                            [ 79.25242170720517,  85.61571004320473,  91.57144148811555,  90.81792840615785],
+                            [ 83.22403224784944,  86.14775516594138,  87.62028242490103,  85.3412681678489 ]])
+
+    assert(np.max(np.abs(footprint.EPNL-EPNL_truth))<1e-8)
+    assert(np.max(np.abs(footprint.SENEL-SENEL_truth))<1e-8)
+
+    # --------------------------------------------------------------------
+    # Benchmark a 10,000 microphone footprint
+    # --------------------------------------------------------------------
+
+    x_mic, y_mic = np.meshgrid(np.linspace(-2000.,8000.,100),np.linspace(-3000.,3000.,100))
+    processes    = multiprocessing.cpu_count()
+
+    t0 = time.time()
+    for i in xrange(10):
+        analyses.mic_array = [x_mic[0,i],0.,y_mic[0,i]]
+        noise_counterplot(segment,analyses,config)
+        noise_airframe_Fink(config,analyses,segment)
+    t1 = time.time()
+    footprint = noise_airframe_footprint(config,analyses,segment,x_mic,y_mic,processes=processes)
+    t2 = time.time()
+
+    print 'Footprint of ' + str(x_mic.size) + ' microphones: one at a time (estimated) ' + str((t1-t0)*x_mic.size/10.) + \
+          ' s, grid on ' + str(processes) + ' processes ' + str(t2-t1) + ' s'
+
+    # the worker processes give the same contours as a single process
+    x_mic, y_mic = x_mic[::10,::10], y_mic[::10,::10]
+    serial   = noise_airframe_footprint(config,analyses,segment,x_mic,y_mic)
+    parallel = noise_airframe_footprint(config,analyses,segment,x_mic,y_mic,processes=2,chunk_size=30)
+
+    assert(np.all(serial.EPNL==parallel.EPNL))
+    assert(np.all(serial.SENEL==parallel.SENEL))
+    assert(np.all(serial.EPNL==footprint.EPNL[::10,::10]))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup():
+
+    # the 737 in the landing configuration
+    config = vehicle_setup()
+    wing_planform(config.wings.main_wing)
+    config.wings.main_wing.flaps.angle = 30. * Units.deg
+    config.landing_gear.gear_condition = 'down'
+
+    analyses = Data()
+    analyses.atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+
+    # a constant speed 3 degree approach to the runway threshold
+    n_points = 40
+    velocity = 70. * Units['m/s']
+    x        = np.linspace(-7000.,0.,n_points)
+    altitude = 15. - x * np.tan(3. * Units.deg)
+
+    segment = Data()
+    segment.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    segment.conditions.expand_rows(n_points)
+
+    conditions = segment.conditions
+    conditions.frames.inertial.position_vector[:,0] = x
+    conditions.frames.inertial.position_vector[:,2] = -altitude
+    conditions.frames.inertial.time[:,0]            = (x - x[0]) / (velocity * np.cos(3. * Units.deg))
+    conditions.freestream.velocity[:,0]             = velocity
+    conditions.freestream.altitude[:,0]             = altitude
+
+    return config, analyses, segment
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Noise footprint test passed!'
@@ -0,0 +1,93 @@
+# noise_metrics.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+
+import numpy as np
+import time
+
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import pnl_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_tone_correction
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import epnl_noise
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    # A flyover history with a broadband hump, a passing tone and a fixed tone
+    SPL = flyover_spectra(121)
+
+    PNL  = pnl_noise(SPL)
+    TC   = noise_tone_correction(SPL)
+    EPNL = epnl_noise(PNL+TC)
+
+    steps = [0,30,60,90,120]
+
+    # Truth values
+    PNL_truth  = np.array([ 93.401403491189, 103.127045888122, 119.923808490878, 103.127045888122,  93.401403491189])
+    TC_truth   = np.array([0.193333333333, 0.193333333333, 1.702222222222, 0.193333333333, 0.193333333333])
+    EPNL_truth = 120.46005789186566
+
+    error = Data()
+    error.PNL  = np.max(np.abs(PNL[steps]-PNL_truth))
+    error.TC   = np.max(np.abs(TC[steps]-TC_truth))
+    error.EPNL = np.abs(EPNL-EPNL_truth)
+
+    print 'Errors:'
+    print error
+
+    for k,v in error.items():
+        assert(np.abs(v)<1e-9)
+
+    # Several signals are reduced at once when they are stacked as columns
+    PNLT = np.vstack([PNL+TC,PNL[::-1],np.zeros_like(PNL)]).T
+    EPNL_columns = epnl_noise(PNLT)
+
+    assert(np.abs(EPNL_columns[0]-EPNL)<1e-9)
+    assert(np.abs(EPNL_columns[1]-epnl_noise(PNL[::-1]))<1e-9)
+    assert(EPNL_columns[2]==0)
+
+    # --------------------------------------------------------------------
+    # Throughput
+    # --------------------------------------------------------------------
+
+    n_steps = 20000
+    SPL     = flyover_spectra(n_steps)
+
+    t0 = time.time()
+    PNLT = pnl_noise(SPL) + noise_tone_correction(SPL)
+    EPNL = epnl_noise(PNLT)
+    t1 = time.time()
+
+    print 'PNL, tone correction and EPNL of ' + str(n_steps) + ' spectra: ' + str(t1-t0) + ' s, ' + \
+          str(int(n_steps/(t1-t0))) + ' spectra per second'
+
+    return
+
+def flyover_spectra(n_steps):
+
+    time  = np.linspace(-30.,30.,n_steps)[:,None]
+    bands = np.arange(24)[None,:]
+    SPL   = 95. - 0.08*(bands-12.)**2 - 20.*np.log10(1.+(time/8.)**2) + \
+        6.*(bands==17)*np.exp(-(time/10.)**2) + 4.*(bands==6)
+
+    return SPL
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Noise metrics test passed!'
@@ -0,0 +1,94 @@
+# noise_trajectory.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+import time
+
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import flight_trajectory
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.flight_trajectory import engine_performance
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    vehicle  = vehicle_setup()
+    turbofan = vehicle.propulsors['turbofan']
+
+    analyses = Data()
+    analyses.atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+
+    # Truth values: number of steps, and the last altitude, distance, polar angle and core jet velocity
+    truth = Data()
+    truth.constant_flight = [121, 150.              , 2804.0149785619906, 0.05352026845931512 , 410.36944852936125]
+    truth.approach        = [101, 15.471733594306755, 1994.5781462287794, 0.007756972962916646, 404.98623291314044]
+    truth.flyover         = [177, 990.446630758857  , 1824.6921818826079, 0.5737698364263464  , 442.48486316958747]
+    truth.sideline        = [177, 990.446630758857  , 7199.648389198711 , 0.1516829049236044  , 442.48486316958747]
+
+    for case in ['constant_flight','approach','flyover','sideline']:
+
+        configs = Data()
+        configs.flight = Data()
+        configs.flight.initial_position = -2000.
+        configs.flight.initial_time     = 0.
+        configs.flight.velocity         = 80.
+        configs.flight.altitute         = 150.
+        configs.flight.angle_of_climb   = 8.
+        configs.flight.glide_slope      = 3.
+        configs.flight.approach         = 0
+        configs.flight.flyover          = 0
+        configs.flight.sideline         = 0
+        configs.flight.constant_flight  = 0
+        configs.flight[case]            = 1
+
+        t0 = time.time()
+        time_steps, altitude, dist, theta, phi, engine_data = flight_trajectory(configs,turbofan,analyses)
+        t1 = time.time()
+
+        # The same engine states one time step at a time
+        engine_stepped = np.array([engine_performance(h,configs.flight.velocity,turbofan,analyses) for h in altitude])[:,:,0].T
+        t2 = time.time()
+
+        print case + ': ' + str(len(time_steps)) + ' steps, trajectory ' + str(t1-t0) + ' s, engine one step at a time ' + str(t2-t1) + ' s'
+
+        results = [len(time_steps), altitude[-1], dist[-1], theta[-1], engine_data[0][-1]]
+        print results
+
+        error = Data()
+        error.steps    = results[0] - truth[case][0]
+        error.altitude = (results[1] - truth[case][1])/truth[case][1]
+        error.distance = (results[2] - truth[case][2])/truth[case][2]
+        error.theta    = (results[3] - truth[case][3])/truth[case][3]
+        error.engine   = (results[4] - truth[case][4])/truth[case][4]
+        error.batched  = np.max(np.abs(np.array(engine_data)-engine_stepped)/np.abs(engine_stepped))
+
+        print error
+
+        for k,v in error.items():
+            assert(np.abs(v)<1e-10)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Noise trajectory test passed!'
@@ -0,0 +1,129 @@
+# optimization_aliases.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Optimization import Nexus
+from SUAVE.Optimization import helper_functions as help_fun
+
+import numpy as np
+import time
+import sys
+
+sys.path.append('../Vehicles')
+from Embraer_190 import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    nexus = setup()
+    problem = nexus.optimization_problem
+
+    inputs  = problem.inputs
+    outputs = problem.objective
+    aliases = problem.aliases
+    n_vars  = len(inputs)
+
+    x = np.linspace(1.,2.,n_vars)
+
+    # --------------------------------------------------------------------
+    # Set and read back through the aliases
+    # --------------------------------------------------------------------
+
+    nexus.unpack_inputs(x)
+    values = help_fun.get_values(nexus,outputs,aliases,nexus.alias_accessors(outputs[:,0]))
+
+    assert(np.all(values == x*inputs[:,3]))
+
+    # every configuration under the wildcard is set
+    for config in nexus.vehicle_configurations:
+        assert(config.wings.main_wing.areas.reference == inputs[0,1])
+
+    # compiled and uncompiled give the same values
+    assert(np.all(values == help_fun.get_values(nexus,outputs,aliases)))
+
+    # --------------------------------------------------------------------
+    # Benchmark the setup and the cost per evaluation
+    # --------------------------------------------------------------------
+
+    n_evals = 20
+    converted_values = help_fun.convert_values(inputs)
+
+    t0 = time.time()
+    for i in xrange(n_evals):
+        help_fun.set_values(nexus,inputs,converted_values,aliases)
+        help_fun.get_values(nexus,outputs,aliases)
+    t1 = time.time()
+    input_accessors  = help_fun.compile_aliases(nexus,inputs[:,0],aliases)
+    output_accessors = help_fun.compile_aliases(nexus,outputs[:,0],aliases)
+    t2 = time.time()
+    for i in xrange(n_evals):
+        help_fun.set_values(nexus,inputs,converted_values,aliases,input_accessors)
+        help_fun.get_values(nexus,outputs,aliases,output_accessors)
+    t3 = time.time()
+
+    print str(n_vars) + ' variable problem:'
+    print '  resolving the aliases every evaluation  ' + str((t1-t0)/n_evals*1000.) + ' ms per evaluation'
+    print '  compiling the aliases once              ' + str((t2-t1)*1000.) + ' ms'
+    print '  compiled aliases                        ' + str((t3-t2)/n_evals*1000.) + ' ms per evaluation'
+
+    return
+
+# ----------------------------------------------------------------------
+#   Inputs, Objective, & Constraints
+# ----------------------------------------------------------------------
+
+def setup():
+
+    nexus = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    vehicle = vehicle_setup()
+    nexus.vehicle_configurations = configs_setup(vehicle)
+
+    # 50 numbers of the vehicle as design variables, each set in all the configurations
+    paths = ['wings.main_wing.areas.reference']
+    for path in sorted(numeric_paths(nexus.vehicle_configurations.base)):
+        if len(paths) == 50:
+            break
+        if path not in paths:
+            paths.append(path)
+
+    #   [ tag, initial, (lb,ub), scaling, units ]
+    problem.inputs    = np.array([ [ 'x%i' % i, 1., (0.,10.), 2., Units.less] for i in xrange(len(paths)) ])
+
+    # [ tag, scaling, units ]
+    problem.objective = np.array([ [ 'y%i' % i, 1., Units.less] for i in xrange(len(paths)) ])
+
+    # [ 'alias' , ['data.path1.name','data.path2.name'] ]
+    problem.aliases   = [ [ 'x%i' % i, 'vehicle_configurations.*.' + path ] for i,path in enumerate(paths) ] + \
+                        [ [ 'y%i' % i, 'vehicle_configurations.base.' + path ] for i,path in enumerate(paths) ]
+
+    return nexus
+
+def numeric_paths(data,prefix=''):
+
+    paths = []
+    for key,value in data.items():
+        if isinstance(value,dict):
+            paths.extend(numeric_paths(value,prefix+key+'.'))
+        elif isinstance(value,float):
+            paths.append(prefix+key)
+
+    return paths
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Optimization aliases test passed!'
@@ -0,0 +1,178 @@
+# optimization_history.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Optimization import write_optimization_outputs, read_optimization_outputs, convert_optimization_outputs
+from SUAVE.Sizing import Sizing_Loop, read_sizing_errors, convert_sizing_errors
+
+import numpy as np
+import time
+import sys
+import os
+
+sys.path.append('../Optimization_Problems')
+from Rosenbrock import rosenbrock_setup
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    filenames = ['history.txt', 'history.bin', 'converted.bin', 'y_err_values.txt', 'y_err_values.bin', 'y_err_converted.bin']
+    remove_files(filenames)
+
+    np.random.seed(0)
+
+    # ------------------------------------------------------------------
+    #   Evaluations written as text and as binary records
+    # ------------------------------------------------------------------
+
+    nexus = setup()
+    for x in np.random.rand(50,3)*2.:
+        nexus.objective(x)
+
+    problem = nexus.optimization_problem
+    text    = read_optimization_outputs('history.txt', problem.inputs, problem.constraints)
+    binary  = read_optimization_outputs('history.bin', problem.inputs, problem.constraints)
+
+    assert(len(binary[0]) == 50)
+    assert(np.all(binary[0] == np.arange(1,51)))
+    for text_values, binary_values in zip(text, binary):
+        assert(np.max(np.abs(text_values - binary_values)/(np.abs(binary_values) + 1e-3)) < 1e-10)
+
+    # the binary records hold the exact values
+    assert(np.all(binary[2][-1] == problem.inputs[:,1]/problem.inputs[:,3]))
+    assert(binary[1][-1] == nexus.objective()[0])
+
+    # an interrupted write leaves part of a record
+    file_out = open('history.bin', 'ab')
+    file_out.write('abc')
+    file_out.close()
+    assert(len(read_optimization_outputs('history.bin', problem.inputs, problem.constraints)[0]) == 50)
+
+    # the text file converted
+    convert_optimization_outputs('history.txt', 'converted.bin', problem.inputs, problem.constraints)
+    converted = read_optimization_outputs('converted.bin', problem.inputs, problem.constraints)
+    for text_values, converted_values in zip(text, converted):
+        assert(np.all(text_values == converted_values))
+
+    # ------------------------------------------------------------------
+    #   Write and read times of a long history
+    # ------------------------------------------------------------------
+
+    remove_files(filenames)
+
+    times = []
+    for filename in ['history.txt', 'history.bin']:
+        t0 = time.time()
+        for k in range(5000):
+            write_optimization_outputs(nexus, filename)
+        t1 = time.time()
+        outputs = read_optimization_outputs(filename, problem.inputs, problem.constraints)
+        t2 = time.time()
+        times.append((t1-t0, t2-t1))
+        assert(len(outputs[0]) == 5000)
+
+    print 'Writing 5000 evaluations: text ', times[0][0], ' s, binary ', times[1][0], ' s'
+    print 'Reading 5000 evaluations: text ', times[0][1], ' s, binary ', times[1][1], ' s'
+    print 'File sizes: text ', os.path.getsize('history.txt'), ' bytes, binary ', os.path.getsize('history.bin'), ' bytes'
+
+    # ------------------------------------------------------------------
+    #   Sizing loop errors
+    # ------------------------------------------------------------------
+
+    sizing_loop = Sizing_Loop()
+    sizing_loop.tolerance          = 1E-8
+    sizing_loop.initial_step       = 'Default'
+    sizing_loop.update_method      = 'successive_substitution'
+    sizing_loop.default_y          = np.array([1., 1.])
+    sizing_loop.default_scaling    = np.array([1., 1.])
+    sizing_loop.sizing_evaluation  = sizing_evaluation
+    sizing_loop.maximum_iterations = 100
+    sizing_loop.error_filename     = 'y_err_values.bin'
+
+    sizing_nexus = Data()
+    sizing_nexus.optimization_problem       = None
+    sizing_nexus.total_number_of_iterations = 0
+    sizing_nexus.sizing_loop                = sizing_loop
+    sizing_nexus.results                    = Data()
+
+    sys.stdout = open(os.devnull,'w')
+    sizing_loop(sizing_nexus)
+    sys.stdout = sys.__stdout__
+
+    iterations, errors = read_sizing_errors('y_err_values.bin')
+
+    print 'Sizing iterations = ', len(iterations)
+
+    assert(np.all(iterations == np.arange(1,sizing_nexus.number_of_iterations+1)))
+    assert(np.max(np.abs(errors[-1])) < 1E-8 and np.max(np.abs(errors[-2])) > 1E-8)
+
+    # the text format of earlier versions
+    file_out = open('y_err_values.txt', 'ab')
+    for iteration, error in zip(iterations, errors):
+        file_out.write(str(int(iteration)) + ', ' + str(error.tolist()) + '\n')
+    file_out.close()
+
+    convert_sizing_errors('y_err_values.txt', 'y_err_converted.bin')
+    converted_iterations, converted_errors = read_sizing_errors('y_err_converted.bin')
+
+    assert(np.all(converted_iterations == iterations))
+    assert(np.max(np.abs(converted_errors - errors)/np.abs(errors)) < 1e-10)
+
+    remove_files(filenames)
+
+    return
+
+def remove_files(filenames):
+
+    for filename in filenames:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+def sizing_evaluation(y, nexus, scaling):
+
+    y_out = np.array([1. + 0.5*y[1], 2. + 0.25*y[0]])
+    f     = (y_out - y)/y
+
+    return f, y_out
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup():
+
+    # [ tag, sense, edge, scaling, units ]
+    constraints = [[ 'radius_margin' , '>', 0., 1., Units.less],
+                   [ 'x_sum'         , '<', 4., 3., Units.less]]
+
+    nexus = rosenbrock_setup(number_of_inputs = 3, bounds = (0., 2.), input_scaling = [1., 2., 1.],
+                             objective_scaling = 10., constraints = constraints)
+    nexus.total_number_of_iterations = 0
+    nexus.procedure.history          = history
+
+    return nexus
+
+def history(nexus):
+
+    nexus.total_number_of_iterations += 1
+
+    write_optimization_outputs(nexus, 'history.txt')
+    write_optimization_outputs(nexus, 'history.bin')
+
+    return nexus
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Optimization history test passed!'
@@ -0,0 +1,130 @@
+# optimized_climb.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Core import Data
+from SUAVE.Methods.Missions.Segments.optimize import get_gradients
+
+import numpy as np
+
+import sys
+#import vehicle file
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    # fly the climb with SLSQP finding each gradient on its own
+    results_fd, evaluations_fd, segment_fd = fly_climb('finite_difference')
+
+    # fly the climb with all the gradients from one colored sweep
+    results, evaluations, segment = fly_climb('colored_finite_difference')
+
+    climb_time    = results.conditions.frames.inertial.time[-1,0]
+    climb_mass    = results.conditions.weights.total_mass[-1,0]
+    climb_time_fd = results_fd.conditions.frames.inertial.time[-1,0]
+    climb_mass_fd = results_fd.conditions.weights.total_mass[-1,0]
+
+    print 'finite difference missions flown         = ', evaluations_fd
+    print 'colored finite difference missions flown = ', evaluations
+    print 'climb time = ', climb_time
+    print 'climb mass = ', climb_mass
+    print 'jacobian colors = ', results.jacobian_colors
+
+    # Both ways find the same climb
+    assert(np.abs((climb_time-climb_time_fd)/climb_time_fd)<1e-6), 'Optimized climb regression failed at gradient test'
+    assert(np.abs((climb_mass-climb_mass_fd)/climb_mass_fd)<1e-6), 'Optimized climb regression failed at gradient test'
+
+    # With far fewer missions
+    assert(evaluations < evaluations_fd/2), 'Optimized climb regression failed at evaluation count test'
+
+    # The unknowns that only change their own control point share a color
+    assert(np.max(results.jacobian_colors)+1 < len(results.jacobian_colors)), 'Optimized climb regression failed at coloring test'
+
+    # At the answer, away from the seed, the colored gradients are the ones from stepping each unknown on its own
+    unknowns = results.unknowns.pack_array()
+    results.gradients_last = None
+    results.gradient_sweeps = 1
+    colored = get_gradients(unknowns,(segment,results))
+    full    = get_gradients(unknowns,(segment,results),full_sweep=True)
+
+    for gradient_colored,gradient_full in zip(colored,full):
+        error = np.max(np.abs(gradient_colored-gradient_full))/np.max(np.abs(gradient_full))
+        assert(error<1e-6), 'Optimized climb regression failed at colored gradient test'
+
+    climb_time_r = 202.8233007
+    climb_mass_r = 78615.02948
+
+    assert(np.abs((climb_time-climb_time_r)/climb_time_r)<1e-6), 'Optimized climb regression failed at climb time test'
+    assert(np.abs((climb_mass-climb_mass_r)/climb_mass_r)<1e-6), 'Optimized climb regression failed at climb mass test'
+
+    return
+
+# ----------------------------------------------------------------------
+#   Fly the Climb
+# ----------------------------------------------------------------------
+
+def fly_climb(gradient_method):
+
+    # vehicle data
+    vehicle  = vehicle_setup()
+    configs  = mission_B737.configs_setup(vehicle)
+
+    # vehicle analyses
+    configs_analyses = mission_B737.analyses_setup(configs)
+    analyses = SUAVE.Analyses.Analysis.Container()
+    analyses.configs = configs_analyses
+
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    configs_analyses.finalize()
+
+    # a minimum time climb
+    mission = SUAVE.Analyses.Mission.Sequential_Segments()
+    mission.atmosphere = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
+    mission.planet     = SUAVE.Attributes.Planets.Earth()
+
+    segment = SUAVE.Analyses.Mission.Segments.Climb.Optimized()
+    segment.tag = 'climb'
+    segment.analyses.extend(configs_analyses.base)
+
+    segment.altitude_start  = 0.0   * Units.km
+    segment.altitude_end    = 3.0   * Units.km
+    segment.air_speed_start = 130.  * Units.knots
+    segment.air_speed_end   = 200.  * Units.knots
+    segment.objective       = 'conditions.frames.inertial.time[-1,0]*1000'
+    segment.gradient_method = gradient_method
+    segment.state.numerics.number_control_points = 4
+
+    # count the missions flown
+    evaluations = Data()
+    evaluations.count = 0
+    def count_evaluations(segment,state):
+        evaluations.count += 1
+    segment.process.iterate.outputs.count = count_evaluations
+
+    mission.append_segment(segment)
+
+    results = mission.evaluate()
+
+    return results.segments.climb, evaluations.count, segment
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Optimized climb test passed!'
@@ -0,0 +1,192 @@
+# process_plan.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Analyses import Process
+
+import numpy as np
+import copy
+import time
+
+import sys
+#import vehicle file
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+from Boeing_737 import vehicle_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    # --------------------------------------------------------------------
+    # A process laid out as the iterate process of a segment, with trivial steps
+    # --------------------------------------------------------------------
+
+    process = trivial_process()
+
+    state_nested = Data()
+    state_nested.calls = []
+    state_flat   = Data()
+    state_flat.calls = []
+
+    process.evaluate(None,state_nested)
+    process.execute(None,state_flat)
+
+    plan = process.compile()
+
+    assert(len(plan) == 16), 'Process plan regression failed at flattening test'
+    assert(state_flat.calls == state_nested.calls), 'Process plan regression failed at order test'
+
+    # a process with its own evaluate is one step
+    process.conditions.weights = Process_Twice()
+    process.conditions.weights.mass = step('mass')
+
+    state_nested.calls = []
+    state_flat.calls   = []
+    process.evaluate(None,state_nested)
+    process.execute(None,state_flat)
+
+    assert(len(process.compile()) == 17), 'Process plan regression failed at evaluate test'
+    assert(state_flat.calls == state_nested.calls), 'Process plan regression failed at evaluate order test'
+    assert(state_flat.calls.count('mass') == 2), 'Process plan regression failed at evaluate call test'
+
+    # --------------------------------------------------------------------
+    # Changing a nested process makes the plan out of date
+    # --------------------------------------------------------------------
+
+    process.compile()
+    process.residuals.extra = step('extra')
+
+    state_flat.calls = []
+    process.execute(None,state_flat)
+    assert(state_flat.calls[-1] == 'extra'), 'Process plan regression failed at added step test'
+
+    del process.residuals.extra
+    process.unknowns.clear()
+
+    state_flat.calls = []
+    process.execute(None,state_flat)
+    assert('extra' not in state_flat.calls), 'Process plan regression failed at deleted step test'
+    assert(len(state_flat.calls) == 14), 'Process plan regression failed at cleared process test'
+
+    # a copy runs the same steps
+    process_copy = copy.deepcopy(process)
+
+    state_nested.calls = []
+    state_flat.calls   = []
+    process.evaluate(None,state_nested)
+    process_copy.execute(None,state_flat)
+    assert(state_flat.calls == state_nested.calls), 'Process plan regression failed at copy test'
+
+    # --------------------------------------------------------------------
+    # Overhead of a pass through the trivial process
+    # --------------------------------------------------------------------
+
+    process = trivial_process(record=False)
+    number  = 5000
+
+    t0 = time.time()
+    for i in xrange(number):
+        process.evaluate(None,None)
+    t1 = time.time()
+    for i in xrange(number):
+        process.execute(None,None)
+    t2 = time.time()
+
+    time_nested = (t1-t0)/number
+    time_flat   = (t2-t1)/number
+
+    print 'nested process overhead = ', time_nested*1e6, ' us per iteration'
+    print 'flat plan overhead      = ', time_flat*1e6, ' us per iteration'
+    print 'speed up                = ', time_nested/time_flat
+
+    assert(time_flat < time_nested), 'Process plan regression failed at overhead test'
+
+    # --------------------------------------------------------------------
+    # The segments of the 737 mission give the same residuals either way
+    # --------------------------------------------------------------------
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+
+    mission = analyses.missions.base
+    results = mission.evaluate()
+
+    for tag,segment in mission.segments.items():
+        state_nested = copy.deepcopy(results.segments[tag])
+        state_flat   = copy.deepcopy(results.segments[tag])
+
+        segment.process.iterate.evaluate(segment,state_nested)
+        segment.process.iterate.execute(segment,state_flat)
+
+        residuals_nested = state_nested.residuals.pack_array()
+        residuals_flat   = state_flat.residuals.pack_array()
+
+        assert(np.all(residuals_flat == residuals_nested)), 'Process plan regression failed at mission test'
+
+    landing_mass   = results.segments[-1].conditions.weights.total_mass[-1,0]
+    landing_mass_r = 61201.53463759
+
+    print 'landing mass = ', landing_mass
+
+    assert(np.abs(landing_mass-landing_mass_r)/landing_mass_r < 1e-6), 'Process plan regression failed at landing mass test'
+
+    return
+
+# ----------------------------------------------------------------------
+#   Trivial Process
+# ----------------------------------------------------------------------
+
+def trivial_process(record=True):
+
+    process = Process()
+    process.unknowns   = Process()
+    process.initials   = Process()
+    process.conditions = Process()
+    process.residuals  = Process()
+
+    for group in process.keys():
+        for i in range(4):
+            tag = group + '_' + str(i)
+            if record:
+                process[group][tag] = step(tag)
+            else:
+                process[group][tag] = empty_step
+
+    return process
+
+def step(tag):
+
+    def record_step(segment,state):
+        state.calls.append(tag)
+
+    return record_step
+
+def empty_step(segment,state):
+    pass
+
+class Process_Twice(Process):
+    """ Runs its steps twice """
+
+    def evaluate(self,*args,**kwarg):
+        Process.evaluate(self,*args,**kwarg)
+        return Process.evaluate(self,*args,**kwarg)
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Process plan test passed!'
@@ -16,6 +16,7 @@ Data, Container,
 import numpy as np
 import copy, time
 from SUAVE.Methods.Propulsion import propeller_design
+from SUAVE.Components.Energy.Converters.Propeller import spin_propellers
 
 def main():
     
@@ -79,6 +80,110 @@ def main():
     
     for k,v in error.items():
         assert(np.abs(v)<0.001)
+        
+    # --------------------------------------------------------------------
+    # Batched evaluation of mixed propellers
+    # --------------------------------------------------------------------
+    
+    # A second propeller with a different number of blade stations
+    prop_attributes_2 = copy.deepcopy(prop_attributes)
+    stations_1 = np.linspace(0.,1.,len(prop_attributes.chord_distribution))
+    stations_2 = np.linspace(0.,1.,13)
+    prop_attributes_2.number_blades      = 3.0
+    prop_attributes_2.tip_radius         = 1.2
+    prop_attributes_2.chord_distribution = np.interp(stations_2,stations_1,prop_attributes.chord_distribution)
+    prop_attributes_2.twist_distribution = np.interp(stations_2,stations_1,prop_attributes.twist_distribution)
+    
+    prop_2                 = SUAVE.Components.Energy.Converters.Propeller()
+    prop_2.prop_attributes = prop_attributes_2
+    prop_2.inputs.omega    = 0.8*prop.inputs.omega
+    prop_2.thrust_angle    = 5. * Units.deg
+    
+    conditions_2 = copy.deepcopy(conditions)
+    
+    F_2, Q_2, P_2, Cplast_2 = prop_2.spin(conditions_2)
+    
+    F_b, Q_b, P_b, Cplast_b = spin_propellers([prop,prop_2],[conditions,conditions_2])
+    
+    error = Data()
+    error.Thrust   = np.max(np.abs(F_b[0]-F))
+    error.Thrust_2 = np.max(np.abs(F_b[1]-F_2))
+    error.Power    = np.max(np.abs(P_b[0]-P))
+    error.Power_2  = np.max(np.abs(P_b[1]-P_2))
+    
+    print 'Batched Errors:'
+    print  error
+    
+    for k,v in error.items():
+        assert(np.abs(v)<1e-8)
+        
+    # --------------------------------------------------------------------
+    # Benchmark the batched evaluation over a set of control points
+    # --------------------------------------------------------------------    
+    
+    n_points = 16
+    konditions = copy.deepcopy(conditions)
+    konditions.freestream.density           = conditions.freestream.density * np.ones((n_points,1))
+    konditions.freestream.dynamic_viscosity = conditions.freestream.dynamic_viscosity * np.ones((n_points,1))
+    konditions.freestream.speed_of_sound    = conditions.freestream.speed_of_sound * np.ones((n_points,1))
+    konditions.freestream.temperature       = conditions.freestream.temperature * np.ones((n_points,1))
+    konditions.frames.inertial.velocity_vector   = np.array([[V,0,0]]) * np.linspace(0.5,1.,n_points)[:,None]
+    konditions.propulsion.throttle               = np.ones((n_points,1))
+    konditions.frames.body.transform_to_inertial = np.tile(np.eye(3),(n_points,1,1))
+    
+    for n_rotors in [1,4,16]:
+        props = []
+        for i in xrange(n_rotors):
+            rotor = copy.deepcopy(prop)
+            rotor.inputs.omega = prop.inputs.omega * np.linspace(0.9,1.1,n_points)[:,None] * (1. + 0.01*i)
+            props.append(rotor)
+            
+        t0 = time.time()
+        for rotor in props:
+            rotor.spin(konditions)
+        t1 = time.time()
+        spin_propellers(props,konditions)
+        t2 = time.time()
+        
+        print str(n_rotors) + ' rotors: one at a time ' + str(t1-t0) + ' s, batched ' + str(t2-t1) + ' s'
+        
+    # --------------------------------------------------------------------
+    # Performance map
+    # --------------------------------------------------------------------
+    
+    t0 = time.time()
+    performance_map = prop.build_performance_map(np.linspace(0.2,0.7,11),
+                                                 np.linspace(1500.,2100.,5),
+                                                 np.linspace(0.,2000.,3))
+    t1 = time.time()
+    
+    print 'Performance map build time: ' + str(t1-t0) + ' s'
+    print 'Performance map errors at the cell centers:'
+    print performance_map.errors
+    
+    konditions.freestream.altitude = np.linspace(0.,1500.,n_points)[:,None]
+    konditions.freestream.update(atmosphere.compute_values(konditions.freestream.altitude))
+    prop.inputs.omega = prop_attributes.angular_velocity * np.linspace(0.8,1.0,n_points)[:,None]
+    
+    errors = prop.check_performance_map(konditions)
+    
+    print 'Performance map errors against direct solves:'
+    print errors
+    
+    for k,v in errors.items():
+        assert(np.abs(v)<0.01)
+    
+    t0 = time.time()
+    F, Q, P, Cplast = prop.spin(konditions)
+    t1 = time.time()
+    prop.use_performance_map = True
+    F_map, Q_map, P_map, Cplast_map = prop.spin(konditions)
+    t2 = time.time()
+    prop.use_performance_map = False
+    
+    print 'Direct spin ' + str(t1-t0) + ' s, performance map ' + str(t2-t1) + ' s'
+    
+    assert(np.max(np.abs(F_map-F)/np.max(F))<0.01)
      
     return
 
@@ -0,0 +1,236 @@
+# sizing_database.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Sizing import Sizing_Loop, Sizing_Database, read_sizing_inputs, write_sizing_outputs
+from SUAVE.Optimization.Nexus import Nexus
+
+from sklearn import neighbors, ensemble
+import numpy as np
+import time
+import sys
+import os
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    np.random.seed(0)
+    remove_files()
+
+    # ------------------------------------------------------------------
+    #   Nearest neighbors across KD-tree rebuilds
+    # ------------------------------------------------------------------
+
+    database = Sizing_Database()
+    database.filename = 'sizing_database.bin'
+    database.load(3, 2)
+
+    inputs  = np.random.rand(200,3)
+    outputs = np.random.rand(200,2)
+    queries = np.random.rand(20,3)
+
+    for k in range(len(inputs)):
+        database.append(inputs[k], outputs[k])
+        if k in [0, 31, 33, 100, 199]:
+            for x in queries:
+                distances, indices = database.nearest(x, 4)
+                brute = np.linalg.norm(inputs[:k+1] - x, axis = 1)
+                assert(np.all(indices == np.argsort(brute, kind = 'mergesort')[:4]))
+                assert(np.max(np.abs(distances - np.sort(brute)[:4])) < 1e-14)
+
+    # the same guesses as sklearn
+    for weights in ['uniform', 'distance']:
+        regr = neighbors.KNeighborsRegressor(n_neighbors = 5, weights = weights).fit(inputs, outputs)
+        y    = np.array([database.neighbors_prediction(x, 5, weights == 'distance') for x in queries])
+        assert(np.max(np.abs(y - regr.predict(queries))) < 1e-12)
+
+    # ------------------------------------------------------------------
+    #   The binary file
+    # ------------------------------------------------------------------
+
+    # an interrupted write leaves part of a record
+    file_out = open(database.filename, 'ab')
+    np.array([1., 2.]).tofile(file_out)
+    file_out.close()
+
+    reloaded = Sizing_Database()
+    reloaded.filename = database.filename
+    reloaded.load(3, 2)
+
+    assert(reloaded.size == 200)
+    assert(np.all(reloaded.inputs[:200] == inputs) and np.all(reloaded.outputs[:200] == outputs))
+
+    # text outputs written before there was a binary file
+    remove_files()
+    text_loop = Data()
+    text_loop.output_filename = 'sizing_database.txt'
+    for k in range(10):
+        write_sizing_outputs(text_loop, outputs[k], inputs[k].tolist())
+
+    database = Sizing_Database()
+    database.filename = 'sizing_database.bin'
+    database.load(3, 2, 'sizing_database.txt')
+
+    assert(database.size == 10 and os.path.exists('sizing_database.bin'))
+    assert(np.max(np.abs(database.inputs[:10] - inputs[:10])) < 1e-12)
+
+    # the binary file is rebuilt when the text outputs change, and removed with them
+    for k in range(10,15):
+        write_sizing_outputs(text_loop, outputs[k], inputs[k].tolist())
+    binary_time = os.path.getmtime('sizing_database.bin')
+    os.utime('sizing_database.txt', (binary_time + 1., binary_time + 1.))
+
+    database = Sizing_Database()
+    database.filename = 'sizing_database.bin'
+    database.load(3, 2, 'sizing_database.txt')
+
+    assert(database.size == 15)
+
+    os.remove('sizing_database.txt')
+    database = Sizing_Database()
+    database.filename = 'sizing_database.bin'
+    database.load(3, 2, 'sizing_database.txt')
+
+    assert(database.size == 0 and not os.path.exists('sizing_database.bin'))
+
+    # ------------------------------------------------------------------
+    #   Initial guesses of the sizing loop over an optimization
+    # ------------------------------------------------------------------
+
+    remove_files()
+
+    designs = np.random.rand(300,2)
+
+    default_evaluations, default_time, default_y = run_designs(designs, 'Default')
+    remove_files()
+    neighbor_evaluations, neighbor_time, neighbor_y = run_designs(designs, 'Neighbors')
+
+    print 'Sizing evaluations: default start ', default_evaluations, ', nearest neighbors ', neighbor_evaluations
+    print 'Sizing loop time: default start ', default_time, ' s, nearest neighbors ', neighbor_time, ' s'
+
+    y_true = 2.*(1. + 2.*designs[:,0] + designs[:,1]**2)
+
+    assert(neighbor_evaluations < 0.8*default_evaluations)
+    assert(np.max(np.abs(default_y - y_true)/y_true) < 1e-5)
+    assert(np.max(np.abs(neighbor_y - y_true)/y_true) < 1e-5)
+
+    # a whole database read and fit for one guess, as before the database was kept in memory
+    sizing_loop = Data()
+    sizing_loop.output_filename = 'sizing_database.txt'
+    sizing_loop.default_y       = np.ones(1)
+    t0 = time.time()
+    data_inputs, data_outputs, read_success = read_sizing_inputs(sizing_loop, designs[0])
+    regr = neighbors.KNeighborsRegressor(n_neighbors = 3).fit(data_inputs, data_outputs[:,0])
+    regr.predict(designs[:1])
+    t1 = time.time()
+    database = Sizing_Database()
+    database.filename = 'sizing_database.bin'
+    database.load(2, 1)
+    t2 = time.time()
+    database.neighbors_prediction(designs[0], 3)
+    t3 = time.time()
+
+    print 'Guess from ', len(data_inputs), ' designs: read and fit ', t1-t0, ' s, in memory ', t3-t2, ' s'
+
+    assert(database.size == len(data_inputs))
+
+    # regressors are first fit at 4 designs, then refit every 5 new designs
+    remove_files()
+    forest_evaluations, forest_time, forest_y = run_designs(designs[:40], 'RandomForest')
+
+    print 'Random forest fits for 40 designs: ', forest_y.number_of_fits
+
+    assert(forest_y.number_of_fits == 8)
+
+    remove_files()
+
+    return
+
+def run_designs(designs, initial_step):
+
+    nexus = setup(initial_step)
+
+    sys.stdout = open(os.devnull,'w')
+    t0 = time.time()
+    y = []
+    for design in designs:
+        nexus.optimization_problem.inputs[:,1] = design
+        nexus.sizing_loop(nexus)
+        y.append(nexus.sizing_variables[0])
+    t1 = time.time()
+    sys.stdout = sys.__stdout__
+
+    if initial_step == 'RandomForest':
+        return nexus.number_of_sizing_evaluations, t1-t0, nexus.sizing_loop.database
+
+    return nexus.number_of_sizing_evaluations, t1-t0, np.array(y)
+
+def remove_files():
+
+    for filename in ['sizing_database.txt', 'sizing_database.bin']:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup(initial_step):
+
+    nexus = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+
+    #   [ tag , initial, (lb,ub)    , scaling , units ]
+    problem.inputs = np.array([
+        [ 'x1',  0.5   , ( 0. , 1. ) ,   1.   , Units.less],
+        [ 'x2',  0.5   , ( 0. , 1. ) ,   1.   , Units.less],
+    ])
+
+    nexus.total_number_of_iterations   = 0
+    nexus.number_of_sizing_evaluations = 0
+
+    sizing_loop = Sizing_Loop()
+    sizing_loop.tolerance                                 = 1E-6
+    sizing_loop.initial_step                              = initial_step
+    sizing_loop.update_method                             = 'successive_substitution'
+    sizing_loop.default_y                                 = np.array([1.])
+    sizing_loop.default_scaling                           = np.array([1.])
+    sizing_loop.sizing_evaluation                         = sizing_evaluation
+    sizing_loop.maximum_iterations                        = 100
+    sizing_loop.output_filename                           = 'sizing_database.txt'
+    sizing_loop.iteration_options.n_neighbors             = 3
+    sizing_loop.iteration_options.neighbors_weighted_distance = True
+    sizing_loop.iteration_options.min_surrogate_step      = 0.
+    sizing_loop.iteration_options.min_write_step          = 0.
+    nexus.sizing_loop = sizing_loop
+
+    return nexus
+
+def sizing_evaluation(y, nexus, scaling):
+
+    x1, x2 = nexus.optimization_problem.inputs[:,1]
+    nexus.number_of_sizing_evaluations += 1
+
+    # a takeoff mass that grows with the structure it carries
+    mass_out = 1. + 2.*x1 + x2**2 + 0.5*y[0]
+    f        = np.array([(mass_out - y[0])/y[0]])
+    y_out    = np.array([mass_out])
+
+    return f, y_out
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Sizing database test passed!'
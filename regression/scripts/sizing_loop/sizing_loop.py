@@ -1,7 +1,7 @@
 # sizing_loop.py
 #
 # Created:  Jun 2015, SUAVE Team
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 """ setup file for a sizing loop with a 737-aircraft
 """
@@ -28,7 +28,7 @@ from SUAVE.Methods.Geometry.Two_Dimensional.Planform import wing_planform
 from SUAVE.Methods.Propulsion.turbofan_sizing import turbofan_sizing
 from SUAVE.Methods.Aerodynamics.Fidelity_Zero.Lift.compute_max_lift_coeff import compute_max_lift_coeff
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Propulsion.compute_turbofan_geometry import compute_turbofan_geometry
-from SUAVE.Sizing.Sizing_Loop import Sizing_Loop
+from SUAVE.Sizing.Sizing_Loop import Sizing_Loop, Finite_Difference_Gradient
 from SUAVE.Optimization.Nexus import Nexus
 #from SUAVE.Optimization.write_optimization_outputs import write_optimization_outputs
 
@@ -67,6 +67,46 @@ def main():
     print 'error = ', error
     assert(error<1e-5), 'sizing loop regression failed'    
     
+    # ------------------------------------------------------------------
+    #   Newton-Raphson sizing of a wing area sweep, as in an optimization
+    # ------------------------------------------------------------------
+    
+    sizing_loop = nexus.sizing_loop
+    sizing_loop.tolerance                                    = 1E-5
+    sizing_loop.update_method                                = 'newton-raphson'
+    sizing_loop.sizing_evaluation                            = counted_sizing_evaluation
+    sizing_loop.iteration_options.max_newton_raphson_tolerance = 1E-6
+    nexus.number_of_sizing_evaluations                       = 0
+    
+    t0 = time.time()
+    errors = []
+    for area in [124.862, 127.]:
+        for config in nexus.vehicle_configurations:
+            config.wings.main_wing.areas.reference = area
+        sizing_loop(nexus)
+        errors.append(nexus.sizing_loop.max_error)
+    t1 = time.time()
+    
+    # the Jacobian of the first design is kept for the second
+    evaluations      = nexus.number_of_sizing_evaluations
+    evaluations_true = 11
+    print 'sizing evaluations = ', evaluations, ' in ', t1-t0, ' s'
+    print 'errors = ', errors
+    assert(evaluations == evaluations_true), 'sizing loop Jacobian reuse regression failed'
+    assert(np.max(np.abs(errors))<1E-5), 'sizing loop Newton-Raphson regression failed'
+    
+    # ------------------------------------------------------------------
+    #   Finite difference columns on worker processes
+    # ------------------------------------------------------------------
+    
+    x = np.array([1., 2., 3.])
+    f, y_out = analytic_residual(x, None, None)
+    J_serial, iter_serial     = Finite_Difference_Gradient(x, f, analytic_residual, None, None, 0, 1E-6)
+    J_parallel, iter_parallel = Finite_Difference_Gradient(x, f, analytic_residual, None, None, 0, 1E-6, processes = 3)
+    
+    assert(np.all(J_serial == J_parallel)), 'parallel finite difference regression failed'
+    assert(iter_serial == 3 and iter_parallel == 3)
+    
     #output=nexus._really_evaluate() #run; use optimization setup without inputs
     return
     
@@ -281,6 +321,15 @@ def simple_sizing(nexus):
     return nexus
     
     
+def counted_sizing_evaluation(y,nexus, scaling):
+    nexus.number_of_sizing_evaluations += 1
+    return sizing_evaluation(y,nexus, scaling)
+    
+def analytic_residual(y,nexus, scaling):
+    f     = np.array([y[0]*y[1]-2., y[1]**2-y[2], np.sin(y[2])])
+    y_out = y-f
+    return f, y_out
+    
 def sizing_evaluation(y,nexus, scaling):
     #unpack inputs
     m_guess           = y[0]*scaling[0]    
@@ -0,0 +1,125 @@
+# surrogate_sampling.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Optimization import Surrogate_Optimization, write_optimization_outputs, read_optimization_outputs
+from SUAVE.Surrogate.svr_surrogate_functions import build_svr_models
+
+import numpy as np
+import time
+import os
+
+import sys
+sys.path.append('../Optimization_Problems')
+from Rosenbrock import rosenbrock_setup
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    serial_file   = 'surrogate_serial.txt'
+    parallel_file = 'surrogate_parallel.txt'
+    for filename in [serial_file,parallel_file]:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+    # --------------------------------------------------------------------
+    # Sample the problem one point at a time and on worker processes
+    # --------------------------------------------------------------------
+
+    serial = surrogate_setup(serial_file)
+    t0 = time.time()
+    serial.build_surrogate()
+    t1 = time.time()
+
+    parallel = surrogate_setup(parallel_file)
+    parallel.processes = 4
+    t2 = time.time()
+    parallel.build_surrogate()
+    t3 = time.time()
+
+    print 'Sampling ' + str(serial.number_of_points) + ' points: serial ' + str(t1-t0) + ' s, 4 processes ' + str(t3-t2) + ' s'
+
+    problem = serial.problem.optimization_problem
+    _, obj_serial, inputs_serial, con_serial = read_optimization_outputs(serial_file, problem.inputs, problem.constraints)
+    _, obj_parallel, inputs_parallel, con_parallel = read_optimization_outputs(parallel_file, problem.inputs, problem.constraints)
+
+    # the workers write as they finish, so compare the points in sample order
+    order_serial   = np.lexsort(inputs_serial.T)
+    order_parallel = np.lexsort(inputs_parallel.T)
+
+    assert(len(obj_parallel) == serial.number_of_points)
+    assert(np.all(inputs_serial[order_serial] == inputs_parallel[order_parallel]))
+    assert(np.all(obj_serial[order_serial] == obj_parallel[order_parallel]))
+    assert(np.all(con_serial[order_serial] == con_parallel[order_parallel]))
+
+    # the sample trains a surrogate directly
+    obj_surrogate, constraints_surrogates, surrogate_function = build_svr_models(obj_parallel, inputs_parallel, con_parallel)
+    f = obj_surrogate.predict(np.array([[1.,1.]]))[0]
+
+    print 'surrogate objective at (1,1) = ', f
+
+    assert(np.abs(f) < 1.)
+
+    for filename in [serial_file,parallel_file]:
+        os.remove(filename)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Surrogate Setup
+# ----------------------------------------------------------------------
+
+def surrogate_setup(filename):
+
+    surrogate = Surrogate_Optimization()
+    surrogate.problem               = setup(filename)
+    surrogate.sample_plan           = latin_hypercube
+    surrogate.optimization_filename = filename
+    surrogate.number_of_points      = 40
+    surrogate.surrogate_model       = 'SVR'
+
+    return surrogate
+
+def latin_hypercube(bounds,npoints):
+
+    random = np.random.RandomState(0)
+    sample = np.zeros((npoints,len(bounds)))
+    for i,(lb,ub) in enumerate(bounds):
+        sample[:,i] = lb + (ub-lb)*(random.permutation(npoints) + random.rand(npoints))/npoints
+
+    return sample
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup(filename):
+
+    nexus = rosenbrock_setup(objective_scaling = 100., delay = 0.02)
+    nexus.total_number_of_iterations = 0
+    nexus.optimization_filename      = filename
+    nexus.procedure.write            = write_outputs
+
+    return nexus
+
+def write_outputs(nexus):
+
+    nexus.total_number_of_iterations += 1
+    write_optimization_outputs(nexus, nexus.optimization_filename)
+
+    return nexus
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Surrogate sampling test passed!'
@@ -0,0 +1,100 @@
+# trust_region_levels.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+#
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Optimization.Package_Setups.TRMM.Trust_Region_Optimization import Trust_Region_Optimization
+from SUAVE.Optimization.Package_Setups.TRMM.Trust_Region import Trust_Region
+
+import numpy as np
+import time
+
+import sys
+sys.path.append('../Optimization_Problems')
+from Rosenbrock import rosenbrock_setup
+
+# ----------------------------------------------------------------------
+#   main
+# ----------------------------------------------------------------------
+def main():
+
+    x = np.array([0.3, 0.7, 1.1, -0.4])
+
+    # ------------------------------------------------------------------
+    #   Both fidelity levels and their finite differences at the center
+    # ------------------------------------------------------------------
+
+    serial_problem = setup()
+    serial_opt     = Trust_Region_Optimization()
+    t0 = time.time()
+    serial = serial_opt.evaluate_levels(serial_problem, x)
+    t1 = time.time()
+
+    parallel_problem = setup()
+    parallel_opt     = Trust_Region_Optimization()
+    parallel_opt.processes = 4
+    t2 = time.time()
+    parallel = parallel_opt.evaluate_levels(parallel_problem, x)
+    t3 = time.time()
+
+    print 'Fidelity levels with derivatives: serial ' + str(t1-t0) + ' s, 4 processes ' + str(t3-t2) + ' s'
+
+    # the same values, bit for bit
+    for level in serial_opt.evaluation_order:
+        for serial_value, parallel_value in zip(serial[level], parallel[level]):
+            assert(np.shape(serial_value) == np.shape(parallel_value))
+            assert(np.all(serial_value == parallel_value))
+
+    assert(serial_problem.evaluation_count == parallel_problem.evaluation_count == 2*(len(x)+1))
+
+    # the additive corrections built from them
+    tr = Trust_Region()
+    f  = [serial[1][0], serial[2][0]]
+    df = [serial[1][1], serial[2][1]]
+    g  = [serial[1][2], serial[2][2]]
+    dg = [serial[1][3], serial[2][3]]
+    A, b = serial_opt.calculate_correction(f, df, g, dg, tr)
+
+    f  = [parallel[1][0], parallel[2][0]]
+    df = [parallel[1][1], parallel[2][1]]
+    g  = [parallel[1][2], parallel[2][2]]
+    dg = [parallel[1][3], parallel[2][3]]
+    A_parallel, b_parallel = parallel_opt.calculate_correction(f, df, g, dg, tr)
+
+    assert(np.all(A == A_parallel) and np.all(b == b_parallel))
+
+    # the high fidelity derivatives are right
+    df_true = np.array([2.*(x[0]-1.) - 400.*x[0]*(x[1]-x[0]**2),
+                        200.*(x[1]-x[0]**2) - 400.*x[1]*(x[2]-x[1]**2),
+                        200.*(x[2]-x[1]**2) - 400.*x[2]*(x[3]-x[2]**2),
+                        200.*(x[3]-x[2]**2)])/10.
+    assert(np.max(np.abs(serial[2][1] - df_true)) < 1e-3)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup():
+
+    # [ tag, sense, edge, scaling, units ]
+    constraints = [[ 'radius_margin' , '>', 0., 1., Units.less],
+                   [ 'x_sum'         , '<', 2., 1., Units.less]]
+
+    return rosenbrock_setup(number_of_inputs = 4, initial = [0.3, 0.7, 1.1, -0.4], bounds = (-2., 2.),
+                            objective_scaling = 10., radius = 4., constraints = constraints, delay = 0.05,
+                            low_fidelity = True)
+
+if __name__ == '__main__':
+
+    main()
+
+    print 'Trust region fidelity levels test passed!'
@@ -2,7 +2,7 @@
 # AERODAS.py
 # 
 # Created:  Feb 2016, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,7 +12,6 @@ import numpy as np
 from SUAVE.Analyses.Aerodynamics.Markup import Markup
 from SUAVE.Core import Data, Units
 from SUAVE.Analyses import Process
-from SUAVE.Analyses.Aerodynamics.Process_Geometry import Process_Geometry
 from SUAVE.Methods.Aerodynamics import AERODAS as Methods
 from SUAVE.Methods.Aerodynamics.Common import Fidelity_Zero as Common
 
@@ -53,15 +52,19 @@ class AERODAS(Markup):
         settings = self.settings
         settings.section_zero_lift_angle_of_attack = 0.0 * Units.deg
         settings.section_lift_curve_slope          = 2.0 * np.pi
+        settings.drag_coefficient_increment        = 0.0000
+        settings.maximum_lift_coefficient          = np.inf
+        
+        # stacked wing constants, built by initialize
+        settings.wing_properties                   = None
 
         # build the evaluation process
         compute = self.process.compute
         
         compute.setup_data = Methods.AERODAS_setup.setup_data
     
-        # Get all of the coefficients for AERODAS wings
+        # Get all of the coefficients for AERODAS wings, every wing is evaluated at once
         compute.wings_coefficients = Process()
-        compute.wings_coefficients = Process_Geometry('wings')
         compute.wings_coefficients.section_properties  = Methods.section_properties.section_properties
         compute.wings_coefficients.finite_aspect_ratio = Methods.finite_aspect_ratio.finite_aspect_ratio
         compute.wings_coefficients.pre_stall           = Methods.pre_stall_coefficients.pre_stall_coefficients
@@ -80,8 +83,27 @@ class AERODAS(Markup):
         compute.drag = Process()
         compute.drag.total                             = Methods.AERODAS_setup.drag_total
         
-        def initialize(self):
-            self.process.compute.lift.inviscid_wings.geometry = self.geometry
-            self.process.compute.lift.inviscid_wings.initialize()
-            
-        finalize = initialize   
\ No newline at end of file
+
+    def initialize(self):
+        """Stacks the geometry dependent constants of every wing so they are
+        not recomputed on each evaluation.
+
+        Assumptions:
+        The geometry does not change after initialization
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.geometry
+        self.settings
+        """  
+        self.settings.wing_properties = Methods.AERODAS_setup.wing_properties(self.settings,self.geometry)
+        
+    finalize = initialize
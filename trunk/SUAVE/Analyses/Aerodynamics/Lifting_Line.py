@@ -2,7 +2,7 @@
 # Lifting_Line.py
 # 
 # Created:  Aug 2017, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -181,31 +181,24 @@ class Lifting_Line(Aerodynamics):
         training = self.training
         
         AoA = training.angle_of_attack
-        CL  = np.zeros_like(AoA)
-        
-        wing_CLs = Data.fromkeys(geometry.wings.keys(), np.zeros_like(AoA))
-        # The above performs the function of:
-        #wing_CLs = Data() 
-        #for wing in geometry.wings.values():
-        #    wing_CLs[wing.tag] = np.zeros_like(AoA)
 
         # condition input, local, do not keep
         konditions              = Data()
         konditions.aerodynamics = Data()
 
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
-            
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
-            
-            # these functions are inherited from Aerodynamics() or overridden
-            CL[i], wing_lifts = calculate_lift_lifting_line(konditions, settings, geometry)
-            for wing in geometry.wings.values():
-                wing_CLs[wing.tag][i] = wing_lifts[wing.tag]
+        # calculate aerodynamics for the whole table at once, the lifting line
+        # factors each wing once and solves every angle of attack together
+        konditions.aerodynamics.angle_of_attack = np.atleast_2d(AoA).T
+        
+        # these functions are inherited from Aerodynamics() or overridden
+        CL, wing_lifts = calculate_lift_lifting_line(konditions, settings, geometry)
+        
+        wing_CLs = Data()
+        for wing in geometry.wings.values():
+            wing_CLs[wing.tag] = wing_lifts[wing.tag] * np.ones_like(AoA)
 
         # store training data
-        training.lift_coefficient = CL
+        training.lift_coefficient = CL * np.ones_like(AoA)
         training.wing_lift_coefficients = wing_CLs
 
         return
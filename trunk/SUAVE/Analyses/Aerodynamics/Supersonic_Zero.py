@@ -69,6 +69,9 @@ class Supersonic_Zero(Markup):
         settings.oswald_efficiency_factor           = None
         settings.maximum_lift_coefficient           = np.inf 
         
+        # geometry dependent Mach 1.05 wave drag, built on the first evaluation
+        settings.wave_drag_reference                = None
+        
         # vortex lattice configurations
         settings.number_panels_spanwise = 5
         settings.number_panels_chordwise = 1
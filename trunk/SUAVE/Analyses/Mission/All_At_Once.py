@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -61,7 +62,7 @@ class All_At_Once(Mission):
         # --------------------------------------------------------------
         #   Converge
         # --------------------------------------------------------------
-        self.process.converge.converge_root         = Methods.Segments.converge_root
+        self.process.converge.converge_root         = Methods.Segments.converge_block_sparse
         
         # --------------------------------------------------------------
         #   Iterate
@@ -2,7 +2,7 @@
 # Optimized.py
 #
 # Created:  Mar 2016, E. Botero 
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -20,6 +20,8 @@ from SUAVE.Analyses import Process
 from SUAVE.Core import Units
 import SUAVE
 
+import numpy as np
+
 # ----------------------------------------------------------------------
 #  Segment
 # ----------------------------------------------------------------------
@@ -75,6 +77,10 @@ class Optimized(Aerodynamic):
         self.CL_limit        = 1.e20 
         self.seed_climb_rate = 100. * Units['feet/min']
         self.algorithm       = 'SLSQP'
+        self.gradient_method = 'colored_finite_difference' # or 'finite_difference' to let SLSQP find each gradient
+        self.gradient_step   = np.sqrt(np.finfo(float).eps)
+        self.gradient_full_sweep_interval = 10 # colored sweeps between sweeps that step each unknown on its own
+        self.gradient_restarts            = 2  # times SLSQP is run again when the sparsity grows at its answer
         
         
         # --------------------------------------------------------------
@@ -93,6 +99,11 @@ class Optimized(Aerodynamic):
         self.state.inputs_last                = None
         self.state.objective_value            = 0.0
         self.state.constraint_values          = 0.0
+        self.state.gradients_last             = None
+        self.state.gradients                  = None
+        self.state.jacobian_sparsity          = None
+        self.state.jacobian_colors            = None
+        self.state.gradient_sweeps            = 0
          
         # --------------------------------------------------------------
         #   The Solving Process
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -57,6 +58,13 @@ class Numerics(Conditions):
         self.tolerance_boundary_conditions    = 1e-8  
         self.converged                        = None
         
+        # Adaptive refinement: solve with number_control_points, then solve again with about twice as many
+        # points until the Chebyshev coefficients of the unknowns fall below the tolerance
+        self.adaptive_refinement              = False
+        self.tolerance_interpolation          = 1e-3
+        self.maximum_control_points           = 33
+        self.interpolation_error              = None
+        
         self.dimensionless = Conditions()
         self.dimensionless.control_points = np.empty([0,0])
         self.dimensionless.differentiate  = np.empty([0,0])
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,6 +11,7 @@
 
 # python imports
 import numpy as np
+from collections import OrderedDict
 
 # SUAVE imports
 from Conditions import Conditions
@@ -20,6 +22,7 @@ from Numerics   import Numerics
 import SUAVE
 from SUAVE.Core.Arrays import array_type
 from SUAVE.Core import DataOrdered
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, chebyshev_interpolation
 
 # ----------------------------------------------------------------------
 #  State
@@ -100,6 +103,46 @@ class State(Conditions):
             #: if type
         #: for each key,value        
         
+    def interpolate(self,time=None,distance=None):
+        """ Interpolates the conditions of a solved segment to any times, or any distances, in the segment. All the
+            condition arrays are interpolated together with one barycentric Chebyshev interpolation matrix, so the
+            segment does not have to be solved again with more control points.
+    
+            Assumptions:
+            The distance is the inertial x position, and it increases through the segment
+            Segments that do not use chebyshev_data are interpolated linearly
+    
+            Source:
+            Berrut, J. P., and Trefethen, L. N., "Barycentric Lagrange Interpolation", SIAM Review, 2004
+    
+            Inputs:
+            time      [s]       or
+            distance  [m]
+    
+            Outputs:
+            conditions [Conditions()] one row per time or distance
+    
+            Properties Used:
+            None
+        """           
+        
+        if distance is not None:
+            x = dimensionless_distance(self,distance)
+        else:
+            t  = self.conditions.frames.inertial.time[:,0]
+            dt = t[-1] - t[0]
+            if dt == 0.:
+                dt = 1.
+            x = (np.array(time,dtype=float).flatten() - t[0])/dt
+            
+        P = interpolation_matrix(self.numerics,x)
+        
+        # all the arrays at once
+        paths, arrays = flatten_conditions(self.conditions,len(P[0,:]))
+        values        = np.dot(P,np.hstack(arrays))
+        columns       = np.cumsum([0] + [len(array[0,:]) for array in arrays])
+        
+        return build_conditions(paths,[values[:,columns[i]:columns[i+1]] for i in xrange(len(paths))])
         
 ## @ingroup Analyses-Mission-Segments-Conditions        
 class Container(State):
@@ -152,6 +195,63 @@ class Container(State):
                     state_out[key] = state_out[key].do_recursive(append_array,sub_state[key])
             
         return state_out
+    
+    def interpolate(self,time=None,distance=None):
+        """ Interpolates the conditions of a solved mission to any times, or any distances, in the mission. Each time
+            or distance is interpolated in the segment it falls in. A condition that some segments do not have is
+            nan in them.
+    
+            Assumptions:
+            The times and distances are in the range of the mission
+            A point on the boundary of two segments is in the earlier segment
+    
+            Source:
+            N/A
+    
+            Inputs:
+            time      [s]       or
+            distance  [m]
+    
+            Outputs:
+            conditions [Conditions()] one row per time or distance
+    
+            Properties Used:
+            None
+        """              
+        
+        if distance is not None:
+            points = np.array(distance,dtype=float).flatten()
+            ends   = np.array([sub_state.conditions.frames.inertial.position_vector[[0,-1],0] for sub_state in self.segments.values()])
+        else:
+            points = np.array(time,dtype=float).flatten()
+            ends   = np.array([sub_state.conditions.frames.inertial.time[[0,-1],0] for sub_state in self.segments.values()])
+            
+        if np.any(points < ends[0,0]) or np.any(points > ends[-1,1]):
+            raise ValueError('interpolation points are outside of the mission')
+        
+        # the first segment that reaches each point
+        segment_index = np.minimum(np.searchsorted(ends[:,1],points),len(ends)-1)
+        
+        rows    = len(points)
+        outputs = OrderedDict()
+        for i,sub_state in enumerate(self.segments.values()):
+            index = np.where(segment_index==i)[0]
+            if len(index) == 0:
+                continue
+            
+            if distance is not None:
+                sub_conditions = sub_state.interpolate(distance=points[index])
+            else:
+                sub_conditions = sub_state.interpolate(time=points[index])
+                
+            paths, arrays = flatten_conditions(sub_conditions,len(index))
+            for path, array in zip(paths,arrays):
+                if not path in outputs:
+                    outputs[path] = np.nan * np.ones((rows,len(array[0,:])))
+                if len(outputs[path][0,:]) == len(array[0,:]):
+                    outputs[path][index,:] = array
+        
+        return build_conditions(outputs.keys(),outputs.values())
         
 State.Container = Container
 
@@ -178,4 +278,163 @@ def append_array(A,B=None):
     if isinstance(A,array_type) and isinstance(B,array_type):
         return np.vstack([A,B])
     else:
-        return None
\ No newline at end of file
+        return None
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def interpolation_matrix(numerics,x):
+    """ Makes the matrix that interpolates the control points of a segment to dimensionless points. Segments on
+        chebyshev_data use barycentric interpolation, others are interpolated linearly between control points.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        numerics.number_control_points [int]
+        numerics.discretization_method [function]
+        x                              [array]
+
+        Outputs:
+        P                              [array]
+
+        Properties Used:
+        None
+    """    
+    
+    N = numerics.number_control_points
+    
+    if numerics.discretization_method is chebyshev_data:
+        return chebyshev_interpolation(N,x)
+    
+    if N == 1:
+        return np.ones((len(x),1))
+    
+    nodes = numerics.discretization_method(N,integration=False)[0]
+    P     = np.zeros((len(x),N))
+    right = np.clip(np.searchsorted(nodes,x),1,N-1)
+    left  = right - 1
+    w     = (x - nodes[left])/(nodes[right] - nodes[left])
+    
+    P[np.arange(len(x)),left]  = 1. - w
+    P[np.arange(len(x)),right] = w
+    
+    return P
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def dimensionless_distance(state,distance):
+    """ Finds the dimensionless points of a segment at distances. A fine grid of the interpolated distance gives a
+        first guess that a few Newton steps on the Chebyshev derivative of the distance polish.
+
+        Assumptions:
+        The distance increases through the segment
+
+        Source:
+        N/A
+
+        Inputs:
+        state.conditions.frames.inertial.position_vector [m]
+        distance                                         [m]
+
+        Outputs:
+        x                                                [array]
+
+        Properties Used:
+        None
+    """    
+    
+    numerics = state.numerics
+    N        = numerics.number_control_points
+    d        = state.conditions.frames.inertial.position_vector[:,0]
+    distance = np.array(distance,dtype=float).flatten()
+    
+    if N == 1 or d[-1] == d[0]:
+        return np.zeros(len(distance))
+    
+    x_grid = np.linspace(0.,1.,10*N+1)
+    d_grid = np.dot(interpolation_matrix(numerics,x_grid),d)
+    x      = np.interp(distance,d_grid,x_grid)
+    
+    if numerics.discretization_method is chebyshev_data:
+        D = chebyshev_data(N,integration=False)[1]
+        dd_dx = np.dot(D,d)
+        for i in xrange(3):
+            P     = chebyshev_interpolation(N,x)
+            slope = np.dot(P,dd_dx)
+            slope[slope==0.] = np.inf
+            x     = np.clip(x - (np.dot(P,d) - distance)/slope,0.,1.)
+    
+    return x
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def flatten_conditions(conditions,rows):
+    """ Lists the arrays of a conditions structure that have a number of rows, with the path to each
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        conditions [Conditions()]
+        rows       [int]
+
+        Outputs:
+        paths      [list of tuples]
+        arrays     [list of arrays]
+
+        Properties Used:
+        None
+    """    
+    
+    paths  = []
+    arrays = []
+    
+    for k,v in conditions.iteritems():
+        if isinstance(v,Conditions):
+            sub_paths, sub_arrays = flatten_conditions(v,rows)
+            paths  = paths  + [(k,) + path for path in sub_paths]
+            arrays = arrays + sub_arrays
+        elif isinstance(v,array_type) and np.ndim(v) == 2 and len(v) == rows:
+            paths.append((k,))
+            arrays.append(v)
+            
+    return paths, arrays
+
+## @ingroup Analyses-Mission-Segments-Conditions
+def build_conditions(paths,arrays):
+    """ Puts arrays into a new conditions structure at their paths, the reverse of flatten_conditions
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        paths      [list of tuples]
+        arrays     [list of arrays]
+
+        Outputs:
+        conditions [Conditions()]
+
+        Properties Used:
+        None
+    """    
+    
+    conditions = Conditions()
+    
+    for path, array in zip(paths,arrays):
+        data = conditions
+        for key in path[:-1]:
+            if not data.has_key(key):
+                data[key] = Conditions()
+            data = data[key]
+        data[path[-1]] = array
+        
+    conditions._size = len(arrays[0]) if len(arrays) else 1
+        
+    return conditions
+
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Sep 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -86,6 +87,11 @@ class Segment(Analysis):
             None
         """         
         self.process.initialize(self,state)
+        
+        # the iterate steps do not change from here on, flatten them for the solver
+        if isinstance(self.process.get('iterate',None),Process):
+            self.process.iterate.compile()
+        
         return
     
     def converge(self,state):
@@ -126,7 +132,7 @@ class Segment(Analysis):
             Properties Used:
             None
         """        
-        self.process.iterate(self,state)
+        self.process.iterate.execute(self,state)
         return
     
     def finalize(self,state):
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -29,6 +30,10 @@ class Process(ContainerOrdered):
     
     verbose = False
     
+    # counts the changes to every process, a compiled plan is
+    # only used while this is the value it was compiled at
+    _version = 0
+    
     def evaluate(self,*args,**kwarg):
         """This is used to execute the evaluate functions of the analyses
             stored in the container.
@@ -93,5 +98,142 @@ class Process(ContainerOrdered):
                 Properties Used:
                 N/A
             """                        
-        return self.evaluate(*args,**kwarg) 
+        return self.evaluate(*args,**kwarg)
+
+    def compile(self):
+        """Flattens this process and the processes nested in it into a tuple of
+            the callables they run, in order. The plan is kept until a process is
+            changed.
+        
+                Assumptions:
+                Nested processes that are verbose or that have their own evaluate
+                are kept as one step. The results of the steps are not kept.
+        
+                Source:
+                N/A
+        
+                Inputs:
+                None
+        
+                Outputs:
+                plan     [tuple of callables]
+        
+                Properties Used:
+                N/A
+            """
+        
+        plan = []
+        
+        for step in self.itervalues():
+            
+            if isinstance(step,Process) and not step.verbose and \
+               type(step).evaluate.im_func is Process.evaluate.im_func:
+                plan.extend(step.compile())
+            elif hasattr(step,'evaluate'):
+                plan.append(step.evaluate)
+            else:
+                plan.append(step)
+        
+        plan = tuple(plan)
+        
+        # kept outside of the ordered items, so it is not copied or pickled
+        dict.__setitem__(self,'_plan',(Process._version,plan))
+        
+        return plan
     
+    def execute(self,*args,**kwarg):
+        """This runs the steps of the process as evaluate does, from the compiled
+            plan, without collecting their results.
+        
+                Assumptions:
+                None
+        
+                Source:
+                N/A
+        
+                Inputs:
+                None
+        
+                Outputs:
+                None
+        
+                Properties Used:
+                N/A
+            """
+        
+        if self.verbose:
+            self.evaluate(*args,**kwarg)
+            return
+        
+        version, plan = dict.get(self,'_plan',(None,None))
+        if version != Process._version:
+            plan = self.compile()
+        
+        for step in plan:
+            step(*args,**kwarg)
+        
+        return
+    
+    def __setattr__(self,key,value):
+        """Sets an item, and makes the compiled plans out of date.
+        
+                Assumptions:
+                None
+        
+                Source:
+                N/A
+        
+                Inputs:
+                key      [str]
+                value
+        
+                Outputs:
+                None
+        
+                Properties Used:
+                N/A
+            """
+        Process._version += 1
+        ContainerOrdered.__setattr__(self,key,value)
+        
+    def __delattr__(self,key):
+        """Deletes an item, and makes the compiled plans out of date.
+        
+                Assumptions:
+                None
+        
+                Source:
+                N/A
+        
+                Inputs:
+                key      [str]
+        
+                Outputs:
+                None
+        
+                Properties Used:
+                N/A
+            """
+        Process._version += 1
+        ContainerOrdered.__delattr__(self,key)
+        
+    def clear(self):
+        """Empties the process, and makes the compiled plans out of date.
+        
+                Assumptions:
+                None
+        
+                Source:
+                N/A
+        
+                Inputs:
+                None
+        
+                Outputs:
+                None
+        
+                Properties Used:
+                N/A
+            """
+        Process._version += 1
+        ContainerOrdered.clear(self)
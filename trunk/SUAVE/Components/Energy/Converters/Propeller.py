@@ -3,16 +3,19 @@
 #
 # Created:  Jun 2014, E. Botero
 # Modified: Jan 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 # package imports
+import SUAVE
 import numpy as np
 from SUAVE.Components.Energy.Energy_Component import Energy_Component
 from SUAVE.Core import Data
 import scipy.optimize as opt
+from scipy.interpolate import RegularGridInterpolator
 
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import angles_to_dcms, orientation_product, orientation_transpose
@@ -58,6 +61,8 @@ class Propeller(Energy_Component):
         self.prop_attributes.chord_distribution = 0.0
         self.prop_attributes.mid_chord_aligment = 0.0
         self.thrust_angle                       = 0.0
+        self.use_performance_map                = False
+        self.performance_map                    = None
         
     def spin(self,conditions):
         """Analyzes a propeller given geometry and operating conditions.
@@ -110,204 +115,601 @@ class Propeller(Energy_Component):
           chord_distribution         [m]
           mid_chord_aligment         [m] (distance from the mid chord to the line axis out of the center of the blade)
         self.thrust_angle            [radians]
+        self.use_performance_map     [Boolean] (interpolate the performance map instead of solving)
         """         
+        
+        if self.use_performance_map:
+            return self.evaluate_performance_map(conditions)
            
-        #Unpack    
-        B      = self.prop_attributes.number_blades
-        R      = self.prop_attributes.tip_radius
-        Rh     = self.prop_attributes.hub_radius
-        beta   = self.prop_attributes.twist_distribution
-        c      = self.prop_attributes.chord_distribution
-        omega1 = self.inputs.omega
-        rho    = conditions.freestream.density[:,0,None]
-        mu     = conditions.freestream.dynamic_viscosity[:,0,None]
-        Vv     = conditions.frames.inertial.velocity_vector
-        a      = conditions.freestream.speed_of_sound[:,0,None]
-        T      = conditions.freestream.temperature[:,0,None]
-        theta  = self.thrust_angle
-        
-        BB     = B*B
-        BBB    = BB*B
-            
-        # Velocity in the Body frame
-        T_body2inertial = conditions.frames.body.transform_to_inertial
-        T_inertial2body = orientation_transpose(T_body2inertial)
-        V_body = orientation_product(T_inertial2body,Vv)
+        thrust, torque, power, Cp = spin_propellers([self],[conditions])
         
-        # Velocity transformed to the propulsor frame
-        body2thrust   = np.array([[np.cos(theta), 0., np.sin(theta)],[0., 1., 0.], [-np.sin(theta), 0., np.cos(theta)]])
-        T_body2thrust = orientation_transpose(np.ones_like(T_body2inertial[:])*body2thrust)
-        V_thrust      = orientation_product(T_body2thrust,V_body)
+        return thrust[0], torque[0], power[0], Cp[0]
+    
+    def build_performance_map(self,advance_ratio,rpm,altitude,atmosphere=None):
+        """Tabulates the thrust and power coefficients of the propeller over a grid of
+        advance ratio, RPM, and altitude by running the blade element solution at every
+        grid point. Once the design is frozen the map can stand in for spin during a
+        mission by setting use_performance_map. The map is checked against direct
+        solves at the center of every grid cell.
+
+        Assumptions:
+        The map has to be rebuilt if the blade geometry changes
+        The propeller axis is aligned with the freestream when tabulating
+        Each grid point is solved on its own so a stalled point can not end the others' iterations
+        Points where the solution does not converge or the tips go supersonic show up in the errors
+
+        Source:
+        N/A
+
+        Inputs:
+        advance_ratio                [-]   (ascending, at least 2 values)
+        rpm                          [rpm] (ascending, at least 2 values)
+        altitude                     [m]   (ascending, at least 2 values)
+        atmosphere                   (defaults to SUAVE.Analyses.Atmospheric.US_Standard_1976())
+
+        Outputs:
+        self.performance_map.
+          advance_ratio              [-]
+          rpm                        [rpm]
+          altitude                   [m]
+          thrust_coefficient         [-] (advance ratio x rpm x altitude)
+          power_coefficient          [-] (advance ratio x rpm x altitude)
+          errors.
+            thrust_coefficient       [-] (largest error at the cell centers)
+            power_coefficient        [-] (largest error at the cell centers)
+
+        Properties Used:
+        self.prop_attributes.tip_radius [m]
+        """
         
-        # Now just use the aligned velocity
-        V = V_thrust[:,0,None]
+        if atmosphere is None:
+            atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
         
-        nu    = mu/rho
-        tol   = 1e-5 # Convergence tolerance
+        advance_ratio = np.array(advance_ratio,dtype=float)
+        rpm           = np.array(rpm,dtype=float)
+        altitude      = np.array(altitude,dtype=float)
         
-        omega = omega1*1.0
-        omega = np.abs(omega)
-           
-        ######
-        # Enter airfoil data in a better way, there is currently Re and Ma scaling from DAE51 data
-        ######
-
-        #Things that don't change with iteration
-        N       = len(c) # Number of stations
-        chi0    = Rh/R   # Where the propeller blade actually starts
-        chi     = np.linspace(chi0,1,N+1)  # Vector of nondimensional radii
-        chi     = chi[0:N]
-        lamda   = V/(omega*R)              # Speed ratio
-        r       = chi*R                    # Radial coordinate
-        pi      = np.pi
-        pi2     = pi*pi
-        x       = r*np.multiply(omega,1/V) # Nondimensional distance
-        n       = omega/(2.*pi)            # Cycles per second
-        J       = V/(2.*R*n)    
-        sigma   = np.multiply(B*c,1./(2.*pi*r))   
+        # Solve every point of the grid
+        J, RPM, H = np.meshgrid(advance_ratio,rpm,altitude,indexing='ij')
+        Ct, Cp    = self._spin_coefficients(J.flatten(),RPM.flatten(),H.flatten(),atmosphere)
+        
+        performance_map = Data()
+        performance_map.advance_ratio      = advance_ratio
+        performance_map.rpm                = rpm
+        performance_map.altitude           = altitude
+        performance_map.thrust_coefficient = np.reshape(Ct,J.shape)
+        performance_map.power_coefficient  = np.reshape(Cp,J.shape)
+        
+        self.performance_map = performance_map
+        
+        # Check the map against direct solves in the middle of each cell
+        J_c, RPM_c, H_c = np.meshgrid(0.5*(advance_ratio[1:]+advance_ratio[:-1]),
+                                      0.5*(rpm[1:]+rpm[:-1]),
+                                      0.5*(altitude[1:]+altitude[:-1]),indexing='ij')
+        J_c, RPM_c, H_c = J_c.flatten(), RPM_c.flatten(), H_c.flatten()
+        Ct_c, Cp_c      = self._spin_coefficients(J_c,RPM_c,H_c,atmosphere)
+        Ct_i, Cp_i      = self._interpolate_coefficients(J_c,RPM_c,H_c)
+        
+        performance_map.errors = Data()
+        performance_map.errors.thrust_coefficient = np.max(np.abs(Ct_i-Ct_c))
+        performance_map.errors.power_coefficient  = np.max(np.abs(Cp_i-Cp_c))
+        
+        return performance_map
     
-        #I make the assumption that externally-induced velocity at the disk is zero
-        #This can be easily changed if needed in the future:
-        ua = 0.0
-        ut = 0.0
-        
-        omegar = np.outer(omega,r)
-        Ua = np.outer((V + ua),np.ones_like(r))
-        Ut = omegar - ut
-        U  = np.sqrt(Ua*Ua + Ut*Ut)
-        
-        #Things that will change with iteration
-        size = (len(a),N)
+    def evaluate_performance_map(self,conditions):
+        """Finds the propeller loads by interpolating the performance map. This is the
+        stand in for spin when use_performance_map is set.
+
+        Assumptions:
+        Operating points outside of the map take the values at the edge of the map
+        Acoustic outputs are only produced by the direct solution
+
+        Source:
+        N/A
+
+        Inputs:
+        self.inputs.omega            [radian/s]
+        conditions.freestream.
+          altitude                   [m]
+          density                    [kg/m^3]
+        conditions.frames.
+          body.transform_to_inertial (rotation matrix)
+          inertial.velocity_vector   [m/s]
+        conditions.propulsion.
+          throttle                   [-]
+
+        Outputs:
+        conditions.propulsion.etap   [-]
+        thrust                       [N]
+        torque                       [Nm]
+        power                        [W]
+        Cp                           [-] (coefficient of power)
+
+        Properties Used:
+        self.performance_map         (see build_performance_map)
+        self.prop_attributes.tip_radius [m]
+        self.thrust_angle            [radians]
+        """
+        
+        if self.performance_map is None:
+            raise ValueError('The propeller performance map has to be built before it can be used.')
+        
+        # Unpack
+        omega1   = self.inputs.omega
+        R        = self.prop_attributes.tip_radius
+        rho      = conditions.freestream.density[:,0,None]
+        altitude = conditions.freestream.altitude[:,0,None]
+        throttle = conditions.propulsion.throttle[:,0,None]
+        V        = axial_velocity(conditions,self.thrust_angle)
+        
+        omega = np.abs(omega1)*np.ones_like(V)
+        n     = omega/(2.*np.pi)
+        D     = 2*R
+        J     = V/(n*D)
+        
+        Ct, Cp = self._interpolate_coefficients(J[:,0],omega[:,0]*60./(2.*np.pi),altitude[:,0])
+        Ct     = Ct[:,None]
+        Cp     = Cp[:,None]
+        
+        thrust = Ct*rho*(n*n)*(D*D*D*D)
+        power  = Cp*rho*(n*n*n)*(D*D*D*D*D)
+        torque = power/omega
+        
+        thrust[throttle <=0.0] = 0.0
+        power[throttle  <=0.0] = 0.0
+        
+        thrust[omega1<0.0] = - thrust[omega1<0.0]
+        
+        conditions.propulsion.etap = V*thrust/power
+        
+        return thrust, torque, power, Cp
     
-        #Setup a Newton iteration
-        psi    = np.ones(size)
-        psiold = np.zeros(size)
-        diff   = 1.
-        
-        ii = 0
-        while (diff>tol):
-            sin_psi = np.sin(psi)
-            cos_psi = np.cos(psi)
-            Wa      = 0.5*Ua + 0.5*U*sin_psi
-            Wt      = 0.5*Ut + 0.5*U*cos_psi   
-            #va     = Wa - Ua
-            vt      = Ut - Wt
-            alpha   = beta - np.arctan2(Wa,Wt)
-            W       = (Wa*Wa + Wt*Wt)**0.5
-            Ma      = (W)/a #a is the speed of sound
-            
-            #if np.any(Ma> 1.0):
-                #warn('Propeller blade tips are supersonic.', Warning)
-            
-            lamdaw = r*Wa/(R*Wt)
-            
-            # Limiter to keep from Nan-ing
-            lamdaw[lamdaw<0.] = 0.
-            
-            f            = (B/2.)*(1.-r/R)/lamdaw
-            piece        = np.exp(-f)
-            arccos_piece = np.arccos(piece)
-            F            = 2.*arccos_piece/pi
-            Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
-            
-            # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
-            Cl = 2.*pi*alpha
-            
-            # By 90 deg, it's totally stalled.
-            Cl[alpha>=pi/2] = 0.
-            
-            # Scale for Mach, this is Karmen_Tsien
-            Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
-            
-            # If the blade segments are supersonic, don't scale
-            Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.] 
-            
-            Rsquiggly = Gamma - 0.5*W*c*Cl
-            
-            #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
-            #This was solved symbolically in Matlab and exported        
-            f_wt_2 = 4*Wt*Wt
-            f_wa_2 = 4*Wa*Wa
-            Ucospsi  = U*cos_psi
-            Usinpsi  = U*sin_psi
-            Utcospsi = Ut*cos_psi
-            Uasinpsi = Ua*sin_psi
-            
-            UapUsinpsi = (Ua + Usinpsi)
-            utpUcospsi = (Ut + Ucospsi)
-            
-            utpUcospsi2 = utpUcospsi*utpUcospsi
-            UapUsinpsi2 = UapUsinpsi*UapUsinpsi
+    def check_performance_map(self,conditions):
+        """Reports how far the performance map is from a direct solution at a set of
+        operating conditions.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        conditions                   (see spin and evaluate_performance_map)
+        self.inputs.omega            [radian/s]
+
+        Outputs:
+        errors.
+          thrust                     [-] (largest error relative to the largest direct thrust)
+          power                      [-] (largest error relative to the largest direct power)
+          torque                     [-] (largest error relative to the largest direct torque)
+
+        Properties Used:
+        self.performance_map         (see build_performance_map)
+        """
+        
+        F_map, Q_map, P_map, Cp_map = self.evaluate_performance_map(conditions)
+        F, Q, P, Cp = spin_propellers([self],[conditions])
+        
+        errors = Data()
+        errors.thrust = np.max(np.abs(F_map-F[0]))/np.max(np.abs(F[0]))
+        errors.power  = np.max(np.abs(P_map-P[0]))/np.max(np.abs(P[0]))
+        errors.torque = np.max(np.abs(Q_map-Q[0]))/np.max(np.abs(Q[0]))
+        
+        return errors
+    
+    def _spin_coefficients(self,advance_ratio,rpm,altitude,atmosphere):
+        """Solves for the thrust and power coefficients at a list of operating points,
+        with each point spun as its own rotor.
+
+        Assumptions:
+        The propeller axis is aligned with the freestream
+
+        Source:
+        N/A
+
+        Inputs:
+        advance_ratio                [-]   (1D array)
+        rpm                          [rpm] (1D array)
+        altitude                     [m]   (1D array)
+        atmosphere                   (atmospheric analysis)
+
+        Outputs:
+        Ct                           [-]   (1D array)
+        Cp                           [-]   (1D array)
+
+        Properties Used:
+        self.prop_attributes         (see spin)
+        """
+        
+        freestream = atmosphere.compute_values(altitude)
+        omega      = rpm*2.*np.pi/60.
+        D          = 2.*self.prop_attributes.tip_radius
+        V          = advance_ratio*omega*D/(2.*np.pi)
+        
+        rotors     = []
+        conditions = []
+        for i in xrange(len(V)):
+            rotor = Data()
+            rotor.prop_attributes = self.prop_attributes
+            rotor.thrust_angle    = 0.0
+            rotor.inputs          = Data()
+            rotor.inputs.omega    = np.array([[omega[i]]])
             
-            dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
-                       (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                       + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                       - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
-                      (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
-                       r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
-                       Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
+            konditions = Data()
+            konditions.freestream = Data()
+            konditions.propulsion = Data()
+            konditions.frames     = Data()
+            konditions.frames.body     = Data()
+            konditions.frames.inertial = Data()
+            konditions.freestream.density           = freestream.density[i:i+1]
+            konditions.freestream.dynamic_viscosity = freestream.dynamic_viscosity[i:i+1]
+            konditions.freestream.speed_of_sound    = freestream.speed_of_sound[i:i+1]
+            konditions.freestream.temperature       = freestream.temperature[i:i+1]
+            konditions.frames.inertial.velocity_vector   = np.array([[V[i],0.,0.]])
+            konditions.frames.body.transform_to_inertial = np.array([np.eye(3)])
+            konditions.propulsion.throttle               = np.array([[1.]])
             
-            dR_dpsi[np.isnan(dR_dpsi)] = 0.1
-                      
-            dpsi   = -Rsquiggly/dR_dpsi
-            psi    = psi + dpsi
-            diff   = np.max(abs(psiold-psi))
-            psiold = psi
+            rotors.append(rotor)
+            conditions.append(konditions)
             
-            # If its really not going to converge
-            if np.any(psi>(pi*85.0/180.)) and np.any(dpsi>0.0):
-                break
-
-        #This is an atrocious fit of DAE51 data at RE=50k for Cd
-        #There is also RE scaling
-        Re      = (W*c)/nu
-        Cdval = (0.108*(Cl*Cl*Cl*Cl)-0.2612*(Cl*Cl*Cl)+0.181*(Cl*Cl)-0.0139*Cl+0.0278)*((50000./Re)**0.2)
-        Cdval[alpha>=pi/2] = 2.
-        
-        #More Cd scaling from Mach from AA241ab notes for turbulent skin friction
-        Tw_Tinf = 1. + 1.78*(Ma*Ma)
-        Tp_Tinf = 1. + 0.035*(Ma*Ma) + 0.45*(Tw_Tinf-1.)
-        Tp      = (Tp_Tinf)*T
-        Rp_Rinf = (Tp_Tinf**2.5)*(Tp+110.4)/(T+110.4)
-        
-        Cd = ((1/Tp_Tinf)*(1/Rp_Rinf)**0.2)*Cdval
-        
-        epsilon  = Cd/Cl
-        epsilon[epsilon==np.inf] = 10. 
-        deltar   = (r[1]-r[0])
-        thrust   = rho*B*(np.sum(Gamma*(Wt-epsilon*Wa)*deltar,axis=1)[:,None])
-        torque   = rho*B*np.sum(Gamma*(Wa+epsilon*Wt)*r*deltar,axis=1)[:,None]
-        power    = torque*omega       
-       
-        D        = 2*R
-        Cp       = power/(rho*(n*n*n)*(D*D*D*D*D))
+        thrust, torque, power, Cp = spin_propellers(rotors,conditions)
+        
+        n   = omega/(2.*np.pi)
+        rho = freestream.density[:,0]
+        Ct  = thrust[:,0,0]/(rho*(n*n)*(D*D*D*D))
+        
+        return Ct, Cp[:,0,0]
+    
+    def _interpolate_coefficients(self,advance_ratio,rpm,altitude):
+        """Interpolates the thrust and power coefficients out of the performance map.
 
-        thrust[conditions.propulsion.throttle[:,0] <=0.0] = 0.0
-        power[conditions.propulsion.throttle[:,0]  <=0.0] = 0.0
+        Assumptions:
+        Points outside of the map are moved to its edges
+
+        Source:
+        N/A
+
+        Inputs:
+        advance_ratio                [-]   (1D array)
+        rpm                          [rpm] (1D array)
+        altitude                     [m]   (1D array)
+
+        Outputs:
+        Ct                           [-]   (1D array)
+        Cp                           [-]   (1D array)
+
+        Properties Used:
+        self.performance_map         (see build_performance_map)
+        """
         
-        thrust[omega1<0.0] = - thrust[omega1<0.0]
+        performance_map = self.performance_map
+        axes            = (performance_map.advance_ratio,performance_map.rpm,performance_map.altitude)
+        
+        points = np.vstack([np.clip(advance_ratio,axes[0][0],axes[0][-1]),
+                            np.clip(rpm,axes[1][0],axes[1][-1]),
+                            np.clip(altitude,axes[2][0],axes[2][-1])]).T
+        
+        Ct = RegularGridInterpolator(axes,performance_map.thrust_coefficient)(points)
+        Cp = RegularGridInterpolator(axes,performance_map.power_coefficient)(points)
+        
+        return Ct, Cp
+    
+# ----------------------------------------------------------------------
+#  Propeller Frame Velocity
+# ----------------------------------------------------------------------   
+
+## @ingroup Components-Energy-Converters
+def axial_velocity(conditions,thrust_angle):
+    """Finds the freestream velocity along the propeller axis.
 
-        etap     = V*thrust/power     
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    conditions.frames.
+      body.transform_to_inertial (rotation matrix)
+      inertial.velocity_vector   [m/s]
+    thrust_angle                 [radians]
+
+    Outputs:
+    V                            [m/s] (control points x 1)
+
+    Properties Used:
+    N/A
+    """ 
+    
+    theta = thrust_angle
+    Vv    = conditions.frames.inertial.velocity_vector
         
-        conditions.propulsion.etap = etap
+    # Velocity in the Body frame
+    T_body2inertial = conditions.frames.body.transform_to_inertial
+    T_inertial2body = orientation_transpose(T_body2inertial)
+    V_body = orientation_product(T_inertial2body,Vv)
+    
+    # Velocity transformed to the propulsor frame
+    body2thrust   = np.array([[np.cos(theta), 0., np.sin(theta)],[0., 1., 0.], [-np.sin(theta), 0., np.cos(theta)]])
+    T_body2thrust = orientation_transpose(np.ones_like(T_body2inertial[:])*body2thrust)
+    V_thrust      = orientation_product(T_body2thrust,V_body)
+    
+    return V_thrust[:,0,None]
+
+# ----------------------------------------------------------------------
+#  Batched Propeller Evaluation
+# ----------------------------------------------------------------------   
+
+## @ingroup Components-Energy-Converters
+def spin_propellers(propellers,conditions):
+    """Analyzes several propellers at once. The rotors, control points, and blade
+    stations are stacked into one array problem and solved with a single Newton
+    iteration. Propellers with fewer blade stations are padded with their last 
+    station, and the padded stations are masked out of the integrated loads.
+
+    Assumptions:
+    per source
+    Every propeller is evaluated at the same number of control points
+    Each propeller keeps iterating until its own stations converge, so the results
+    are the same as spinning the propellers one at a time
+
+    Source:
+    Qprop theory document
+
+    Inputs:
+    propellers                   [list of Propeller()]
+    conditions                   (a single conditions or a list with one per propeller)
+      freestream.
+        density                  [kg/m^3]
+        dynamic_viscosity        [kg/(m-s)]
+        speed_of_sound           [m/s]
+        temperature              [K]
+      frames.
+        body.transform_to_inertial (rotation matrix)
+        inertial.velocity_vector [m/s]
+      propulsion.
+        throttle                 [-]
+    propellers[*].inputs.omega   [radian/s]
+
+    Outputs:
+    conditions.propulsion.acoustic_outputs (for each propeller's conditions, see Propeller.spin)
+    conditions.propulsion.etap   [-]
+    thrust                       [N]  (rotors x control points x 1)
+    torque                       [Nm] (rotors x control points x 1)
+    power                        [W]  (rotors x control points x 1)
+    Cp                           [-]  (rotors x control points x 1)
+
+    Properties Used:
+    propellers[*].prop_attributes.
+      number_blades              [-]
+      tip_radius                 [m]
+      hub_radius                 [m]
+      twist_distribution         [radians]
+      chord_distribution         [m]
+      mid_chord_aligment         [m] (distance from the mid chord to the line axis out of the center of the blade)
+    propellers[*].thrust_angle   [radians]
+    """ 
+    
+    if not isinstance(conditions,(list,tuple)):
+        conditions = [conditions]*len(propellers)
         
-        # store data
-        results_conditions = Data      
-        conditions.propulsion.acoustic_outputs = results_conditions(
-            number_sections    = N,
-            r0                 = r,
-            airfoil_chord      = c,
-            blades_number      = B,
-            propeller_diameter = D,
-            drag_coefficient   = Cd,
-            lift_coefficient   = Cl,
-            omega              = omega,
-            velocity           = V,
-            thrust             = thrust,
-            power              = power,
-            mid_chord_aligment = self.prop_attributes.mid_chord_aligment
-        )
+    n_rotors   = len(propellers)
+    n_stations = [len(prop.prop_attributes.chord_distribution) for prop in propellers]
+    S          = max(n_stations)
+    
+    # Stack the geometry, padding each blade out to the longest blade with its last station
+    B    = np.zeros((n_rotors,1,1))
+    R    = np.zeros((n_rotors,1,1))
+    r    = np.zeros((n_rotors,1,S))
+    c    = np.zeros((n_rotors,1,S))
+    beta = np.zeros((n_rotors,1,S))
+    mask = np.zeros((n_rotors,1,S),dtype=bool)
+    
+    # Stack the operating conditions
+    omega1, rho, mu, a, T, V, throttle = [], [], [], [], [], [], []
+    
+    for i, prop in enumerate(propellers):
         
+        #Unpack    
+        N_i    = n_stations[i]
+        Rt     = prop.prop_attributes.tip_radius
+        Rh     = prop.prop_attributes.hub_radius
+        chi0   = Rh/Rt   # Where the propeller blade actually starts
+        chi    = np.linspace(chi0,1,N_i+1)  # Vector of nondimensional radii
+        chi    = chi[0:N_i]
         
-        return thrust, torque, power, Cp
-    
\ No newline at end of file
+        B[i]          = prop.prop_attributes.number_blades
+        R[i]          = Rt
+        r[i,0,:]      = np.pad(chi*Rt,(0,S-N_i),'edge')
+        c[i,0,:]      = np.pad(prop.prop_attributes.chord_distribution*np.ones(N_i),(0,S-N_i),'edge')
+        beta[i,0,:]   = np.pad(prop.prop_attributes.twist_distribution*np.ones(N_i),(0,S-N_i),'edge')
+        mask[i,0,:N_i] = True
+        
+        konditions = conditions[i]
+        
+        # Now just use the aligned velocity
+        V.append(axial_velocity(konditions,prop.thrust_angle))
+        omega1.append(prop.inputs.omega*np.ones_like(V[-1]))
+        rho.append(konditions.freestream.density[:,0,None])
+        mu.append(konditions.freestream.dynamic_viscosity[:,0,None])
+        a.append(konditions.freestream.speed_of_sound[:,0,None])
+        T.append(konditions.freestream.temperature[:,0,None])
+        throttle.append(konditions.propulsion.throttle[:,0,None])
+        
+    omega1   = np.array(omega1)
+    rho      = np.array(rho)
+    mu       = np.array(mu)
+    a        = np.array(a)
+    T        = np.array(T)
+    V        = np.array(V)
+    throttle = np.array(throttle)
+        
+    BB     = B*B
+    BBB    = BB*B
+        
+    nu    = mu/rho
+    tol   = 1e-5 # Convergence tolerance
+    
+    omega = omega1*1.0
+    omega = np.abs(omega)
+       
+    ######
+    # Enter airfoil data in a better way, there is currently Re and Ma scaling from DAE51 data
+    ######
+
+    #Things that don't change with iteration
+    pi      = np.pi
+    pi2     = pi*pi
+    n       = omega/(2.*pi)            # Cycles per second
+
+    #I make the assumption that externally-induced velocity at the disk is zero
+    #This can be easily changed if needed in the future:
+    ua = 0.0
+    ut = 0.0
+    
+    omegar = omega*r
+    Ua = (V + ua)*np.ones_like(r)
+    Ut = omegar - ut
+    U  = np.sqrt(Ua*Ua + Ut*Ut)
+    
+    #Things that will change with iteration
+    size = (n_rotors,len(V[0]),S)
+
+    #Setup a Newton iteration
+    psi    = np.ones(size)
+    psiold = np.zeros(size)
+    
+    # Each rotor stops iterating once its own stations converge
+    active = np.ones(n_rotors,dtype=bool)
+    
+    while np.any(active):
+        sin_psi = np.sin(psi)
+        cos_psi = np.cos(psi)
+        Wa      = 0.5*Ua + 0.5*U*sin_psi
+        Wt      = 0.5*Ut + 0.5*U*cos_psi   
+        #va     = Wa - Ua
+        vt      = Ut - Wt
+        alpha   = beta - np.arctan2(Wa,Wt)
+        W       = (Wa*Wa + Wt*Wt)**0.5
+        Ma      = (W)/a #a is the speed of sound
+        
+        #if np.any(Ma> 1.0):
+            #warn('Propeller blade tips are supersonic.', Warning)
+        
+        lamdaw = r*Wa/(R*Wt)
+        
+        # Limiter to keep from Nan-ing
+        lamdaw[lamdaw<0.] = 0.
+        
+        f            = (B/2.)*(1.-r/R)/lamdaw
+        piece        = np.exp(-f)
+        arccos_piece = np.arccos(piece)
+        F            = 2.*arccos_piece/pi
+        Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
+        
+        # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
+        Cl = 2.*pi*alpha
+        
+        # By 90 deg, it's totally stalled.
+        Cl[alpha>=pi/2] = 0.
+        
+        # Scale for Mach, this is Karmen_Tsien
+        sub     = Ma<1.
+        Cl[sub] = Cl[sub]/((1-Ma[sub]*Ma[sub])**0.5+((Ma[sub]*Ma[sub])/(1+(1-Ma[sub]*Ma[sub])**0.5))*Cl[sub]/2)
+        
+        # If the blade segments are supersonic, don't scale
+        
+        Rsquiggly = Gamma - 0.5*W*c*Cl
+        
+        #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
+        #This was solved symbolically in Matlab and exported        
+        f_wt_2 = 4*Wt*Wt
+        f_wa_2 = 4*Wa*Wa
+        Ucospsi  = U*cos_psi
+        Usinpsi  = U*sin_psi
+        Utcospsi = Ut*cos_psi
+        Uasinpsi = Ua*sin_psi
+        
+        UapUsinpsi = (Ua + Usinpsi)
+        utpUcospsi = (Ut + Ucospsi)
+        
+        utpUcospsi2 = utpUcospsi*utpUcospsi
+        UapUsinpsi2 = UapUsinpsi*UapUsinpsi
+        
+        dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
+                   (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
+                   + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
+                   - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
+                  (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
+                   r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
+                   Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
+        
+        dR_dpsi[np.isnan(dR_dpsi)] = 0.1
+                  
+        dpsi   = -Rsquiggly/dR_dpsi
+        psinew = psi + dpsi
+        diff   = np.max(np.reshape(abs(psiold-psinew),(n_rotors,-1)),axis=1)
+        
+        # If its really not going to converge
+        stalled = np.logical_and(np.any(np.reshape(psinew>(pi*85.0/180.),(n_rotors,-1)),axis=1),
+                                 np.any(np.reshape(dpsi>0.0,(n_rotors,-1)),axis=1))
+        
+        # Rotors that are finished keep the angles their loads were just found with
+        active = np.logical_and(active,np.logical_and(diff>tol,np.logical_not(stalled)))
+        psi    = np.where(active[:,None,None],psinew,psi)
+        psiold = psi
+
+    #This is an atrocious fit of DAE51 data at RE=50k for Cd
+    #There is also RE scaling
+    Re      = (W*c)/nu
+    Cdval = (0.108*(Cl*Cl*Cl*Cl)-0.2612*(Cl*Cl*Cl)+0.181*(Cl*Cl)-0.0139*Cl+0.0278)*((50000./Re)**0.2)
+    Cdval[alpha>=pi/2] = 2.
+    
+    #More Cd scaling from Mach from AA241ab notes for turbulent skin friction
+    Tw_Tinf = 1. + 1.78*(Ma*Ma)
+    Tp_Tinf = 1. + 0.035*(Ma*Ma) + 0.45*(Tw_Tinf-1.)
+    Tp      = (Tp_Tinf)*T
+    Rp_Rinf = (Tp_Tinf**2.5)*(Tp+110.4)/(T+110.4)
+    
+    Cd = ((1/Tp_Tinf)*(1/Rp_Rinf)**0.2)*Cdval
+    
+    epsilon  = Cd/Cl
+    epsilon[epsilon==np.inf] = 10. 
+    deltar   = (r[:,:,1,None]-r[:,:,0,None])
+    thrust   = rho*B*(np.sum(np.where(mask,Gamma*(Wt-epsilon*Wa)*deltar,0.),axis=2)[:,:,None])
+    torque   = rho*B*np.sum(np.where(mask,Gamma*(Wa+epsilon*Wt)*r*deltar,0.),axis=2)[:,:,None]
+    power    = torque*omega       
+   
+    D        = 2*R
+    Cp       = power/(rho*(n*n*n)*(D*D*D*D*D))
+
+    thrust[throttle <=0.0] = 0.0
+    power[throttle  <=0.0] = 0.0
+    
+    thrust[omega1<0.0] = - thrust[omega1<0.0]
+
+    etap     = V*thrust/power     
+    
+    # store data for each propeller
+    for i, prop in enumerate(propellers):
+        N_i = n_stations[i]
+        conditions[i].propulsion.etap = etap[i]
+        
+        results_conditions = Data      
+        conditions[i].propulsion.acoustic_outputs = results_conditions(
+            number_sections    = N_i,
+            r0                 = r[i,0,:N_i],
+            airfoil_chord      = prop.prop_attributes.chord_distribution,
+            blades_number      = prop.prop_attributes.number_blades,
+            propeller_diameter = D[i,0,0],
+            drag_coefficient   = Cd[i,:,:N_i],
+            lift_coefficient   = Cl[i,:,:N_i],
+            omega              = omega[i],
+            velocity           = V[i],
+            thrust             = thrust[i],
+            power              = power[i],
+            mid_chord_aligment = prop.prop_attributes.mid_chord_aligment
+        )
+    
+    return thrust, torque, power, Cp
@@ -2,7 +2,7 @@
 # Lift_Forward_propulsor.py
 # 
 # Created: Jan 2016, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,6 +15,7 @@ import SUAVE
 import numpy as np
 from SUAVE.Core import Units, Data
 from SUAVE.Components.Propulsors.Propulsor import Propulsor
+from SUAVE.Components.Energy.Converters.Propeller import spin_propellers
 
 # ----------------------------------------------------------------------
 #  Lift_Forward
@@ -144,7 +145,7 @@ class Lift_Forward_Propulsor(Propulsor):
         esc_forward.inputs.voltagein = volts 
         
         ###
-        # Evaluate thrust from the forward propulsors
+        # Setup the forward propulsors
         ###
         
         # Throttle the voltage
@@ -157,25 +158,9 @@ class Lift_Forward_Propulsor(Propulsor):
         # link
         propeller_forward.inputs.omega =  motor_forward.outputs.omega
         propeller_forward.thrust_angle = self.thrust_angle_forward   
-        
-        # Run the propeller
-        F_forward, Q_forward, P_forward, Cp_forward = propeller_forward.spin(conditions)
-            
-        # Check to see if magic thrust is needed, the ESC caps throttle at 1.1 already
-        eta = conditions.propulsion.throttle[:,0,None]
-        P_forward[eta>1.0] = P_forward[eta>1.0]*eta[eta>1.0]
-        F_forward[eta>1.0] = F_forward[eta>1.0]*eta[eta>1.0]        
-        
-        # Run the motor for current
-        motor_forward.current(conditions)  
-        # link
-        esc_forward.inputs.currentout =  motor_forward.outputs.current     
-        
-        # Run the esc
-        esc_forward.currentin()        
        
         ###
-        # Evaluate thrust from the lift propulsors
+        # Setup the lift propulsors
         ###
         
         # Make a new set of konditions, since there are differences for the esc and motor
@@ -206,8 +191,35 @@ class Lift_Forward_Propulsor(Propulsor):
         propeller_lift.inputs.omega =  motor_lift.outputs.omega
         propeller_lift.thrust_angle = self.thrust_angle_lift
         
-        # Run the propeller
-        F_lift, Q_lift, P_lift, Cp_lift = propeller_lift.spin(konditions)
+        ###
+        # Spin the forward and lift propellers together
+        ###
+        
+        F, Q, P, Cp = spin_propellers([propeller_forward,propeller_lift],[conditions,konditions])
+        
+        F_forward, Q_forward, P_forward, Cp_forward = F[0], Q[0], P[0], Cp[0]
+        F_lift,    Q_lift,    P_lift,    Cp_lift    = F[1], Q[1], P[1], Cp[1]
+        
+        ###
+        # Evaluate the forward propulsors
+        ###
+            
+        # Check to see if magic thrust is needed, the ESC caps throttle at 1.1 already
+        eta = conditions.propulsion.throttle[:,0,None]
+        P_forward[eta>1.0] = P_forward[eta>1.0]*eta[eta>1.0]
+        F_forward[eta>1.0] = F_forward[eta>1.0]*eta[eta>1.0]        
+        
+        # Run the motor for current
+        motor_forward.current(conditions)  
+        # link
+        esc_forward.inputs.currentout =  motor_forward.outputs.current     
+        
+        # Run the esc
+        esc_forward.currentin()        
+       
+        ###
+        # Evaluate the lift propulsors
+        ###
             
         # Check to see if magic thrust is needed, the ESC caps throttle at 1.1 already
         eta = state.conditions.propulsion.lift_throttle
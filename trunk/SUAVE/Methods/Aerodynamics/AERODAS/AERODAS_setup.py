@@ -3,6 +3,7 @@
 # 
 # Created:  Feb 2016, E. Botero
 # Modified: Jun 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -21,7 +22,7 @@ def setup_data(state,settings,geometry):
     that will be generated by the AERODAS model.
 
     Assumptions:
-    None
+    If the stacked wing properties have not been initialized, they are built here
 
     Source:
     NASA TR: "Models of Lift and Drag Coefficients of Stalled and Unstalled Airfoils in
@@ -29,6 +30,7 @@ def setup_data(state,settings,geometry):
 
     Inputs:
     state.conditions.aerodynamics (to be modified)
+    settings.wing_properties      (built if None)
 
     Outputs:
     None
@@ -37,12 +39,115 @@ def setup_data(state,settings,geometry):
     N/A
     """      
     
+    if settings.wing_properties is None:
+        settings.wing_properties = wing_properties(settings,geometry)
+    
     state.conditions.aerodynamics.pre_stall_coefficients  = Data()
     state.conditions.aerodynamics.post_stall_coefficients = Data()
-    
+    state.conditions.aerodynamics.wings_stacked           = Data()
     
     return 
 
+# ----------------------------------------------------------------------
+#  Wing Properties
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-AERODAS
+def wing_properties(settings,geometry):
+    """ This stacks the geometry dependent constants of every wing so the pre and
+    post stall coefficients can be evaluated for all wings in one array operation.
+    The arrays have one column per wing so they broadcast against the control 
+    point rows of the conditions.
+
+    Assumptions:
+    The geometry does not change after this is called
+
+    Source:
+    NASA TR: "Models of Lift and Drag Coefficients of Stalled and Unstalled Airfoils in
+      Wind Turbines and Wind Tunnels" by D. A. Spera
+    McCormick (lift curve slope)
+
+    Inputs:
+    geometry.wings.*.
+      tag                                 [-]
+      areas.reference                     [m^2]
+      aspect_ratio                        [Unitless]
+      thickness_to_chord                  [Unitless]
+      chords.mean_aerodynamic             [m]
+      vertical                            [Boolean]
+    settings.section_lift_curve_slope     [1/radians]
+
+    Outputs:
+    wing_properties.
+      tags                                [-]
+      reference_area                      [m^2]
+      vertical                            [Boolean]
+      aspect_ratio                        [Unitless]
+      thickness_to_chord                  [Unitless]
+      mean_aerodynamic_chord              [m]
+      form_factor                         [Unitless]
+      aspect_ratio_factor                 [Unitless]
+      lift_curve_slope                    [1/radians]
+      maximum_lift_factor                 [Unitless]
+      post_stall_maximum_lift_coefficient [Unitless]
+      post_stall_maximum_drag_coefficient [Unitless]
+      post_stall_lift_reduction           [Unitless]
+      post_stall_lift_exponent            [Unitless]
+
+    Properties Used:
+    N/A
+    """     
+    
+    wings = geometry.wings.values()
+    
+    # Stack the raw geometry, one column per wing
+    AR   = np.array([[wing.aspect_ratio            for wing in wings]],dtype=float)
+    t_c  = np.array([[wing.thickness_to_chord      for wing in wings]],dtype=float)
+    mac  = np.array([[wing.chords.mean_aerodynamic for wing in wings]],dtype=float)
+    area = np.array([[wing.areas.reference         for wing in wings]],dtype=float)
+    vert = np.array([[wing.vertical == True        for wing in wings]])
+    S1p  = settings.section_lift_curve_slope / Units.deg
+    
+    # Form factor for the section zero lift drag, from AA 241 A/B Notes
+    C    = 1.1
+    k1   = 2.*C*t_c
+    k2   = C*C*(1+5)**t_c*t_c/2.
+    k    = 1 + k1 + k2
+    
+    # Finite aspect ratio terms, Equations 5a through 5e
+    ARf  = AR**(-0.9)
+    S1   = S1p*AR/(2+np.sqrt(4+AR**2)) * Units.deg
+    CLf  = 0.67+0.33*np.exp(-(4.0/AR)**2.)
+    
+    # Post stall terms, Equations 8 through 11
+    F1     = 1.190*(1.0-(t_c*t_c))
+    F2     = 0.65 + 0.35*np.exp(-(9.0/AR)**2.3)
+    G1     = 2.3*np.exp(-(0.65*t_c)**0.9)
+    G2     = 0.52 + 0.48*np.exp(-(6.5/AR)**1.1)
+    CL2max = F1*F2
+    CD2max = G1*G2
+    RCL2   = 1.632-CL2max
+    N2     = 1 + CL2max/RCL2
+    
+    # Pack outputs
+    properties = Data()
+    properties.tags                                = [wing.tag for wing in wings]
+    properties.reference_area                      = area
+    properties.vertical                            = vert
+    properties.aspect_ratio                        = AR
+    properties.thickness_to_chord                  = t_c
+    properties.mean_aerodynamic_chord              = mac
+    properties.form_factor                         = k
+    properties.aspect_ratio_factor                 = ARf
+    properties.lift_curve_slope                    = S1
+    properties.maximum_lift_factor                 = CLf
+    properties.post_stall_maximum_lift_coefficient = CL2max
+    properties.post_stall_maximum_drag_coefficient = CD2max
+    properties.post_stall_lift_reduction           = RCL2
+    properties.post_stall_lift_exponent            = N2
+    
+    return properties
+
 # ----------------------------------------------------------------------
 #  Lift and Drag Total
 # ----------------------------------------------------------------------
@@ -59,16 +164,18 @@ def lift_drag_total(state,settings,geometry):
       Wind Turbines and Wind Tunnels" by D. A. Spera
 
     Inputs:
-    geometry.
-      reference_area                                                      [m^2]
-      wings
+    geometry.reference_area                                               [m^2]
     state.conditions.aerodynamics.
       angle_of_attack                                                     [radians]
-      pre_stall_coefficients[wing.tag].lift_coefficient (for each wing)   [Unitless]
-      pre_stall_coefficients[wing.tag].drag_coefficient (for each wing)   [Unitless]
-      post_stall_coefficients[wing.tag].lift_coefficient (for each wing)  [Unitless]
-      post_stall_coefficients[wing.tag].drag_coefficient (for each wing)  [Unitless]
-    settings.section_zero_lift_angle_of_attack                            [radians]
+      wings_stacked.pre_stall_lift_coefficient  (column for each wing)    [Unitless]
+      wings_stacked.pre_stall_drag_coefficient  (column for each wing)    [Unitless]
+      wings_stacked.post_stall_lift_coefficient (column for each wing)    [Unitless]
+      wings_stacked.post_stall_drag_coefficient (column for each wing)    [Unitless]
+    settings.
+      section_zero_lift_angle_of_attack                                   [radians]
+      drag_coefficient_increment                                          [Unitless]
+      wing_properties.reference_area                                      [m^2]
+      wing_properties.vertical                                            [Boolean]
 
     Outputs:
     state.conditions.aerodynamics.
@@ -79,43 +186,29 @@ def lift_drag_total(state,settings,geometry):
     N/A
     """      
     
-    # prime the totals
-    CL_total = 0.
-    CD_total = 0.
-    
     # Unpack general things
     ref       = geometry.reference_area
-    wing_aero = state.conditions.aerodynamics
+    props     = settings.wing_properties
+    stacked   = state.conditions.aerodynamics.wings_stacked
     alpha     = state.conditions.aerodynamics.angle_of_attack
     A0        = settings.section_zero_lift_angle_of_attack
     
-    #  loop through each wing 
-    for wing in geometry.wings:
-        
-        # unpack inputs
-        area = wing.areas.reference
-        CL1  = wing_aero.pre_stall_coefficients[wing.tag].lift_coefficient
-        CD1  = wing_aero.pre_stall_coefficients[wing.tag].drag_coefficient
-        CL2  = wing_aero.post_stall_coefficients[wing.tag].lift_coefficient
-        CD2  = wing_aero.post_stall_coefficients[wing.tag].drag_coefficient
-        
-        # Equation 3a
-        CL = np.fmax(CL1,CL2)
-        
-        # Equation 3b
-        CL[alpha<=A0] = np.fmin(CL1[alpha<=A0],CL2[alpha<=A0])
-        
-        # Equation 3c
-        CD            = np.fmax(CD1,CD2)
-        
-        # Add to the total
-        CD_total      = CD_total + CD*area/ref
-
-        if wing.vertical == False:
-            CL_total      = CL_total + CL*area/ref
-        else:
-            pass
-
+    # unpack inputs, one column per wing
+    area = props.reference_area
+    CL1  = stacked.pre_stall_lift_coefficient
+    CD1  = stacked.pre_stall_drag_coefficient
+    CL2  = stacked.post_stall_lift_coefficient
+    CD2  = stacked.post_stall_drag_coefficient
+    
+    # Equation 3a and 3b
+    CL = np.where(alpha<=A0,np.fmin(CL1,CL2),np.fmax(CL1,CL2))
+    
+    # Equation 3c
+    CD = np.fmax(CD1,CD2)
+    
+    # Add to the total, vertical wings do not contribute lift
+    CD_total = np.sum(CD*area/ref,axis=1,keepdims=True)
+    CL_total = np.sum(CL*(area*np.logical_not(props.vertical))/ref,axis=1,keepdims=True)
         
     CD_total = CD_total + settings.drag_coefficient_increment
         
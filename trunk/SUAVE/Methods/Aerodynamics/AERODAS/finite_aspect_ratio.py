@@ -2,7 +2,7 @@
 # finite_aspect_ratio.py
 # 
 # Created:  Feb 2016, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -17,7 +17,7 @@ from SUAVE.Core import Units
 
 ## @ingroup Methods-Aerodynamics-AERODAS
 def finite_aspect_ratio(state,settings,geometry):
-    """Uses the AERODAS method to prestall parameters for lift and drag.
+    """Uses the AERODAS method to prestall parameters for lift and drag for all wings at once.
 
     Assumptions:
     None
@@ -27,57 +27,58 @@ def finite_aspect_ratio(state,settings,geometry):
       Wind Turbines and Wind Tunnels" by D. A. Spera
 
     Inputs:
-    geometry.
-      aspect_ratio                                [Unitless]
-      section.
-        maximum_coefficient_lift                  [Unitless]
-        angle_attack_max_prestall_lift            [radians]
-        pre_stall_maximum_drag_coefficient_angle  [radians]
-        pre_stall_maximum_drag_coefficient        [Unitless]
-    settings.section_lift_curve_slope             [radians]
+    settings.wing_properties.
+      aspect_ratio_factor                         [Unitless]
+      lift_curve_slope                            [1/radians]
+      maximum_lift_factor                         [Unitless]
+    state.conditions.aerodynamics.wings_stacked.section.
+      maximum_coefficient_lift                    [Unitless]
+      angle_attack_max_prestall_lift              [radians]
+      pre_stall_maximum_drag_coefficient_angle    [radians]
+      pre_stall_maximum_drag_coefficient          [Unitless]
 
     Outputs:
     pre_stall_maximum_lift_coefficient            [Unitless]
     pre_stall_maximum_lift_drag_coefficient       [Unitless]
-    pre_stall_lift_curve_slope                    [radians]
+    pre_stall_lift_curve_slope                    [1/radians]
     pre_stall_maximum_drag_coefficient_angle      [Unitless]
-    (these are also packed into geometry.)
+    (these are also packed into state.conditions.aerodynamics.wings_stacked)
 
     Properties Used:
     N/A
     """      
     
     # unpack inputs
-    wing    = geometry
-    AR      = wing.aspect_ratio
-    CL1maxp = wing.section.maximum_coefficient_lift  
-    ACL1p   = wing.section.angle_attack_max_prestall_lift 
-    ACD1p   = wing.section.pre_stall_maximum_drag_coefficient_angle
-    CD1maxp = wing.section.pre_stall_maximum_drag_coefficient  
-    S1p     = settings.section_lift_curve_slope / Units.deg
+    props   = settings.wing_properties
+    stacked = state.conditions.aerodynamics.wings_stacked
+    ARf     = props.aspect_ratio_factor
+    CL1maxp = stacked.section.maximum_coefficient_lift  
+    ACL1p   = stacked.section.angle_attack_max_prestall_lift 
+    ACD1p   = stacked.section.pre_stall_maximum_drag_coefficient_angle
+    CD1maxp = stacked.section.pre_stall_maximum_drag_coefficient  
     
     # Equation 5a
-    ACL1   = ACL1p + 18.2*CL1maxp*(AR**(-0.9)) * Units.deg
+    ACL1   = ACL1p + 18.2*CL1maxp*ARf * Units.deg
     
     # Equation 5b
     #S1     = S1p/(1+18.2*S1p*(AR**(-0.9))) * Units.deg
     
-    # From McCormick
-    S1 = S1p*AR/(2+np.sqrt(4+AR**2)) * Units.deg
+    # From McCormick, this only depends on the geometry
+    S1 = props.lift_curve_slope * np.ones_like(CL1maxp)
     
     # Equation 5c
-    ACD1   =  ACD1p + 18.2*CL1maxp*(AR**(-0.9)) * Units.deg
+    ACD1   =  ACD1p + 18.2*CL1maxp*ARf * Units.deg
     
     # Equation 5d
-    CD1max = CD1maxp + 0.280*(CL1maxp*CL1maxp)*(AR**(-0.9))
+    CD1max = CD1maxp + 0.280*(CL1maxp*CL1maxp)*ARf
     
     # Equation 5e
-    CL1max = CL1maxp*(0.67+0.33*np.exp(-(4.0/AR)**2.))
+    CL1max = CL1maxp*props.maximum_lift_factor
 
     # Pack outputs
-    wing.pre_stall_maximum_lift_coefficient       = CL1max
-    wing.pre_stall_maximum_lift_drag_coefficient  = CD1max
-    wing.pre_stall_lift_curve_slope               = S1
-    wing.pre_stall_maximum_drag_coefficient_angle = ACD1
+    stacked.pre_stall_maximum_lift_coefficient       = CL1max
+    stacked.pre_stall_maximum_lift_drag_coefficient  = CD1max
+    stacked.pre_stall_lift_curve_slope               = S1
+    stacked.pre_stall_maximum_drag_coefficient_angle = ACD1
     
-    return CL1max, CD1max, S1, ACD1
\ No newline at end of file
+    return CL1max, CD1max, S1, ACD1
@@ -3,6 +3,7 @@
 # 
 # Created:  Feb 2016, E. Botero
 # Modified: Jun 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -17,7 +18,7 @@ from SUAVE.Core import Units, Data
 
 ## @ingroup Methods-Aerodynamics-AERODAS
 def post_stall_coefficients(state,settings,geometry):
-    """Uses the AERODAS method to determine poststall parameters for lift and drag for a single wing
+    """Uses the AERODAS method to determine poststall parameters for lift and drag for all wings at once
 
     Assumptions:
     None
@@ -28,9 +29,13 @@ def post_stall_coefficients(state,settings,geometry):
 
     Inputs:
     settings.section_zero_lift_angle_of_attack      [radians]
-    geometry.
-      aspect_ratio                                  [Unitless]
-      thickness_to_chord                            [Unitless]
+    settings.wing_properties.
+      tags                                          [-]
+      vertical                                      [Boolean]
+      post_stall_maximum_drag_coefficient           [Unitless]
+      post_stall_lift_reduction                     [Unitless]
+      post_stall_lift_exponent                      [Unitless]
+    state.conditions.aerodynamics.wings_stacked.    (column for each wing)
       section.angle_attack_max_prestall_lift        [radians]
       pre_stall_maximum_lift_drag_coefficient       [Unitless]
       pre_stall_maximum_drag_coefficient_angle      [Unitless]
@@ -38,53 +43,41 @@ def post_stall_coefficients(state,settings,geometry):
       
 
     Outputs:
-    CL2 (coefficient of lift)                       [Unitless]
-    CD2 (coefficient of drag)                       [Unitless]
-    (packed in state.conditions.aerodynamics.post_stall_coefficients[geometry.tag])
+    CL2 (coefficient of lift, column for each wing) [Unitless]
+    CD2 (coefficient of drag, column for each wing) [Unitless]
+    (packed in state.conditions.aerodynamics.wings_stacked and 
+     state.conditions.aerodynamics.post_stall_coefficients[wing.tag])
 
     Properties Used:
     N/A
     """  
     
     # unpack inputs
-    wing   = geometry
-    A0     = settings.section_zero_lift_angle_of_attack
-    AR     = wing.aspect_ratio
-    t_c    = wing.thickness_to_chord
-    ACL1   = wing.section.angle_attack_max_prestall_lift 
-    CD1max = wing.pre_stall_maximum_lift_drag_coefficient
-    ACD1   = wing.pre_stall_maximum_drag_coefficient_angle
-    alpha  = state.conditions.aerodynamics.angle_of_attack
+    props   = settings.wing_properties
+    stacked = state.conditions.aerodynamics.wings_stacked
+    A0      = settings.section_zero_lift_angle_of_attack
+    ACL1    = stacked.section.angle_attack_max_prestall_lift 
+    CD1max  = stacked.pre_stall_maximum_lift_drag_coefficient
+    ACD1    = stacked.pre_stall_maximum_drag_coefficient_angle
+    alpha   = state.conditions.aerodynamics.angle_of_attack
     
-    if wing.vertical == True:
-        alpha = 0. * np.ones_like(alpha)    
-            
-    # Equation 9a and b
-    F1        = 1.190*(1.0-(t_c*t_c))
-    F2        = 0.65 + 0.35*np.exp(-(9.0/AR)**2.3)
+    # vertical wings see no angle of attack
+    alpha   = np.where(props.vertical,0.,alpha)
+    ones    = np.ones_like(alpha)
     
-    # Equation 10b and c
-    G1        = 2.3*np.exp(-(0.65*t_c)**0.9)
-    G2        = 0.52 + 0.48*np.exp(-(6.5/AR)**1.1)
-    
-    # Equation 8a and b
-    CL2max    = F1*F2
-    CD2max    = G1*G2
-    
-    # Equation 11d
-    RCL2      = 1.632-CL2max
-    
-    # Equation 11e
-    N2        = 1 + CL2max/RCL2
+    # Equation 8b, 11d and 11e only depend on the geometry
+    CD2max    = props.post_stall_maximum_drag_coefficient * ones
+    RCL2      = props.post_stall_lift_reduction * ones
+    N2        = props.post_stall_lift_exponent * ones
     
     # Equation 11a,b,c
     con1      = np.logical_and(0<alpha,alpha<ACL1)
     con2      = np.logical_and(ACL1<=alpha,alpha<=(92.0*Units.deg))
-    con3      = [alpha>=(92.0*Units.deg)]
-    CL2 = 0.0 * np.ones_like(state.conditions.freestream.altitude)
+    con3      = alpha>=(92.0*Units.deg)
+    CL2 = np.zeros_like(alpha)
     CL2[con1] =  0
-    CL2[con2] = -0.032*(alpha[con2]/Units.deg-92.0) - RCL2*((92.*Units.deg-alpha[con2])/(51.0*Units.deg))**N2
-    CL2[con3] = -0.032*(alpha[con3]/Units.deg-92.0) + RCL2*((alpha[con3]-92.*Units.deg)/(51.0*Units.deg))**N2
+    CL2[con2] = -0.032*(alpha[con2]/Units.deg-92.0) - RCL2[con2]*((92.*Units.deg-alpha[con2])/(51.0*Units.deg))**N2[con2]
+    CL2[con3] = -0.032*(alpha[con3]/Units.deg-92.0) + RCL2[con3]*((alpha[con3]-92.*Units.deg)/(51.0*Units.deg))**N2[con3]
     
     # If alpha is negative flip things for lift
     alphan    = - alpha+2*A0
@@ -92,29 +85,32 @@ def post_stall_coefficients(state,settings,geometry):
     con2      = np.logical_and(ACL1<=alphan, alphan<=(92.0*Units.deg))
     con3      = alphan>=(92.0*Units.deg)
     CL2[con1] =  0.
-    CL2[con2] = 0.032*(alphan[con2]/Units.deg-92.0) + RCL2*((92.*Units.deg-alphan[con2])/(51.0*Units.deg))**N2
-    CL2[con3] = 0.032*(alphan[con3]/Units.deg-92.0) - RCL2*((alphan[con3]-92.*Units.deg)/(51.0*Units.deg))**N2
+    CL2[con2] = 0.032*(alphan[con2]/Units.deg-92.0) + RCL2[con2]*((92.*Units.deg-alphan[con2])/(51.0*Units.deg))**N2[con2]
+    CL2[con3] = 0.032*(alphan[con3]/Units.deg-92.0) - RCL2[con3]*((alphan[con3]-92.*Units.deg)/(51.0*Units.deg))**N2[con3]
     
     # Equation 12a 
     con1      = np.logical_and((2*A0-ACL1)<alpha, alpha<ACL1)
     con2      = alpha>ACD1
-    CD2       = 0.0 * np.ones_like(state.conditions.freestream.altitude)
+    CD2       = np.zeros_like(alpha)
     CD2[con1] = 0.
-    CD2[con2] = CD1max[con2] + (CD2max - CD1max[con2]) * np.sin((alpha[con2]-ACD1[con2])/(np.pi/2-ACD1[con2]))
+    CD2[con2] = CD1max[con2] + (CD2max[con2] - CD1max[con2]) * np.sin((alpha[con2]-ACD1[con2])/(np.pi/2-ACD1[con2]))
     
     # If alpha is negative flip things for drag
     alphan    = -alpha + 2*A0
     con1      = np.logical_and((2*A0-ACL1)<alphan,alphan<ACL1)
     con2      = alphan>=ACD1
     CD2[con1] = 0.
-    CD2[con2] = CD1max[con2] + (CD2max - CD1max[con2]) * np.sin((alphan[con2]-ACD1[con2])/(np.pi/2-ACD1[con2]))        
+    CD2[con2] = CD1max[con2] + (CD2max[con2] - CD1max[con2]) * np.sin((alphan[con2]-ACD1[con2])/(np.pi/2-ACD1[con2]))        
         
     # Pack outputs
-    wing_result = Data(
-        lift_coefficient = CL2,
-        drag_coefficient = CD2
-        )
+    stacked.post_stall_lift_coefficient = CL2
+    stacked.post_stall_drag_coefficient = CD2
     
-    state.conditions.aerodynamics.post_stall_coefficients[wing.tag] =  wing_result
+    for i, tag in enumerate(props.tags):
+        wing_result = Data(
+            lift_coefficient = CL2[:,i:i+1],
+            drag_coefficient = CD2[:,i:i+1]
+            )
+        state.conditions.aerodynamics.post_stall_coefficients[tag] = wing_result
     
-    return CL2, CD2
\ No newline at end of file
+    return CL2, CD2
@@ -3,6 +3,7 @@
 # 
 # Created:  Feb 2016, E. Botero
 # Modified: Jun 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -17,7 +18,7 @@ from SUAVE.Core import Data
 
 ## @ingroup Methods-Aerodynamics-AERODAS
 def pre_stall_coefficients(state,settings,geometry):
-    """Uses the AERODAS method to determine prestall parameters for lift and drag for a single wing
+    """Uses the AERODAS method to determine prestall parameters for lift and drag for all wings at once
 
     Assumptions:
     None
@@ -29,7 +30,10 @@ def pre_stall_coefficients(state,settings,geometry):
     Inputs:
     state.conditions.aerodynamics.angle_of_attack
     settings.section_zero_lift_angle_of_attack
-    geometry.
+    settings.wing_properties.
+      tags
+      vertical
+    state.conditions.aerodynamics.wings_stacked. (column for each wing)
       section.
         angle_attack_max_prestall_lift
         zero_lift_drag_coefficient
@@ -39,28 +43,29 @@ def pre_stall_coefficients(state,settings,geometry):
       pre_stall_maximum_lift_drag_coefficient
 
     Outputs:
-    CL1 (coefficient of lift)                       [Unitless]
-    CD1 (coefficient of drag)                       [Unitless]
-    (packed in state.conditions.aerodynamics.pre_stall_coefficients[geometry.tag])
+    CL1 (coefficient of lift, column for each wing) [Unitless]
+    CD1 (coefficient of drag, column for each wing) [Unitless]
+    (packed in state.conditions.aerodynamics.wings_stacked and 
+     state.conditions.aerodynamics.pre_stall_coefficients[wing.tag])
 
     Properties Used:
     N/A
     """  
     
     # unpack inputs
-    wing   = geometry
-    alpha  = state.conditions.aerodynamics.angle_of_attack * 1.0
-    A0     = settings.section_zero_lift_angle_of_attack
-    ACL1   = wing.section.angle_attack_max_prestall_lift 
-    ACD1   = wing.pre_stall_maximum_drag_coefficient_angle
-    CL1max = wing.pre_stall_maximum_lift_coefficient
-    CD0    = wing.section.zero_lift_drag_coefficient
-    S1     = wing.pre_stall_lift_curve_slope  
-    CD1max = wing.pre_stall_maximum_lift_drag_coefficient
+    props   = settings.wing_properties
+    stacked = state.conditions.aerodynamics.wings_stacked
+    alpha   = state.conditions.aerodynamics.angle_of_attack * 1.0
+    A0      = settings.section_zero_lift_angle_of_attack
+    ACL1    = stacked.section.angle_attack_max_prestall_lift 
+    ACD1    = stacked.pre_stall_maximum_drag_coefficient_angle
+    CL1max  = stacked.pre_stall_maximum_lift_coefficient
+    CD0     = stacked.section.zero_lift_drag_coefficient
+    S1      = stacked.pre_stall_lift_curve_slope  
+    CD1max  = stacked.pre_stall_maximum_lift_drag_coefficient
     
-    if wing.vertical == True:
-        alpha = 0. * np.ones_like(alpha)
-        
+    # vertical wings see no angle of attack
+    alpha   = np.where(props.vertical,0.,alpha)
         
     # Equation 6c
     RCL1          = S1*(ACL1-A0)-CL1max
@@ -70,29 +75,31 @@ def pre_stall_coefficients(state,settings,geometry):
     N1            = 1 + CL1max/RCL1
     
     # Equation 6a or 6b depending on the alpha
-    CL1            = 0.0 * np.ones_like(state.conditions.freestream.altitude)
-    CL1[alpha>A0]  = S1*(alpha[alpha>A0]-A0)-RCL1[alpha>A0]*((alpha[alpha>A0]-A0)/(ACL1[alpha>A0]-A0))**N1[alpha>A0]
-    CL1[alpha==A0] = 0.0
-    CL1[alpha<A0]  = S1*(alpha[alpha<A0]-A0)+RCL1[alpha<A0]*((A0-alpha[alpha<A0])/(ACL1[alpha<A0]-A0))**N1[alpha<A0]
+    pos            = alpha>A0
+    neg            = alpha<A0
+    CL1            = np.zeros_like(alpha)
+    CL1[pos]       = S1[pos]*(alpha[pos]-A0)-RCL1[pos]*((alpha[pos]-A0)/(ACL1[pos]-A0))**N1[pos]
+    CL1[neg]       = S1[neg]*(alpha[neg]-A0)+RCL1[neg]*((A0-alpha[neg])/(ACL1[neg]-A0))**N1[neg]
     
     # M what is m?
     M              = 2.0 # Does this need changing
 
     # Equation 7a
     con      = np.logical_and((2*A0-ACD1)<=alpha,alpha<=ACD1)
-    CD1      = np.ones_like(state.conditions.freestream.altitude)
+    CD1      = np.zeros_like(alpha)
     CD1[con] = CD0[con] + (CD1max[con]-CD0[con])*((alpha[con] -A0)/(ACD1[con]-A0))**M    
     
-    # Equation 7b
-    CD1[np.logical_not(con)] = 0.
+    # Equation 7b is zero elsewhere
     
     # Pack outputs
-    wing_result = Data(
-        lift_coefficient = CL1,
-        drag_coefficient = CD1
-        )
-
-    state.conditions.aerodynamics.pre_stall_coefficients[wing.tag] =  wing_result
+    stacked.pre_stall_lift_coefficient = CL1
+    stacked.pre_stall_drag_coefficient = CD1
     
+    for i, tag in enumerate(props.tags):
+        wing_result = Data(
+            lift_coefficient = CL1[:,i:i+1],
+            drag_coefficient = CD1[:,i:i+1]
+            )
+        state.conditions.aerodynamics.pre_stall_coefficients[tag] = wing_result
 
-    return CL1, CD1
\ No newline at end of file
+    return CL1, CD1
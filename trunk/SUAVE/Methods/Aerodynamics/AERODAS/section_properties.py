@@ -2,6 +2,7 @@
 # 
 # Created:  Feb 2016, E. Botero
 # Modified: Jun 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,7 +16,7 @@ from SUAVE.Core import Units, Data
 # ----------------------------------------------------------------------
 
 def section_properties(state,settings,geometry):
-    """Determine wing section properties according to AERODAS methods
+    """Determine wing section properties according to AERODAS methods for all wings at once
 
     Assumptions:
     None
@@ -27,14 +28,14 @@ def section_properties(state,settings,geometry):
 
     Inputs:
     state.conditions.freestream.reynolds_number   [Unitless]
-    geometry.
-      chords.mean_aerodynamic                     [m]
-      thickness_to_chord                          [Unitless]
+    settings.wing_properties.
+      mean_aerodynamic_chord                      [m]
+      form_factor                                 [Unitless]
     settings.section_zero_lift_angle_of_attack    [radians]
     settings.section_lift_curve_slope             [1/radians]
 
     Outputs:
-    wing.section.
+    state.conditions.aerodynamics.wings_stacked.section. (column for each wing)
       maximum_coefficient_lift                    [Unitless]
       zero_lift_drag_coefficient                  [Unitless]
       angle_attack_max_prestall_lift              [radians]
@@ -46,22 +47,22 @@ def section_properties(state,settings,geometry):
     """  
     
     # Unpack
-    wing = geometry
-    re   = state.conditions.freestream.reynolds_number
-    mac  = wing.chords.mean_aerodynamic
-    tc   = wing.thickness_to_chord
-    A0   = settings.section_zero_lift_angle_of_attack
-    S1p  = settings.section_lift_curve_slope
+    props = settings.wing_properties
+    re    = state.conditions.freestream.reynolds_number
+    mac   = props.mean_aerodynamic_chord
+    k     = props.form_factor
+    A0    = settings.section_zero_lift_angle_of_attack
+    S1p   = settings.section_lift_curve_slope
     
-    # RE dimensionless
+    # RE dimensionless, one column per wing
     RE = re*mac
     
     # Calculate 2-D CLmax
     # From 241 A/B notes
-    Cl_max_ref = -0.0009*tc*tc*tc + 0.0217*tc*tc - 0.0442*tc + 0.7005
-    Re_ref     = 9.*10**6
+    #Cl_max_ref = -0.0009*tc*tc*tc + 0.0217*tc*tc - 0.0442*tc + 0.7005
+    #Re_ref     = 9.*10**6
     #CL1maxp = Cl_max_ref * ( RE / Re_ref ) **0.1
-    CL1maxp = 1.5 * np.ones_like(state.conditions.freestream.altitude)
+    CL1maxp = 1.5 * np.ones_like(RE)
     
     # Estimate the ACL1'
     ACLp = A0 + CL1maxp/S1p + 3. * Units.deg
@@ -70,14 +71,7 @@ def section_properties(state,settings,geometry):
     # First calculate CF, from AA 241 A/B Notes
     CF  = 0.455/(np.log(RE)**2.58)
     
-    # Find k, from AA 241 A/B Notes
-    beta2 = 1
-    C     = 1.1
-    k1    = 2.*C*tc
-    k2    = C*C*(1+5)**tc*tc/2.;
-    k     = 1 + k1 + k2;
-    
-    # Cd0
+    # Cd0, the form factor k only depends on the geometry
     Cd0 = k*CF
     
     # Estimate the CD1max'
@@ -88,11 +82,13 @@ def section_properties(state,settings,geometry):
     ACD1p = ACLp
     
     # Pack outputs
-    wing.section = Data()
-    wing.section.maximum_coefficient_lift                 = CL1maxp
-    wing.section.zero_lift_drag_coefficient               = Cd0
-    wing.section.angle_attack_max_prestall_lift           = ACLp
-    wing.section.pre_stall_maximum_drag_coefficient       = CD1maxp
-    wing.section.pre_stall_maximum_drag_coefficient_angle = ACD1p 
+    section = Data()
+    section.maximum_coefficient_lift                 = CL1maxp
+    section.zero_lift_drag_coefficient               = Cd0
+    section.angle_attack_max_prestall_lift           = ACLp
+    section.pre_stall_maximum_drag_coefficient       = CD1maxp
+    section.pre_stall_maximum_drag_coefficient_angle = ACD1p 
+    
+    state.conditions.aerodynamics.wings_stacked.section = section
     
-    return RE, CL1maxp, Cd0, ACLp, CD1maxp
\ No newline at end of file
+    return RE, CL1maxp, Cd0, ACLp, CD1maxp
@@ -2,7 +2,7 @@
 # Lifting_Line.py
 # 
 # Created:  Aug 2017, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 #           
 
 # ----------------------------------------------------------------------
@@ -10,6 +10,7 @@
 # ----------------------------------------------------------------------
 
 import numpy as np
+from scipy.linalg import lu_factor, lu_solve
 
 # ----------------------------------------------------------------------
 #  The Function
@@ -76,8 +77,6 @@ def lifting_line(conditions,settings,geometry):
     # Make sure alpha is 2D
     alpha = np.atleast_2d(alpha)
     
-    repeats = np.size(alpha)
-    
     # Need to set to something
     cla   = 2 * np.pi # 2-D lift curve slope
     azl   = 0. # 2-D 
@@ -95,30 +94,24 @@ def lifting_line(conditions,settings,geometry):
     n_segments   = len(segment_keys)
     # If spanwise stations are setup
     if n_segments>0:
+        
+        # Stack the segment break points, closing out the tip if needed
+        X = np.array([wing.Segments[key].percent_span_location for key in segment_keys])
+        L = np.array([wing.Segments[key].root_chord_percent    for key in segment_keys])
+        T = np.array([wing.Segments[key].twist                 for key in segment_keys])
+        
+        if X[-1] != 1.0:
+            X = np.append(X,1.0)
+            L = np.append(L,wing.chords.tip/wing.chords.root)
+            T = np.append(T,wing.twists.tip)
+        
+        # Interpolate all of the stations that fall inside the segments at once
         c    = np.ones_like(etan) * wing.chords.root
         ageo = np.ones_like(etan) * wing.twists.root 
-        for i_seg in xrange(n_segments):
-            
-            # Figure out where the segment starts
-            X1 = wing.Segments[segment_keys[i_seg]].percent_span_location
-            L1 = wing.Segments[segment_keys[i_seg]].root_chord_percent
-            T1 = wing.Segments[segment_keys[i_seg]].twist 
-
-            if i_seg == n_segments-1 and X1 != 1.0:
-                X2 = 1.0
-                L2 = wing.chords.tip/wing.chords.root
-                T2 = wing.twists.tip
-            else:
-                X2 = wing.Segments[segment_keys[i_seg+1]].percent_span_location
-                L2 = wing.Segments[segment_keys[i_seg+1]].root_chord_percent
-                T2 = wing.Segments[segment_keys[i_seg+1]].twist
-                
-                
-            bools  =  np.logical_and(etan>X1,etan<X2)
-                
-            c[bools]    = (L1 + (etan[bools]-X1)*(L2-L1)/(X2-X1)) * root_chord
-            ageo[bools] = (T1 + (etan[bools]-X1)*(T2-T1)/(X2-X1))
-                
+        
+        bools       = np.logical_and(etan>X[0],etan<X[-1])
+        c[bools]    = np.interp(etan[bools],X,L) * root_chord
+        ageo[bools] = np.interp(etan[bools],X,T)
 
     # Spanwise stations are not setup
     else:
@@ -134,17 +127,17 @@ def lifting_line(conditions,settings,geometry):
     
     n_trans = np.atleast_2d(n).T
         
-    # Right hand side matrix
+    # Right hand side matrix, this is independent of the angle of attack
     RHS = (np.sin(n_trans*thetan)*(np.sin(thetan)+n_trans*k))
     
-    # Expand out for all the angles of attack
-    RHS2 = np.tile(RHS.T, (repeats,1,1))
+    # Factor once for the wing
+    lu_piv = lu_factor(RHS.T)
 
-    # Left hand side vector    
+    # Left hand side vector, one column per angle of attack
     LHS = k*np.sin(thetan)*(alpha+ageo-azl)
         
     # The Fourier Coefficients
-    A = np.linalg.solve(RHS2,LHS)
+    A = lu_solve(lu_piv,LHS.T).T
     
     # The 3-D Coefficient of lift
     CL = A[:,0]*np.pi*AR
@@ -4,6 +4,7 @@
 # Created:  Aug 2014, T. MacDonald
 # Modified: Jun 2017, T. MacDonald
 #           Jul 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -46,6 +47,7 @@ def compressibility_drag_total(state,settings,geometry):
       nacelle_diameter                                               [m]
       engine_length                                                  [m]
       number_of_engines                                              [m]
+    settings.wave_drag_reference (built or rebuilt here if the geometry changed)
 
     Outputs:
     total_compressibility_drag                                       [Unitless]
@@ -72,44 +74,53 @@ def compressibility_drag_total(state,settings,geometry):
     # Use the vehicle for drag coefficients
     Sref_main = geometry.reference_area
     
+    # Get main fuselage data - note that name of fuselage is important here
+    # This should be changed to be general 
+    main_fuselage = fuselages['fuselage']
+    if not len(main_fuselage) > 0:
+        raise ValueError('Main fuselage does not have a total length')
+    
+    # Get number of engines data
+    num_engines = propulsor.number_of_engines    
+    
+    # The Mach 1.05 wave drag used to bridge the transonic gap only depends on the geometry
+    reference = settings.get('wave_drag_reference',None)
+    key       = wave_drag_reference_key(geometry)
+    if reference is None or reference.key != key:
+        reference = wave_drag_reference(configuration,geometry)
+        settings.wave_drag_reference = reference
+    
+    # Get the lift coefficient of the wings.
+    # Note that this is not the total CL
+    cl = conditions.aerodynamics.lift_breakdown.compressible_wings
+    
+    # Flight regimes
+    subsonic   = Mc <= 0.99
+    transonic  = np.logical_and((Mc > 0.99),(Mc < 1.05))
+    supersonic = Mc >= 1.05
+    
+    # The interpolation fraction across the transonic gap
+    fraction   = (Mc-0.99)/(1.05-0.99)
 
     # Iterate through wings
     for k in wings.keys():
         
         wing = wings[k]
-
-        # initialize array to correct length
-        cd_c = np.array([[0.0]] * len(Mc))
-        mcc = np.array([[0.0]] * len(Mc))
-        MDiv = np.array([[0.0]] * len(Mc))     
-
-
-        # Get main fuselage data - note that name of fuselage is important here
-        # This should be changed to be general 
-        main_fuselage = fuselages['fuselage']
-
-        # Get number of engines data
-        num_engines = propulsor.number_of_engines
-
-        # Get the lift coefficient of the wing.
-        # Note that this is not the total CL
-        cl = conditions.aerodynamics.lift_breakdown.compressible_wings
-
-        # Calculate compressibility drag at Mach 0.99 and 1.05 for interpolation between
-        (drag99,a,b) = drag_div(np.array([[0.99]] * len(Mc)),wing,k,cl,Sref_main)
-        (drag105,a,b,cd_c_l_105,cd_c_v_105) = wave_drag(conditions, 
-                                  configuration, 
-                                  main_fuselage, 
-                                  propulsor, 
-                                  wing, 
-                                  num_engines,k,Sref_main,True)
-
-        # For subsonic mach numbers, use drag divergence correlations to find the drag
-        (cd_c[Mc[:,0] <= 0.99],mcc[Mc[:,0] <= 0.99], MDiv[Mc[:,0] <= 0.99]) = drag_div(Mc[Mc[:,0] <= 0.99],wing,k,cl[Mc[:,0] <= 0.99],Sref_main)
-
-        # For mach numbers close to 1, use an interpolation to avoid intensive calculations
-        cd_c[Mc > 0.99] = drag99[Mc > 0.99] + (drag105[Mc > 0.99]-drag99[Mc > 0.99])*(Mc[Mc > 0.99]-0.99)/(1.05-0.99)
-
+        
+        # Above Mach 0.99 the drag divergence fit is held at Mach 0.99 for the interpolation,
+        # so a single evaluation covers the subsonic points and the Mach 0.99 end point
+        (cd_div,mcc_div,MDiv_div) = drag_div(np.fmin(Mc,0.99),wing,k,cl,Sref_main)
+        drag99 = cd_div * np.ones_like(Mc)
+        
+        # Calculate the wave drag at Mach 1.05 from the stored reference values
+        if wing.vertical:
+            cl_w = np.zeros_like(Mc)
+        else:
+            cl_w = conditions.aerodynamics.lift_breakdown.inviscid_wings_lift[k]
+        cd_c_l_105 = reference.wings[k].lift_wave_drag_factor*cl_w*cl_w
+        cd_c_v_105 = reference.wings[k].volume_wave_drag * np.ones_like(Mc)
+        drag105    = cd_c_l_105 + cd_c_v_105
+        
         # Use wave drag equations at supersonic values. The cutoff for this function is 1.05
         # Only the supsonic results are returned with nonzero values
         (cd_c_sup,mcc_sup,MDiv_sup,cd_c_l,cd_c_v) = wave_drag(conditions, 
@@ -117,15 +128,20 @@ def compressibility_drag_total(state,settings,geometry):
                                                 main_fuselage, 
                                                 propulsor, 
                                                 wing, 
-                                                num_engines,k,Sref_main,False)
+                                                num_engines,k,Sref_main,False)        
+
+        # For subsonic mach numbers, use drag divergence correlations to find the drag
+        # For mach numbers close to 1, use an interpolation to avoid intensive calculations
+        cd_c = np.where(subsonic,cd_div,drag99 + (drag105-drag99)*fraction)
+        mcc  = np.where(subsonic,mcc_div,0.)
+        MDiv = np.where(subsonic,MDiv_div,0.)
         
         # assume compressibility drag at .99 is due to volume wave drag
-        c_inds = np.logical_and((Mc > 0.99),(Mc < 1.05))     
-        cd_c_l[c_inds] = 0. + (cd_c_l_105[c_inds])*(Mc[c_inds]-0.99)/(1.05-0.99)
-        cd_c_v[c_inds] = drag99[c_inds] + (cd_c_v_105[c_inds]-drag99[c_inds])*(Mc[c_inds]-0.99)/(1.05-0.99)
+        cd_c_l[transonic] = (cd_c_l_105*fraction)[transonic]
+        cd_c_v[transonic] = (drag99 + (cd_c_v_105-drag99)*fraction)[transonic]
 
         # Incorporate supersonic results into total compressibility drag coefficient
-        (cd_c[Mc >= 1.05],mcc[Mc >= 1.05], MDiv[Mc >= 1.05]) = (cd_c_sup[Mc >= 1.05],mcc_sup[Mc >= 1.05],MDiv_sup[Mc >= 1.05])
+        cd_c[supersonic] = cd_c_sup[supersonic]
 
         # Dump data to conditions
         wing_results = Data(
@@ -137,27 +153,11 @@ def compressibility_drag_total(state,settings,geometry):
         )
         drag_breakdown.compressible[k] = wing_results        
     
-    # Initialize arrays
-    mach       = conditions.freestream.mach_number
-    prop_drag = np.array([[0.0]] * len(mach))
-    fuse_drag = np.array([[0.0]] * len(mach))
-
-    # Fuselage wave drag
-    if len(main_fuselage) > 0:
-        fuse_wave = wave_drag_body_of_rev(main_fuselage.lengths.total,main_fuselage.effective_diameter/2.0,Sref_main)
-        fuse_drag[mach >= .99]  = fuse_wave*(mach[mach>=.99]-.99)/1.05
-        fuse_drag[mach >= 1.05] = fuse_wave
-    else:
-        raise ValueError('Main fuselage does not have a total length')
-
-    # Propulsor wave drag	
-    Dn                      = propulsor.nacelle_diameter
-    Di                      = propulsor.inlet_diameter
-    effective_area          = (Dn*Dn-Di*Di)/4.*np.pi
-    effective_radius        = np.sqrt(effective_area/np.pi)
-    prop_wave               = wave_drag_body_of_rev(propulsor.engine_length,effective_radius,Sref_main)*propulsor.number_of_engines
-    prop_drag[mach >= .99]  = prop_wave*(mach[mach>=.99]-.99)/1.05
-    prop_drag[mach >= 1.05] = prop_wave    
+    # Fuselage and propulsor wave drag, ramped in from Mach 0.99
+    mach      = conditions.freestream.mach_number
+    ramp      = np.where(mach >= 1.05, 1., np.where(mach >= .99, (mach-.99)/1.05, 0.))
+    fuse_drag = reference.fuselage_wave_drag*ramp
+    prop_drag = reference.propulsor_wave_drag*ramp
     
     drag_breakdown.compressible[main_fuselage.tag] = fuse_drag
     drag_breakdown.compressible[propulsor.tag] = prop_drag
@@ -182,6 +182,122 @@ def compressibility_drag_total(state,settings,geometry):
     return total_compressibility_drag
 
 
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def wave_drag_reference(configuration,geometry):
+    """Computes the geometry dependent wave drag values at Mach 1.05 used to 
+    interpolate across the transonic gap
+
+    Assumptions:
+    Lift wave drag scales with the square of the wing lift coefficient
+    Main fuselage must have tag 'fuselage'
+
+    Source:
+    adg.stanford.edu (Stanford AA241 A/B Course Notes)
+
+    Inputs:
+    configuration                                                    (passed to wave drag functions)
+    geometry.
+      reference_area                                                 [m^2]
+      wings.*.
+        total_length                                                 [m]
+        areas.reference                                              [m^2]
+        thickness_to_chord                                           [Unitless]
+      fuselages['fuselage'].
+        lengths.total                                                [m]
+        effective_diameter                                           [m]
+      propulsors[geometry.propulsors.keys()[0]].
+        nacelle_diameter                                             [m]
+        inlet_diameter                                               [m]
+        engine_length                                                [m]
+        number_of_engines                                            [-]
+
+    Outputs:
+    reference.
+      key                                                            [-]
+      wings[wing.tag].lift_wave_drag_factor (per unit wing CL^2)     [Unitless]
+      wings[wing.tag].volume_wave_drag                               [Unitless]
+      fuselage_wave_drag                                             [Unitless]
+      propulsor_wave_drag                                            [Unitless]
+
+    Properties Used:
+    N/A
+    """     
+    
+    # Unpack
+    Sref_main     = geometry.reference_area
+    main_fuselage = geometry.fuselages['fuselage']
+    propulsor     = geometry.propulsors[geometry.propulsors.keys()[0]]
+    
+    # A single condition at Mach 1.05 with a unit lift coefficient on every wing
+    konditions = Data()
+    konditions.freestream   = Data()
+    konditions.aerodynamics = Data()
+    konditions.aerodynamics.lift_breakdown = Data()
+    konditions.freestream.mach_number      = np.array([[1.05]])
+    konditions.aerodynamics.lift_coefficient = np.array([[1.]])
+    konditions.aerodynamics.lift_breakdown.inviscid_wings_lift = Data()
+    for k in geometry.wings.keys():
+        konditions.aerodynamics.lift_breakdown.inviscid_wings_lift[k] = np.array([[1.]])
+    
+    reference = Data()
+    reference.key   = wave_drag_reference_key(geometry)
+    reference.wings = Data()
+    
+    for k, wing in geometry.wings.items():
+        (cd_c,mcc,MDiv,cd_c_l,cd_c_v) = wave_drag(konditions,configuration,main_fuselage,propulsor,wing,
+                                                  propulsor.number_of_engines,k,Sref_main,False)
+        reference.wings[k] = Data()
+        reference.wings[k].lift_wave_drag_factor = cd_c_l[0,0]
+        reference.wings[k].volume_wave_drag      = cd_c_v[0,0]
+        
+    # Fuselage wave drag
+    reference.fuselage_wave_drag = wave_drag_body_of_rev(main_fuselage.lengths.total,main_fuselage.effective_diameter/2.0,Sref_main)
+    
+    # Propulsor wave drag	
+    Dn                      = propulsor.nacelle_diameter
+    Di                      = propulsor.inlet_diameter
+    effective_area          = (Dn*Dn-Di*Di)/4.*np.pi
+    effective_radius        = np.sqrt(effective_area/np.pi)
+    reference.propulsor_wave_drag = wave_drag_body_of_rev(propulsor.engine_length,effective_radius,Sref_main)*propulsor.number_of_engines
+    
+    return reference
+
+
+## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
+def wave_drag_reference_key(geometry):
+    """Collects the geometry values that the Mach 1.05 reference wave drag depends on,
+    so stored reference values can be checked against the current geometry
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    See wave_drag_reference
+
+    Outputs:
+    key                                                              <tuple>
+
+    Properties Used:
+    N/A
+    """ 
+    
+    main_fuselage = geometry.fuselages['fuselage']
+    propulsor     = geometry.propulsors[geometry.propulsors.keys()[0]]
+    
+    wing_keys = tuple([(k,wing.total_length,wing.areas.reference,wing.thickness_to_chord,wing.vertical) \
+                       for k,wing in geometry.wings.items()])
+    
+    key = (geometry.reference_area, wing_keys,
+           main_fuselage.lengths.total, main_fuselage.effective_diameter,
+           propulsor.nacelle_diameter, propulsor.inlet_diameter, 
+           propulsor.engine_length, propulsor.number_of_engines)
+    
+    return key
+
+
 ## @ingroup Methods-Aerodynamics-Supersonic_Zero-Drag
 def drag_div(Mc_ii,wing,k,cl,Sref_main):
     """Use drag divergence mach number to determine drag for subsonic speeds
@@ -3,12 +3,16 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 from SUAVE.Core.Arrays import atleast_2d_col 
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_coefficients
+
+import numpy as np
 
 # ----------------------------------------------------------------------
 #  Initialize Differentials
@@ -104,4 +108,49 @@ def update_differentials_time(segment,state):
     numerics.time.integrate      = I
 
     return
-    
\ No newline at end of file
+
+# ----------------------------------------------------------------------
+#  Estimate Interpolation Error
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def estimate_interpolation_error(segment,state):
+    """ Estimates how well the control points resolve a solved segment from the Chebyshev coefficients of its
+        unknowns. For each column of the unknowns the last two coefficients are compared to the largest one.
+    
+        Assumptions:
+        The segment uses chebyshev_data
+        Unknowns without a row for every control point are left out
+        
+        Inputs:
+            state.unknowns                    [Data]
+            state.numerics:
+                number_control_points         [int]
+            
+        Outputs:
+            state.numerics.interpolation_error [Unitless]
+
+        Properties Used:
+        N/A
+                                
+    """     
+    
+    N     = state.numerics.number_control_points
+    error = 0.
+    
+    for unknown in state.unknowns.values():
+        if np.ndim(unknown) != 2 or len(unknown) != N or N < 3:
+            continue
+        
+        a     = np.abs(chebyshev_coefficients(unknown))
+        scale = np.max(a,axis=0)
+        tail  = np.max(a[-2:,:],axis=0)
+        
+        resolved = scale == 0.
+        scale[resolved] = 1.
+        error = max(error,np.max(tail/scale))
+    
+    state.numerics.interpolation_error = error
+    
+    return error
+
@@ -5,6 +5,7 @@
 # Modified: Jan 2016, E. Botero
 #           Mar 2016, E. Botero
 #           Jul 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,10 @@
 
 from copy import deepcopy
 from SUAVE.Analyses import Process
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, chebyshev_interpolation
+from Numerics import estimate_interpolation_error
+
+import numpy as np
 
 # ----------------------------------------------------------------------
 #  Expand Sub Segments
@@ -138,5 +143,83 @@ def sequential_sub_segments(segment,state):
     """       
     
     
+    last_tag = None
+    
     for tag,sub_segment in segment.segments.items():
-        sub_segment.evaluate(state.segments[tag])
\ No newline at end of file
+        
+        # a refined segment has a new state, so point the next segment to it
+        if last_tag:
+            state.segments[tag].initials = state.segments[last_tag]
+        last_tag = tag
+        
+        sub_segment.evaluate(state.segments[tag])
+        
+        if state.segments[tag].numerics.adaptive_refinement:
+            refine_sub_segment(segment,state,tag)
+        
+# ----------------------------------------------------------------------
+#  Refine Sub Segment
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def refine_sub_segment(segment,state,tag):
+    
+    """ Solves a segment again with more control points, until the estimated interpolation error of its unknowns
+        is below the tolerance. Each time the number of points goes from N to 2N-1, which keeps the old points, and
+        the unknowns of the last solution are interpolated to the new points as the initial guess.
+    
+        Assumptions:
+        The segment uses chebyshev_data
+        
+        Inputs:
+        state.segments[tag].numerics:
+            tolerance_interpolation     [Unitless]
+            maximum_control_points      [int]
+            
+        Outputs:
+        state.segments[tag]             [State]
+
+        Properties Used:
+        N/A
+                                
+    """       
+    
+    sub_segment = segment.segments[tag]
+    sub_state   = state.segments[tag]
+    numerics    = sub_state.numerics
+    
+    if numerics.discretization_method is not chebyshev_data:
+        return
+    
+    while estimate_interpolation_error(sub_segment,sub_state) > numerics.tolerance_interpolation:
+        
+        N     = numerics.number_control_points
+        N_new = min(2*N-1,numerics.maximum_control_points)
+        if N_new <= N:
+            break
+        
+        if Process.verbose:
+            print 'segment refine :' , tag, N_new
+            
+        # a fresh state with the new number of points
+        new_state          = deepcopy( sub_segment.state )
+        new_state.initials = sub_state.initials
+        new_state.numerics.number_control_points = N_new
+        new_state.expand_rows(N_new)
+        
+        # the old solution is the initial guess
+        x = 0.5*(1 - np.cos(np.pi*np.arange(0,N_new)/(N_new-1)))
+        P = chebyshev_interpolation(N,x)
+        for key,unknown in sub_state.unknowns.items():
+            if np.ndim(unknown) == 2 and len(unknown) == N:
+                new_state.unknowns[key] = np.dot(P,unknown)
+                
+        sub_segment.evaluate(new_state)
+        
+        sub_state = new_state
+        numerics  = sub_state.numerics
+        
+        state.segments[tag]     = sub_state
+        state.unknowns[tag]     = sub_state.unknowns
+        state.conditions[tag]   = sub_state.conditions
+        state.residuals[tag]    = sub_state.residuals
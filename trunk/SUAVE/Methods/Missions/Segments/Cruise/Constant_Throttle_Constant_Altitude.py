@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -61,7 +62,7 @@ def initialize_conditions(segment,state):
     segment.air_speed_start                      [meters/second]
     segment.air_speed_end                        [meters/second]
     segment.throttle	                         [unitless]
-    segment.state.numerics.number_control_points [int]
+    state.numerics.number_control_points         [int]
 
     Outputs:
     state.conditions.propulsion.throttle        [unitless]
@@ -79,7 +80,7 @@ def initialize_conditions(segment,state):
     v0       = segment.air_speed_start
     vf       = segment.air_speed_end
     throttle = segment.throttle	
-    N        = segment.state.numerics.number_control_points   
+    N        = state.numerics.number_control_points   
     
     # check for initial altitude
     if alt is None:
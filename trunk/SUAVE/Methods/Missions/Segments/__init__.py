@@ -5,6 +5,7 @@
 from converge_root import converge_root
 from expand_state  import expand_state
 from optimize      import converge_opt
+from converge_block_sparse import converge_block_sparse
 
 import Common
 import Cruise
@@ -0,0 +1,230 @@
+## @ingroup Methods-Missions-Segments
+# converge_block_sparse.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import scipy.linalg
+
+from converge_root import converge_root
+
+# ----------------------------------------------------------------------
+#  Converge Block Sparse
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def converge_block_sparse(segment,state):
+    """Solves all the sub segments of a mission at once with Newton's method, using the structure of the mission.
+    The residuals of a sub segment depend on its own unknowns and, through its initials, on the sub segments before
+    it, so the jacobian of the mission is block lower triangular. Its LU factorization is the LU factorization of
+    each diagonal block.
+    
+    The diagonal blocks are found by finite differences, flying only the sub segment that is stepped. A Newton step
+    then goes through the sub segments in order: each one is flown from the initials left by the steps before it,
+    which applies the blocks below the diagonal, and its step is solved with its own block. The block of a sub
+    segment is kept between Newton steps until its residuals stop falling quickly.
+    
+    The work for a jacobian grows with the number of sub segments, where a dense jacobian of the whole mission grows
+    with its square.
+
+    Assumptions:
+    A mission with unknowns or residuals of its own is solved with converge_root
+
+    Source:
+    N/A
+
+    Inputs:
+    state.segments                     [Data]
+    segment.segments                   [Data]
+    state.numerics.tolerance_solution  [Unitless]
+
+    Outputs:
+    state.unknowns                     [Any]
+    segment.state.numerics.converged   [Unitless]
+
+    Properties Used:
+    N/A
+    """       
+    
+    tags = segment.segments.keys()
+    
+    # The mission has to be only its sub segments
+    for key in state.unknowns.keys() + state.residuals.keys():
+        if key != 'tag' and not key in tags:
+            return converge_root(segment,state)
+    
+    max_iterations = 50
+    stall_ratio    = 0.5
+    xtol           = state.numerics.tolerance_solution
+    
+    unknowns  = [state.segments[tag].unknowns.pack_array() for tag in tags]
+    residuals = fly_sub_segments(segment,state,tags,unknowns)
+    
+    blocks    = [None] * len(tags)
+    converged = np.linalg.norm(residuals) == 0.
+    
+    for iteration in xrange(max_iterations):
+        if converged:
+            break
+        
+        blocks = block_jacobian(segment,state,tags,unknowns,blocks)
+        
+        # Go down the block triangular system
+        step          = []
+        new_residuals = []
+        for k,tag in enumerate(tags):
+            sub_segment = segment.segments[tag]
+            sub_state   = state.segments[tag]
+            
+            sub_step = np.zeros(len(unknowns[k]))
+            if len(sub_step):
+                sub_residuals = fly_sub_segment(sub_segment,sub_state,unknowns[k])
+                sub_step      = -scipy.linalg.lu_solve(blocks[k],sub_residuals)
+                if not np.all(np.isfinite(sub_step)):
+                    return converge_root(segment,state)
+                
+            step.append(sub_step)
+            new_residuals.append(fly_sub_segment(sub_segment,sub_state,unknowns[k] + sub_step))
+        
+        u             = np.hstack(unknowns)
+        unknowns      = [u_k + step_k for u_k,step_k in zip(unknowns,step)]
+        new_residuals = np.hstack(new_residuals)
+        step          = np.hstack(step)
+        
+        # Only the blocks of sub segments that stopped converging are found again
+        sizes = np.cumsum([len(state.segments[tag].residuals.pack_array()) for tag in tags])[:-1]
+        for k,(old,new) in enumerate(zip(np.split(residuals,sizes),np.split(new_residuals,sizes))):
+            if np.linalg.norm(new) > max(stall_ratio * np.linalg.norm(old),xtol):
+                blocks[k] = None
+        
+        residuals = new_residuals
+        converged = np.linalg.norm(step) <= xtol * (np.linalg.norm(u) + xtol)
+        
+    if not converged:
+        print "Segment did not converge. Segment Tag: " + segment.tag
+        print "Error Message:\n" + "The iteration is not making good progress"
+        segment.state.numerics.converged = False
+    else:
+        segment.state.numerics.converged = True
+        
+    return
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def fly_sub_segment(sub_segment,sub_state,unknowns):
+    """Flies one sub segment with a set of unknowns, from its current initials.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                      [array]
+    sub_segment                   [Data]
+    sub_state                     [Data]
+
+    Outputs:
+    residuals                     [array]
+
+    Properties Used:
+    N/A
+    """       
+    
+    sub_state.unknowns.unpack_array(unknowns)
+    
+    sub_segment.initialize(sub_state)
+    sub_segment.iterate(sub_state)
+    sub_segment.finalize(sub_state)
+    
+    return sub_state.residuals.pack_array()
+
+## @ingroup Methods-Missions-Segments
+def fly_sub_segments(segment,state,tags,unknowns):
+    """Flies all the sub segments in order, as update_sub_segments.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    tags                          [list]
+    unknowns                      [list of arrays]
+    segment                       [Data]
+    state                         [Data]
+
+    Outputs:
+    residuals                     [array]
+
+    Properties Used:
+    N/A
+    """       
+    
+    residuals = []
+    for tag,sub_unknowns in zip(tags,unknowns):
+        residuals.append(fly_sub_segment(segment.segments[tag],state.segments[tag],sub_unknowns))
+        
+    return np.hstack(residuals)
+
+## @ingroup Methods-Missions-Segments
+def block_jacobian(segment,state,tags,unknowns,blocks):
+    """Finds the missing diagonal blocks of the jacobian of a mission by finite differences and factors them. Each
+    unknown of a sub segment is stepped and only that sub segment is flown. Afterwards the sub segments are left
+    flown with the unknowns.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    tags                          [list]
+    unknowns                      [list of arrays]
+    blocks                        [list of LU factorizations, None where missing]
+    segment                       [Data]
+    state                         [Data]
+
+    Outputs:
+    blocks                        [list of LU factorizations]
+
+    Properties Used:
+    N/A
+    """       
+    
+    blocks = list(blocks)
+    
+    for k,tag in enumerate(tags):
+        sub_segment = segment.segments[tag]
+        sub_state   = state.segments[tag]
+        
+        if blocks[k] is not None or len(unknowns[k]) == 0:
+            continue
+        
+        base  = fly_sub_segment(sub_segment,sub_state,unknowns[k])
+        block = np.zeros((len(base),len(unknowns[k])))
+        
+        for i in xrange(len(unknowns[k])):
+            step     = unknowns[k]*1.
+            h        = np.sqrt(np.finfo(float).eps) * max(abs(step[i]),1.)
+            step[i] += h
+            
+            block[:,i] = (fly_sub_segment(sub_segment,sub_state,step) - base)/h
+            
+        # Put the sub segment back for the next one
+        fly_sub_segment(sub_segment,sub_state,unknowns[k])
+        
+        blocks[k] = scipy.linalg.lu_factor(block)
+    
+    return blocks
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -96,7 +97,7 @@ def iterate(unknowns,(segment,state)):
     else:
         state.unknowns = unknowns
         
-    segment.process.iterate(segment,state)
+    segment.process.iterate.execute(segment,state)
     
     residuals = state.residuals.pack_array()
         
@@ -3,6 +3,7 @@
 # 
 # Created:  Dec 2016, E. Botero
 # Modified: Jun 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -33,6 +34,8 @@ def converge_opt(segment,state):
     segment                            [Data]
     state                              [Data]
     segment.algorithm                  [string]
+    segment.gradient_method            [string]
+    segment.gradient_restarts          [int]
 
     Outputs:
     state.unknowns                     [Any]
@@ -54,7 +57,26 @@ def converge_opt(segment,state):
     
     # Solve the problem, based on chosen algorithm
     if segment.algorithm == 'SLSQP':
-        unknowns = opt.fmin_slsqp(obj,unknowns,f_eqcons=econ,f_ieqcons=iecon,bounds=bnds,iter=2000)
+        if segment.gradient_method == 'finite_difference':
+            unknowns = opt.fmin_slsqp(obj,unknowns,f_eqcons=econ,f_ieqcons=iecon,bounds=bnds,iter=2000)
+        else:
+            # All the gradients come from one sweep of the mission
+            dobj   = lambda unknowns:get_gradients(unknowns,(segment,state))[0]
+            decon  = lambda unknowns:get_gradients(unknowns,(segment,state))[1]
+            diecon = lambda unknowns:get_gradients(unknowns,(segment,state))[2]
+            for restart in xrange(segment.gradient_restarts+1):
+                unknowns = opt.fmin_slsqp(obj,unknowns,f_eqcons=econ,f_ieqcons=iecon,fprime=dobj,fprime_eqcons=decon,
+                                          fprime_ieqcons=diecon,bounds=bnds,iter=2000)
+                
+                # Step each unknown on its own at the answer, if that finds outputs the sparsity missed SLSQP
+                # worked with wrong gradients and is run again
+                sparsity = state.jacobian_sparsity
+                get_gradients(unknowns,(segment,state),full_sweep=True)
+                if np.all(state.jacobian_sparsity == sparsity):
+                    break
+                
+            # Leave the mission at the answer
+            get_outputs(unknowns,(segment,state))
         
     elif segment.algorithm == 'SNOPT':
         
@@ -118,8 +140,8 @@ def get_objective(unknowns,(segment,state)):
     else:
         state.unknowns = unknowns
         
-    if not np.all(state.inputs_last == state.unknowns):       
-        segment.process.iterate(segment,state)
+    if not np.all(state.inputs_last == state.unknowns.pack_array()):       
+        segment.process.iterate.execute(segment,state)
         
     objective = state.objective_value
     
@@ -148,13 +170,153 @@ def get_econstraints(unknowns,(segment,state)):
     else:
         state.unknowns = unknowns
         
-    if not np.all(state.inputs_last == state.unknowns):       
-        segment.process.iterate(segment,state)
+    if not np.all(state.inputs_last == state.unknowns.pack_array()):       
+        segment.process.iterate.execute(segment,state)
 
     constraints = state.constraint_values
     
     return constraints
 
+## @ingroup Methods-Missions-Segments
+def get_gradients(unknowns,(segment,state),full_sweep=False):
+    """ Finds the gradient of the objective and the jacobians of the equality and inequality constraints together
+        by finite differences. Each step of the unknowns flies the mission once and gives a column of all three,
+        rather than one sweep for each.
+        
+        The first sweep steps each unknown on its own, which also gives the sparsity of the jacobian. After that
+        unknowns that never change the same output are stepped together (a column coloring), so each sweep
+        takes as many missions as there are colors. Every gradient_full_sweep_interval sweeps, or when asked
+        for, each unknown is stepped on its own again. The outputs each unknown changed are added to the
+        sparsity, which is never made smaller, and the columns are colored again.
+        
+        Assumptions:
+        Between the sweeps that step each unknown on its own, an output that has not changed for a step of an
+        unknown does not change for it
+        
+        Inputs:
+        state.unknowns                 [Data]
+        segment.gradient_step          [Unitless]
+        segment.gradient_full_sweep_interval [int]
+        full_sweep                     [bool]
+        state.jacobian_colors          [array]
+        state.jacobian_sparsity        [array]
+        state.gradient_sweeps          [int]
+            
+        Outputs:
+        objective gradient             [array]
+        equality constraint jacobian   [array]
+        inequality constraint jacobian [array]
+
+        Properties Used:
+        N/A
+                                
+    """
+    
+    unknowns = np.array(unknowns,dtype=float)
+    
+    # The same unknowns ask for the same gradients
+    if not full_sweep and state.gradients_last is not None and np.all(state.gradients_last == unknowns):
+        return state.gradients
+    
+    base  = get_outputs(unknowns,(segment,state))
+    h     = segment.gradient_step
+    n_obj = 1
+    n_eq  = len(np.atleast_1d(state.constraint_values))
+    
+    colors   = state.jacobian_colors
+    sparsity = state.jacobian_sparsity
+    if colors is None or state.gradient_sweeps % segment.gradient_full_sweep_interval == 0:
+        full_sweep = True
+    if full_sweep:
+        colors = np.arange(len(unknowns))
+    
+    jacobian = np.zeros((len(base),len(unknowns)))
+    for color in xrange(np.max(colors)+1):
+        columns = np.where(colors==color)[0]
+        step    = unknowns*1.
+        step[columns] += h
+        change  = (get_outputs(step,(segment,state)) - base)/h
+        
+        # Each output belongs to the one column of this color that can change it
+        for column in columns:
+            if full_sweep:
+                jacobian[:,column] = change
+            else:
+                jacobian[sparsity[:,column],column] = change[sparsity[:,column]]
+                
+    if full_sweep:
+        pattern = jacobian != 0.
+        if sparsity is not None:
+            pattern = pattern | sparsity
+        state.jacobian_sparsity = pattern
+        state.jacobian_colors   = color_columns(pattern)
+        
+    state.gradient_sweeps += 1
+    state.gradients_last = unknowns
+    state.gradients      = (jacobian[0,:],jacobian[n_obj:n_obj+n_eq,:],jacobian[n_obj+n_eq:,:])
+    
+    return state.gradients
+
+## @ingroup Methods-Missions-Segments
+def get_outputs(unknowns,(segment,state)):
+    """ Runs the mission if needed and stacks the objective, the equality constraints, and the inequality
+        constraints into one array
+    
+        Assumptions:
+        N/A
+        
+        Inputs:
+        state.unknowns      [Data]
+            
+        Outputs:
+        outputs             [array]
+
+        Properties Used:
+        N/A
+                                
+    """      
+    
+    objective   = get_objective(unknowns,(segment,state))
+    econstraint = get_econstraints(unknowns,(segment,state))
+    ieconstraint= get_ieconstraints(unknowns,(segment,state))
+    
+    outputs = np.concatenate((np.atleast_1d(objective),np.atleast_1d(econstraint),ieconstraint))
+    
+    return outputs
+
+## @ingroup Methods-Missions-Segments
+def color_columns(sparsity):
+    """ Groups the columns of a jacobian so that no two columns of a group have a nonzero in the same row. The
+        columns are colored greedily, in order.
+    
+        Assumptions:
+        N/A
+        
+        Inputs:
+        sparsity            [array of booleans]
+            
+        Outputs:
+        colors              [array of ints]
+
+        Properties Used:
+        N/A
+                                
+    """      
+    
+    colors = np.zeros(len(sparsity[0,:]),dtype=int)
+    rows   = []
+    
+    for column in xrange(len(colors)):
+        for color in xrange(len(rows)+1):
+            if color == len(rows):
+                rows.append(np.zeros(len(sparsity[:,0]),dtype=bool))
+            if not np.any(rows[color] & sparsity[:,column]):
+                break
+        colors[column] = color
+        rows[color]    = rows[color] | sparsity[:,column]
+        
+    return colors
+
 ## @ingroup Methods-Missions-Segments
 def make_bnds(unknowns,(segment,state)):
     """ Automatically sets the bounds of the optimization.
@@ -219,8 +381,8 @@ def get_ieconstraints(unknowns,(segment,state)):
     else:
         state.unknowns = unknowns
         
-    if not np.all(state.inputs_last == state.unknowns):       
-        segment.process.iterate(segment,state)
+    if not np.all(state.inputs_last == state.unknowns.pack_array()):       
+        segment.process.iterate.execute(segment,state)
     
     # Time goes forward, not backward
     t_final = state.conditions.frames.inertial.time[-1,0]
@@ -264,8 +426,8 @@ def get_problem_pyopt(unknowns,(segment,state)):
     else:
         state.unknowns = unknowns
         
-    if not np.all(state.inputs_last == state.unknowns):       
-        segment.process.iterate(segment,state)
+    if not np.all(state.inputs_last == state.unknowns.pack_array()):       
+        segment.process.iterate.execute(segment,state)
         
     obj      = state.objective_value
     
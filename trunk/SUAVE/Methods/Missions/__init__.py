@@ -2,4 +2,6 @@
 # Mission methods contain the functions for setting up and solving a mission.
 # @ingroup Methods
 
-import Segments
\ No newline at end of file
+import Segments
+
+from mission_sweep import mission_sweep
@@ -0,0 +1,255 @@
+## @ingroup Methods-Missions
+# mission_sweep.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from copy import deepcopy
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Missions.warm_start import segment_templates, restore_templates, segment_unknowns, seed_unknowns
+
+# ----------------------------------------------------------------------
+#  Mission Sweep
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions
+def mission_sweep(mission,parameters,values,outputs=[],minimum_step=1./16,extrapolate=True):
+    """Flies a mission for each value of a parameter, in order, starting each solve from the ones before it. The
+    unknowns of every segment are extrapolated linearly from the last two converged solves, or copied from the last
+    one. When a solve does not converge the step toward the value is halved, and doubled again after a solve that
+    does; the solves in between are only used to start the next ones. A value that still does not converge with a
+    step of minimum_step, as a fraction of the way from the last value, is left as nan.
+
+    Assumptions:
+    The parameter is set on the mission, e.g. 'segments.cruise.air_speed'. Several paths can be given to set
+    together, e.g. an altitude that a later segment also holds.
+    Only the unknowns of the segments are started from the last solves, the unknowns of the mission itself are left
+    to its own process
+    The segments and the swept parameters of the mission are left as they were
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                        [Mission()]
+    parameters                     [str or list of str]
+    values                         [array]
+    outputs                        [list of str]      paths in the results, e.g. 'segments.cruise.conditions.weights.total_mass[-1,0]'
+    minimum_step                   [Unitless]         smallest fraction of a step before giving up
+    extrapolate                    [bool]
+
+    Outputs:
+    sweep.values                   [array]
+    sweep.converged                [array of bools]
+    sweep.results                  [list of Data()]   None where the solve did not converge
+    sweep.outputs                  [Data()]           an array of each output, one row per value
+    sweep.solves                   [int]              missions flown, including the ones in between
+
+    Properties Used:
+    N/A
+    """       
+    
+    if isinstance(parameters,str):
+        parameters = [parameters]
+    values = np.array(values,dtype=float)
+    
+    # put the segments and the parameters back afterwards
+    templates = segment_templates(mission)
+    originals = get_parameters(mission,parameters)
+    
+    sweep           = Data()
+    sweep.values    = values
+    sweep.converged = np.zeros(len(values),dtype=bool)
+    sweep.results   = []
+    sweep.outputs   = Data()
+    sweep.solves    = 0
+    
+    # the converged solves so far, the last two are used to start the next
+    history = []
+    
+    try:
+        for value in values:
+        
+            # walk from the last converged value, as a fraction of the way there
+            start    = history[-1][0] if history else value
+            reached  = 0.
+            step     = 1.
+            results  = None
+            while True:
+                fraction = min(reached + step,1.)
+                target   = value if fraction == 1. else start + fraction*(value - start)
+            
+                seed_unknowns(mission,target,history,extrapolate)
+                set_parameters(mission,parameters,target)
+            
+                results = fly(mission)
+                sweep.solves += 1
+            
+                if results is not None:
+                    history = (history + [(target,segment_unknowns(results))])[-2:]
+                    if fraction == 1.:
+                        break
+                    # a good step, try a longer one
+                    reached = fraction
+                    step    = step * 2.
+                
+                else:
+                    if step <= minimum_step or not history:
+                        break
+                    step = step * 0.5
+            
+            converged = results is not None
+            sweep.converged[len(sweep.results)] = converged
+            sweep.results.append(results)
+                
+    finally:
+        restore_templates(mission,templates)
+        for parameter,original in zip(parameters,originals):
+            set_parameters(mission,[parameter],original)
+        
+    # stack the outputs
+    for output in outputs:
+        values_out = []
+        for results in sweep.results:
+            if results is None:
+                values_out.append(np.nan)
+            else:
+                values_out.append(eval('results.'+output))
+        sweep.outputs[output] = stack_values(values_out)
+    
+    return sweep
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions
+def fly(mission):
+    """Flies a mission and keeps a copy of the results if every segment converged
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                        [Mission()]
+
+    Outputs:
+    results                        [Data() or None]
+
+    Properties Used:
+    N/A
+    """       
+    
+    mission.state.numerics.converged = None
+    for segment in mission.segments.values():
+        segment.state.numerics.converged = None
+    
+    # a solve that fails numerically did not converge, any other error is raised
+    try:
+        results = mission.evaluate()
+    except (ArithmeticError,ValueError,np.linalg.LinAlgError) as error:
+        print 'mission sweep solve failed: ' + type(error).__name__ + ': ' + str(error)
+        return None
+    
+    flags = [mission.state.numerics.converged] + [segment.state.numerics.converged for segment in mission.segments.values()]
+    if False in flags:
+        return None
+    
+    for sub_state in results.segments.values():
+        if not np.all(np.isfinite(sub_state.residuals.pack_array())):
+            return None
+    
+    return deepcopy(results)
+
+## @ingroup Methods-Missions
+def get_parameters(mission,parameters):
+    """Copies the values of the swept parameters of a mission
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                        [Mission()]
+    parameters                     [list of str]
+
+    Outputs:
+    values                         [list]
+
+    Properties Used:
+    N/A
+    """       
+    
+    return [deepcopy(eval('mission.'+parameter)) for parameter in parameters]
+
+## @ingroup Methods-Missions
+def set_parameters(mission,parameters,value):
+    """Sets the swept parameters of a mission
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                        [Mission()]
+    parameters                     [list of str]
+    value                          [float]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """       
+    
+    for parameter in parameters:
+        exec('mission.'+parameter+' = value')
+        
+    return
+
+## @ingroup Methods-Missions
+def stack_values(values):
+    """Stacks the outputs of a sweep, one row per value. A solve that did not converge is a row of nan.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    values                         [list]
+
+    Outputs:
+    stacked                        [array]
+
+    Properties Used:
+    N/A
+    """       
+    
+    shape = ()
+    for value in values:
+        if not np.isscalar(value) or not np.isnan(value):
+            shape = np.shape(value)
+            break
+    
+    stacked = np.nan * np.ones((len(values),) + shape)
+    for k,value in enumerate(values):
+        if np.isscalar(value) and np.isnan(value):
+            continue
+        stacked[k] = value
+        
+    return stacked
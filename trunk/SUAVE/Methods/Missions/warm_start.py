@@ -0,0 +1,144 @@
+## @ingroup Methods-Missions
+# warm_start.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from copy import deepcopy
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#  Warm Start
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions
+def segment_templates(mission):
+    """Copies the unknowns of each segment of a mission, which a mission starts each solve from, so they can be put
+    back after the segments have been started from other solves
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                        [Mission()]
+
+    Outputs:
+    templates                      [list of Data()]
+
+    Properties Used:
+    N/A
+    """       
+    
+    return [deepcopy(segment.state.unknowns) for segment in mission.segments.values()]
+
+## @ingroup Methods-Missions
+def restore_templates(mission,templates):
+    """Puts back the unknowns of each segment of a mission copied by segment_templates
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                        [Mission()]
+    templates                      [list of Data()]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """       
+    
+    for k,segment in enumerate(mission.segments.values()):
+        segment.state.unknowns = deepcopy(templates[k])
+        
+    return
+
+## @ingroup Methods-Missions
+def segment_unknowns(results):
+    """Copies the unknowns of each segment of the results
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    results                        [Data()]
+
+    Outputs:
+    unknowns                       [Data()]
+
+    Properties Used:
+    N/A
+    """       
+    
+    unknowns = Data()
+    for tag,sub_state in results.segments.items():
+        unknowns[tag] = Data()
+        for key,value in sub_state.unknowns.items():
+            if isinstance(value,np.ndarray) and np.ndim(value) == 2:
+                unknowns[tag][key] = value * 1.
+                
+    return unknowns
+
+## @ingroup Methods-Missions
+def seed_unknowns(mission,value,history,extrapolate):
+    """Sets the unknowns of each segment of a mission to start from the converged solves before it. With two
+    solves the unknowns are extrapolated linearly to the value.
+
+    Assumptions:
+    Unknowns that do not have a row for each control point of the segment are left alone
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                        [Mission()]
+    value                          [float]
+    history                        [list of (float, Data())]
+    extrapolate                    [bool]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """       
+    
+    if not history:
+        return
+    
+    last_value, last = history[-1]
+    if extrapolate and len(history) == 2 and history[0][0] != last_value:
+        first_value, first = history[0]
+        ratio = (value - last_value)/(last_value - first_value)
+    else:
+        first = last
+        ratio = 0.
+        
+    for tag,segment in mission.segments.items():
+        if not last.has_key(tag):
+            continue
+        rows = segment.state.numerics.number_control_points
+        for key,unknown in last[tag].items():
+            if len(unknown) != rows:
+                continue
+            guess = unknown
+            if first.has_key(tag) and first[tag].has_key(key) and np.shape(first[tag][key]) == np.shape(unknown):
+                guess = unknown + ratio*(unknown - first[tag][key])
+            segment.state.unknowns[key] = guess * 1.
+            
+    return
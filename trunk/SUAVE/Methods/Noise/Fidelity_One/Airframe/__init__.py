@@ -7,3 +7,4 @@ from noise_clean_wing import noise_clean_wing
 import noise_landing_gear
 import noise_leading_edge_slat
 import noise_trailing_edge_flap
+from noise_airframe_footprint import noise_airframe_footprint
@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, Carlos Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -86,40 +87,12 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     # ==============================================
         # Unpack
     # ==============================================
-    wing = config.wings
-
-    Sw      =       wing.main_wing.areas.reference  / (Units.ft)**2              #wing area, sq.ft
-    bw      =       wing.main_wing.spans.projected / Units.ft                    #wing span, ft
-    Sht     =       wing.horizontal_stabilizer.areas.reference / (Units.ft)**2   #horizontal tail area, sq.ft
-    bht     =       wing.horizontal_stabilizer.spans.projected / Units.ft        #horizontal tail span, ft
-    Svt     =       wing.vertical_stabilizer.areas.reference / (Units.ft)**2     #vertical tail area, sq.ft
-    bvt     =       wing.vertical_stabilizer.spans.projected  / Units.ft         #vertical tail span, ft
-    deltaf  =       wing.main_wing.flaps.angle                                   #flap delection, rad
-    Sf      =       wing.main_wing.flaps.area  / (Units.ft)**2                   #flap area, sq.ft        
-    cf      =       wing.main_wing.flaps.chord_dimensional  / Units.ft           #flap chord, ft
-    Dp      =       config.landing_gear.main_tire_diameter  / Units.ft           #MLG tyre diameter, ft
-    Hp      =       config.landing_gear.nose_tire_diameter  / Units.ft           #MLG strut length, ft
-    Dn      =       config.landing_gear.main_strut_length   / Units.ft           #NLG tyre diameter, ft
-    Hn      =       config.landing_gear.nose_strut_length   / Units.ft           #NLG strut length, ft
-    gear    =       config.landing_gear.gear_condition                           #Gear up or gear down
-    
-    nose_wheels    =   config.landing_gear.nose_wheels                           #Number of wheels   
-    main_wheels    =   config.landing_gear.main_wheels                           #Number of wheels   
-    main_units     =   config.landing_gear.main_units                            #Number of main units   
-    velocity       =   np.float(noise_segment.conditions.freestream.velocity[0,0]) #aircraft velocity 
-    altitude       =   noise_segment.conditions.freestream.altitude[:,0]           #aircraft altitude
-    time           =   noise_segment.conditions.frames.inertial.time[:,0]          #time discretization
-
-    noise_time = np.arange(0.,time[-1],.5)  
-    altitude = np.interp(noise_time,time,altitude)
-
-    # determining flap slot number
-    if wing.main_wing.flaps.type   == 'single_slotted':
-        slots = 1
-    elif wing.main_wing.flaps.type == 'double_slotted':
-        slots = 2
-    elif wing.main_wing.flaps.type == 'triple_slotted':
-        slots = 3    
+    source     = airframe_noise_source(config,analyses,noise_segment)
+    velocity   = source.velocity
+    time       = noise_segment.conditions.frames.inertial.time[:,0]          #time discretization
+    noise_time = source.noise_time
+    altitude   = source.altitude
+    M          = source.M
 
     # Geometric information from the source to observer position
     distance_vector = noise_segment.dist    
@@ -132,112 +105,52 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
         
     # Number of points on the discretize segment   
     nsteps=len(noise_time)
+
+    #Generate array with the One Third Octave Band Center Frequencies
+    frequency = source.frequency
     
-    # Preparing matrix for noise calculation
-    sound_speed = np.zeros(nsteps)
-    density     = np.zeros(nsteps)
-    viscosity   = np.zeros(nsteps)
-    temperature = np.zeros(nsteps)
-    M           = np.zeros(nsteps)
-    deltaw      = np.zeros(nsteps)
+    #number of positions of the aircraft to calculate the noise
+    nrange = len(angle) 
     
-    # ==============================================
-    #         Computing atmospheric conditions
-    # ==============================================
+    # All positions are evaluated at once, with each position a row and each frequency band a column.
+    # The last position is left out of the histories.
+    n      = nrange-1
     
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(altitude[id])
-        
-        #unpack    
-        sound_speed[id] =    np.float(atmo_data.speed_of_sound)
-        density[id]     =    np.float(atmo_data.density)
-        viscosity[id]   =    np.float(atmo_data.dynamic_viscosity*10.7639) #units converstion - m2 to ft2
-        temperature[id] =    np.float(atmo_data.temperature)
-        
-        #Mach number
-        M[id] = velocity/np.sqrt(1.4*287*temperature[id])
+    spectra = airframe_noise_spectra(source,distance_vector[:n],angle[:n],phi[:n])
     
-        #Wing Turbulent Boundary Layer thickness, ft
-        deltaw[id] = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity[id]))**(-0.2)
+    SPL_wing              = spectra.wing
+    SPLht                 = spectra.horizontal_tail
+    SPLvt                 = spectra.vertical_tail
+    SPL_slat              = spectra.slat
+    SPL_flap              = spectra.flap
+    SPL_main_landing_gear = spectra.main_landing_gear
+    SPL_nose_landing_gear = spectra.nose_landing_gear
+    SPL_total             = spectra.total
     
-
-    #Units conversion - knots to ft/s
-    kt2fts = 1.6878098571 
-
-    #Generate array with the One Third Octave Band Center Frequencies
-    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
-            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
-
-
-    # Velocity in fts
-    velocity_fst = velocity * Units.knot
+    #Calculation of dBA based on the sound pressure time history
+    SPLt_dBA = dbA_noise(SPL_total)
     
-    #number of positions of the aircraft to calculate the noise
-    nrange = len(angle) 
-    i=0
-    SPL_wing_history = np.zeros((nrange,24))
-    SPLht_history    = np.zeros((nrange,24))
-    SPLvt_history    = np.zeros((nrange,24))
-    SPL_flap_history = np.zeros((nrange,24))
-    SPL_slat_history = np.zeros((nrange,24))
+    SPL_total_history = np.zeros((nrange,24))
+    SPL_wing_history  = np.zeros((nrange,24))
+    SPLht_history     = np.zeros((nrange,24))
+    SPLvt_history     = np.zeros((nrange,24))
+    SPL_flap_history  = np.zeros((nrange,24))
+    SPL_slat_history  = np.zeros((nrange,24))
     SPL_main_landing_gear_history = np.zeros((nrange,24))
     SPL_nose_landing_gear_history = np.zeros((nrange,24))
-    SPL_total_history = np.zeros((nrange,24))
+    SPLt_dBA_history  = np.zeros((nrange,24))
+    SPLt_dBA_max      = np.zeros(nrange)
     
-    #Noise history in dBA
-    SPLt_dBA_history = np.zeros((nrange,24))  
-    SPLt_dBA_max = np.zeros(nrange)    
-    
-    #START LOOP FOR EACH POSITION OF AIRCRAFT   
-    for i in range(0,nrange-1):
-        #Emission angle theta   
-        theta = angle[i] 
-        #Distance from airplane to observer, evaluated at retarded time
-        distance = distance_vector[i]    
-       
-         #Atmospheric attenuation
-        delta_atmo=atmospheric_attenuation(distance)
-
-        #Call each noise source model
-        SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency) - delta_atmo    #Wing Noise
-        SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
-        SPLvt    = noise_clean_wing(Svt,bvt,0,0,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
- 
-        SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw[i],viscosity[i],M[i],phi[i],theta,distance,frequency) -delta_atmo        #Slat leading edge
- 
-        if (deltaf==0):
-            SPL_flap = np.zeros(24)
-        else:
-            SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M[i],phi[i],theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
- 
-        if gear=='up': #0
-            SPL_main_landing_gear = np.zeros(24)
-            SPL_nose_landing_gear = np.zeros(24)
-        else:
-            SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
-            SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
-        if main_units>1: #Incoherent summation of each main landing gear unit
-            SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
- 
- 
-         #Total Airframe Noise
-        SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
-             10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear)) - delta_atmo
-            
-        SPL_total_history[i][:] = SPL_total[:]
-        SPL_wing_history[i][:]  = SPL_wing[:]
-        SPLvt_history[i][:]     = SPLvt[:]
-        SPLht_history[i][:]     = SPLht[:]
-        SPL_flap_history[i][:]  = SPL_flap[:]
-        SPL_slat_history[i][:]  = SPL_slat[:]
-        SPL_nose_landing_gear_history[i][:] = SPL_nose_landing_gear[:]
-        SPL_main_landing_gear_history[i][:] = SPL_main_landing_gear[:]
-        
-        
-        #Calculation of dBA based on the sound pressure time history
-        SPLt_dBA = dbA_noise(SPL_total)
-        SPLt_dBA_history[i][:] = SPLt_dBA[:]
-        SPLt_dBA_max[i] = max(SPLt_dBA)        
+    SPL_total_history[:n] = SPL_total
+    SPL_wing_history[:n]  = SPL_wing
+    SPLvt_history[:n]     = SPLvt
+    SPLht_history[:n]     = SPLht
+    SPL_flap_history[:n]  = SPL_flap
+    SPL_slat_history[:n]  = SPL_slat
+    SPL_nose_landing_gear_history[:n] = SPL_nose_landing_gear
+    SPL_main_landing_gear_history[:n] = SPL_main_landing_gear
+    SPLt_dBA_history[:n]  = SPLt_dBA
+    SPLt_dBA_max[:n]      = np.max(SPLt_dBA,axis=1)
        
        
    #Calculation of dBA based on the sound pressure time history
@@ -371,3 +284,178 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
         fid.close
     
     return (EPNL_total,SPL_total_history,SENEL_total)
+
+
+# ----------------------------------------------------------------------
+#  Airframe Noise Source
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+def airframe_noise_source(config, analyses, noise_segment):
+    """ SUAVE.Methods.Noise.Fidelity_One.Airframe.airframe_noise_source(config, analyses, noise_segment):
+            Gathers the airframe geometry and the flight conditions along the noise time discretization, everything
+            needed by the Fink method that does not depend on the observer position.
+
+            Inputs:
+                config         - SUAVE type vehicle, see noise_airframe_Fink
+                analyses       - with the atmosphere analysis
+                noise_segment  - flight path data
+
+            Outputs:
+                source         - Data with the airframe geometry [ft], the aircraft velocity, the noise time discretization [s]
+                                 and the altitude [m], boundary layer thickness [ft], viscosity and Mach number at each noise time
+
+            Assumptions:
+                Constant velocity segment, the noise is evaluated every half second."""
+
+    wing = config.wings
+    
+    source = Data()
+
+    source.Sw      =       wing.main_wing.areas.reference  / (Units.ft)**2              #wing area, sq.ft
+    source.bw      =       wing.main_wing.spans.projected / Units.ft                    #wing span, ft
+    source.Sht     =       wing.horizontal_stabilizer.areas.reference / (Units.ft)**2   #horizontal tail area, sq.ft
+    source.bht     =       wing.horizontal_stabilizer.spans.projected / Units.ft        #horizontal tail span, ft
+    source.Svt     =       wing.vertical_stabilizer.areas.reference / (Units.ft)**2     #vertical tail area, sq.ft
+    source.bvt     =       wing.vertical_stabilizer.spans.projected  / Units.ft         #vertical tail span, ft
+    source.deltaf  =       wing.main_wing.flaps.angle                                   #flap delection, rad
+    source.Sf      =       wing.main_wing.flaps.area  / (Units.ft)**2                   #flap area, sq.ft        
+    source.cf      =       wing.main_wing.flaps.chord_dimensional  / Units.ft           #flap chord, ft
+    source.Dp      =       config.landing_gear.main_tire_diameter  / Units.ft           #MLG tyre diameter, ft
+    source.Hp      =       config.landing_gear.nose_tire_diameter  / Units.ft           #MLG strut length, ft
+    source.Dn      =       config.landing_gear.main_strut_length   / Units.ft           #NLG tyre diameter, ft
+    source.Hn      =       config.landing_gear.nose_strut_length   / Units.ft           #NLG strut length, ft
+    source.gear    =       config.landing_gear.gear_condition                           #Gear up or gear down
+    
+    source.nose_wheels    =   config.landing_gear.nose_wheels                           #Number of wheels   
+    source.main_wheels    =   config.landing_gear.main_wheels                           #Number of wheels   
+    source.main_units     =   config.landing_gear.main_units                            #Number of main units   
+    velocity              =   np.float(noise_segment.conditions.freestream.velocity[0,0]) #aircraft velocity 
+    altitude              =   noise_segment.conditions.freestream.altitude[:,0]           #aircraft altitude
+    time                  =   noise_segment.conditions.frames.inertial.time[:,0]          #time discretization
+
+    noise_time = np.arange(0.,time[-1],.5)  
+    altitude   = np.interp(noise_time,time,altitude)
+
+    # determining flap slot number
+    source.slots = None
+    if wing.main_wing.flaps.type   == 'single_slotted':
+        source.slots = 1
+    elif wing.main_wing.flaps.type == 'double_slotted':
+        source.slots = 2
+    elif wing.main_wing.flaps.type == 'triple_slotted':
+        source.slots = 3    
+    
+    # ==============================================
+    #         Computing atmospheric conditions
+    # ==============================================
+    
+    atmo_data = analyses.atmosphere.compute_values(altitude)
+    
+    #unpack    
+    viscosity   =    atmo_data.dynamic_viscosity[:,0]*10.7639 #units converstion - m2 to ft2
+    temperature =    atmo_data.temperature[:,0]
+    
+    #Mach number
+    M = velocity/np.sqrt(1.4*287*temperature)
+
+    #Wing Turbulent Boundary Layer thickness, ft
+    deltaw = 0.37*(source.Sw/source.bw)*((velocity/Units.ft)*source.Sw/(source.bw*viscosity))**(-0.2)
+
+    #Generate array with the One Third Octave Band Center Frequencies
+    frequency = np.array((50, 63, 80, 100, 125, 160, 200, 250, 315, 400, 500, 630, 800, 1000, 1250, 1600, \
+            2000, 2500, 3150, 4000, 5000, 6300, 8000, 10000))
+    
+    source.velocity   = velocity
+    source.noise_time = noise_time
+    source.altitude   = altitude
+    source.viscosity  = viscosity
+    source.M          = M
+    source.deltaw     = deltaw
+    source.frequency  = frequency
+    
+    return source
+
+
+# ----------------------------------------------------------------------
+#  Airframe Noise Spectra
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+def airframe_noise_spectra(source, distance, theta, phi):
+    """ SUAVE.Methods.Noise.Fidelity_One.Airframe.airframe_noise_spectra(source, distance, theta, phi):
+            Computes the one third octave band spectra of each airframe noise source and the total airframe noise
+            for the first time steps of a noise source, for one or many observers.
+
+            Inputs:
+                source     - Data from airframe_noise_source
+                distance   - Distance from the source to the observer [m]
+                theta      - Polar angle from the source to the observer [rad]
+                phi        - Azimuthal angle from the source to the observer [rad]
+
+                distance, theta and phi have the time steps on the last axis, with any leading observer axes.
+
+            Outputs: One Third Octave Band SPL [dB], each with the shape of distance plus a frequency band axis
+                spectra    - Data with the wing, horizontal_tail, vertical_tail, flap, slat, main_landing_gear,
+                             nose_landing_gear and total airframe Sound Pressure Levels
+
+            Assumptions:
+                Correlation based."""
+
+    distance = np.asarray(distance,dtype=float)
+    theta    = np.broadcast_to(theta,distance.shape).ravel()
+    phi      = np.broadcast_to(phi,distance.shape).ravel()
+    shape    = distance.shape
+    n        = shape[-1]
+    
+    # The flight conditions of each time step are repeated for every observer
+    deltaw    = np.broadcast_to(source.deltaw[:n],shape).ravel()
+    viscosity = np.broadcast_to(source.viscosity[:n],shape).ravel()
+    M         = np.broadcast_to(source.M[:n],shape).ravel()
+    distance  = distance.ravel()
+    
+    velocity  = source.velocity
+    frequency = source.frequency
+    Sw        = source.Sw
+    bw        = source.bw
+    nrows     = len(distance)
+    
+    #Atmospheric attenuation
+    delta_atmo = atmospheric_attenuation(distance)
+
+    #Call each noise source model
+    SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw,velocity,viscosity,M,phi,theta,distance,frequency) - delta_atmo    #Wing Noise
+    SPLht    = noise_clean_wing(source.Sht,source.bht,0,1,deltaw,velocity,viscosity,M,phi,theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
+    SPLvt    = noise_clean_wing(source.Svt,source.bvt,0,0,deltaw,velocity,viscosity,M,phi,theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
+
+    SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw,viscosity,M,phi,theta,distance,frequency) -delta_atmo        #Slat leading edge
+
+    if (source.deltaf==0):
+        SPL_flap = np.zeros((nrows,24))
+    else:
+        SPL_flap = noise_trailing_edge_flap(source.Sf,source.cf,source.deltaf,source.slots,velocity,M,phi,theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
+
+    if source.gear=='up': #0
+        SPL_main_landing_gear = np.zeros((nrows,24))
+        SPL_nose_landing_gear = np.zeros((nrows,24))
+    else:
+        SPL_main_landing_gear = noise_landing_gear(source.Dp,source.Hp,source.main_wheels,M,velocity,phi,theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
+        SPL_nose_landing_gear = noise_landing_gear(source.Dn,source.Hn,source.nose_wheels,M,velocity,phi,theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
+    if source.main_units>1: #Incoherent summation of each main landing gear unit
+        SPL_main_landing_gear = SPL_main_landing_gear+3*(source.main_units-1)
+
+     #Total Airframe Noise
+    SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
+         10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear)) - delta_atmo
+    
+    spectra = Data()
+    spectra.wing              = np.reshape(SPL_wing,shape+(24,))
+    spectra.horizontal_tail   = np.reshape(SPLht,shape+(24,))
+    spectra.vertical_tail     = np.reshape(SPLvt,shape+(24,))
+    spectra.flap              = np.reshape(SPL_flap,shape+(24,))
+    spectra.slat              = np.reshape(SPL_slat,shape+(24,))
+    spectra.main_landing_gear = np.reshape(SPL_main_landing_gear,shape+(24,))
+    spectra.nose_landing_gear = np.reshape(SPL_nose_landing_gear,shape+(24,))
+    spectra.total             = np.reshape(SPL_total,shape+(24,))
+    
+    return spectra
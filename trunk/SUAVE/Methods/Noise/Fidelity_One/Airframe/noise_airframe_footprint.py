@@ -0,0 +1,180 @@
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+# noise_airframe_footprint.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# Modified: 
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# SUAVE Imports
+from SUAVE.Core            import Data
+
+from noise_airframe_Fink import airframe_noise_source
+from noise_airframe_Fink import airframe_noise_spectra
+
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import pnl_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_tone_correction
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import epnl_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import dbA_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_counterplot
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import senel_noise
+
+import numpy as np
+import multiprocessing
+
+# ----------------------------------------------------------------------
+#  Noise Airframe Footprint
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+def noise_airframe_footprint(config, analyses, noise_segment, x_mic, y_mic, processes=1, chunk_size=500): 
+    """ SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_airframe_footprint(config, analyses, noise_segment, x_mic, y_mic):
+            Computes the airframe noise footprint of a flight segment over a grid of ground microphones with the Fink method,
+            giving the EPNL and SENEL contours. Each microphone gets the same treatment as noise_airframe_Fink.
+
+            Inputs:
+                config         - SUAVE type vehicle, see noise_airframe_Fink
+                analyses       - with the atmosphere analysis
+                noise_segment  - flight path data
+                x_mic          - Microphone positions along the flight path, any array shape [m]
+                y_mic          - Microphone positions lateral to the flight path, broadcast with x_mic [m]
+                processes      - Number of worker processes, the microphones are evaluated in this process when 1
+                chunk_size     - Number of microphones evaluated together by one worker
+
+            Outputs:
+                footprint      - Data with the contour arrays, with the shape of the microphone grid:
+                    x              - Microphone positions along the flight path [m]
+                    y              - Microphone positions lateral to the flight path [m]
+                    EPNL           - Effective Perceived Noise Level [EPNdB]
+                    SENEL          - Single Event Noise Exposure Level [dBA]
+
+            Assumptions:
+                Correlation based. The microphones are on the ground, the geometry is from noise_counterplot."""
+
+    # ==============================================
+    #     Microphone grid and observer geometry
+    # ==============================================
+    x_mic,y_mic = np.broadcast_arrays(np.asarray(x_mic,dtype=float),np.asarray(y_mic,dtype=float))
+    shape       = x_mic.shape
+    n_mics      = x_mic.size
+    
+    mics = Data()
+    mics.mic_array = np.column_stack((x_mic.ravel(),np.zeros(n_mics),y_mic.ravel()))
+    
+    # The geometry goes on a stand in segment so the single microphone geometry of the segment is kept
+    segment = Data()
+    segment.conditions = noise_segment.conditions
+    distance,theta,phi = noise_counterplot(segment,mics,config)
+
+    # Everything that does not depend on the observer is evaluated once
+    source = airframe_noise_source(config,analyses,noise_segment)
+    time   = noise_segment.conditions.frames.inertial.time[:,0]
+    
+    distance = interpolate_rows(source.noise_time,time,distance)
+    theta    = interpolate_rows(source.noise_time,time,theta)
+    phi      = interpolate_rows(source.noise_time,time,phi)
+
+    # ==============================================
+    #     Evaluate the observers in chunks
+    # ==============================================
+    chunks = []
+    for start in range(0,n_mics,chunk_size):
+        rows = slice(start,start+chunk_size)
+        chunks.append((source,distance[rows],theta[rows],phi[rows]))
+        
+    if processes > 1 and len(chunks) > 1:
+        pool    = multiprocessing.Pool(processes)
+        results = pool.map(footprint_chunk,chunks)
+        pool.close()
+        pool.join()
+    else:
+        results = map(footprint_chunk,chunks)
+
+    # ==============================================
+    #     Pack the contours
+    # ==============================================
+    footprint = Data()
+    footprint.x     = x_mic
+    footprint.y     = y_mic
+    footprint.EPNL  = np.reshape(np.concatenate([result[0] for result in results]),shape)
+    footprint.SENEL = np.reshape(np.concatenate([result[1] for result in results]),shape)
+
+    return footprint
+
+
+# ----------------------------------------------------------------------
+#  Footprint Chunk
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+def footprint_chunk(chunk):
+    """ SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_airframe_footprint.footprint_chunk(chunk):
+            Computes the total airframe EPNL and SENEL of a group of microphones. This is a module level function so that
+            it can be sent to the worker processes.
+
+            Inputs:
+                chunk          - tuple of the airframe_noise_source Data and the distance, polar angle and azimuthal angle
+                                 (microphones x noise time steps)
+
+            Outputs:
+                EPNL           - Effective Perceived Noise Level of each microphone [EPNdB]
+                SENEL          - Single Event Noise Exposure Level of each microphone [dBA]
+
+            Assumptions:
+                As in noise_airframe_Fink, the last noise time step is left out of the histories."""
+    
+    source,distance,theta,phi = chunk
+    
+    n_mics,nrange = distance.shape
+    n             = nrange-1
+    
+    SPL_total = airframe_noise_spectra(source,distance[:,:n],theta[:,:n],phi[:,:n]).total
+    
+    SPL_total_history = np.zeros((n_mics,nrange,24))
+    SPLt_dBA_max      = np.zeros((n_mics,nrange))
+    
+    SPL_total_history[:,:n] = SPL_total
+    SPLt_dBA_max[:,:n]      = np.max(dbA_noise(SPL_total),axis=-1)
+    
+    #Perceived noise level with tone correction, the metrics take the time history in the columns
+    PNLT_total = pnl_noise(SPL_total_history)+noise_tone_correction(SPL_total_history)
+    
+    EPNL  = epnl_noise(PNLT_total.T)
+    SENEL = senel_noise(SPLt_dBA_max.T)
+    
+    return (np.atleast_1d(EPNL),np.atleast_1d(SENEL))
+
+
+# ----------------------------------------------------------------------
+#  Interpolate Rows
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Airframe
+def interpolate_rows(x,xp,fp):
+    """ SUAVE.Methods.Noise.Fidelity_One.Airframe.noise_airframe_footprint.interpolate_rows(x,xp,fp):
+            Linear interpolation of every row of fp, the same as numpy.interp applied to each row.
+
+            Inputs:
+                x              - Points to interpolate to, within the range of xp
+                xp             - Increasing sample points
+                fp             - Sampled values, one row per signal
+
+            Outputs:
+                f              - Interpolated values, one row per signal
+
+            Assumptions:
+                None."""
+    
+    fp = np.atleast_2d(fp)
+    
+    j = np.clip(np.searchsorted(xp,x,side='right')-1,0,len(xp)-2)
+    
+    slope = (fp[:,j+1]-fp[:,j])/(xp[j+1]-xp[j])
+    f     = slope*(x-xp[j])+fp[:,j]
+    
+    # points on the last sample
+    f[:,x==xp[-1]] = fp[:,-1:]
+    
+    return f
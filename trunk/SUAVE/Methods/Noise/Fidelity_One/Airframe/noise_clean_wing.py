@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -38,11 +39,10 @@ def noise_clean_wing(S,b,ND,IsHorz,deltaw,velocity,viscosity,M,phi,theta,distanc
                     distance                   - Distance from airplane to observer, evaluated at retarded time [ft]
                     frequency                  - Frequency array [Hz]
 
-
+                deltaw, viscosity, M, phi, theta and distance can be scalars or 1D arrays over the trajectory time steps.
 
             Outputs: One Third Octave Band SPL [dB]
-                SPL                              - Sound Pressure Level of the clean wing [dB]
-                OASPL                            - Overall Sound Pressure Level of the clean wing [dB]
+                SPL                              - Sound Pressure Level of the clean wing [dB] (time steps x frequency bands)
 
             Assumptions:
                 Correlation based."""
@@ -50,6 +50,15 @@ def noise_clean_wing(S,b,ND,IsHorz,deltaw,velocity,viscosity,M,phi,theta,distanc
     #Unit conversion required for the method
     kt2fts = 1.6878098571
     
+    # Each time step is a row and each frequency band a column
+    deltaw    = np.reshape(deltaw,(-1,1))
+    viscosity = np.reshape(viscosity,(-1,1))
+    M         = np.reshape(M,(-1,1))
+    phi       = np.reshape(phi,(-1,1))
+    theta     = np.reshape(theta,(-1,1))
+    distance  = np.reshape(distance,(-1,1))
+    frequency = np.reshape(frequency,(1,-1))
+    
     delta  = 0.37*(S/b)*(velocity/Units.ft*S/(b*viscosity))**(-0.2)
 
     if IsHorz==1:
@@ -57,17 +66,18 @@ def noise_clean_wing(S,b,ND,IsHorz,deltaw,velocity,viscosity,M,phi,theta,distanc
     elif IsHorz==0:
         DIR = np.sin(phi)
 
+    # There is no noise when the observer is in the plane of the surface
+    silent  = (DIR==0)
+    DIR     = np.where(silent,1.,DIR)
 
-    if DIR==0:
-        SPL = np.zeros(24)
-    else:
+    fmax  = 0.1*(velocity/Units.ft)/(delta*(1-M*np.cos(theta)))
+    fmaxw = 0.1*(velocity/Units.ft)/deltaw
 
-        fmax  = 0.1*(velocity/Units.ft)/(delta*(1-M*np.cos(theta)))
-        fmaxw = 0.1*(velocity/Units.ft)/deltaw
+    OASPL = 50*np.log10((velocity/Units.kts)/100.0)+10*np.log10(delta*b/(distance**2.0))+8*ND+ \
+        20*np.log10(DIR*np.sin(theta)*np.cos(theta/2.0))+104.3
 
-        OASPL = 50*np.log10((velocity/Units.kts)/100.0)+10*np.log10(delta*b/(distance**2.0))+8*ND+ \
-            20*np.log10(DIR*np.sin(theta)*np.cos(theta/2.0))+104.3
-
-        SPL   = OASPL+10.0*np.log10(0.613*(frequency/fmax)**4*((frequency/fmax)**1.5+0.5)**(-4))-0.03*np.abs(((frequency/fmaxw)-1))**1.5
+    SPL   = OASPL+10.0*np.log10(0.613*(frequency/fmax)**4*((frequency/fmax)**1.5+0.5)**(-4))-0.03*np.abs(((frequency/fmaxw)-1))**1.5
+    
+    SPL   = np.where(silent,0.,SPL)
 
     return(SPL);
@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -31,10 +32,10 @@ def noise_landing_gear (D,H,wheels,M,velocity,phi,theta,distance,frequency):
                     distance                   - Distance from airplane to observer, evaluated at retarded time [ft]
                     frequemcy                  - Frequency array [Hz]
 
-
+                M, phi, theta and distance can be scalars or 1D arrays over the trajectory time steps.
 
             Outputs: One Third Octave Band SPL [dB]
-                SPL                              - Sound Pressure Level of the landing gear [dB]
+                SPL                              - Sound Pressure Level of the landing gear [dB] (time steps x frequency bands)
                 OASPL                            - Overall Sound Pressure Level of the landing gear [dB]
 
             Assumptions:
@@ -43,20 +44,30 @@ def noise_landing_gear (D,H,wheels,M,velocity,phi,theta,distance,frequency):
 
     #Process
     
+    # Each time step is a row and each frequency band a column
+    M         = np.reshape(M,(-1,1))
+    phi       = np.reshape(phi,(-1,1))
+    theta     = np.reshape(theta,(-1,1))
+    distance  = np.reshape(distance,(-1,1))
+    frequency = np.reshape(frequency,(1,-1))
+    
     velocity_fts = velocity/Units.ft
     velocity_kts = velocity/Units.knots
+    
+    # Strouhal number seen by the observer
+    St = frequency*D/(velocity_fts*(1-M*np.cos(theta)))
 
     if (wheels==1 or wheels==2):
-        G1 = 13+np.log10(4.5*((frequency*D/(velocity_fts*(1-M*np.cos(theta))))**2)* \
-            (12.5+((frequency*D/(velocity_fts*(1-M*np.cos(theta))))**2))**-2.25)
-        G2 = (13+np.log10(2.0*(frequency*D/(velocity_fts*(1-M*np.math.cos(theta)))**2.0))* \
-            (30+(frequency*D/(velocity_fts*(1-M*np.cos(theta))))**8)**-1*(0.34*H/D))* \
-            (np.math.sin(phi))**2
+        G1 = 13+np.log10(4.5*((St)**2)* \
+            (12.5+((St)**2))**-2.25)
+        G2 = (13+np.log10(2.0*(frequency*D/(velocity_fts*(1-M*np.cos(theta)))**2.0))* \
+            (30+(St)**8)**-1*(0.34*H/D))* \
+            (np.sin(phi))**2
     elif wheels==4:
-        G1 = 12+np.log10(frequency*D/(velocity_fts*(1-M*np.cos(theta))))**2 \
-        *(0.4+(frequency*D/(velocity_fts*(1-M*np.cos(theta))))**2)**(-1.6)
-        G2 = (12+np.log10(7.0*(frequency*D/(velocity_fts*(1-M*np.cos(theta))))**3.0 * \
-            (1.06+(frequency*D/(velocity_fts*(1-M*np.cos(theta))))**2)**(-3.0)*(1)))*(np.sin(phi))**2
+        G1 = 12+np.log10(St)**2 \
+        *(0.4+(St)**2)**(-1.6)
+        G2 = (12+np.log10(7.0*(St)**3.0 * \
+            (1.06+(St)**2)**(-3.0)*(1)))*(np.sin(phi))**2
 
 
     G3    = 12.79+np.log10(0.34*H/D)*(np.sin(phi))**2
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -32,42 +33,41 @@ def noise_trailing_edge_flap (Sf,cf,deltaf,slots,velocity,M,phi,theta,distance,f
                     distance                   - Distance from airplane to observer, evaluated at retarded time [ft]
                     frequency                  - Frequency array [Hz]
 
+                M, phi, theta and distance can be scalars or 1D arrays over the trajectory time steps.
+
             Outputs: One Third Octave Band SPL [dB]
-                SPL                              - Sound Pressure Level of the flap trailing edge [dB]
+                SPL                              - Sound Pressure Level of the flap trailing edge [dB] (time steps x frequency bands)
 
             Assumptions:
                 Correlation based."""
 
     #Process
-    G      = np.zeros(24)
     kt2fts = 1.6878098571
+    
+    # Each time step is a row and each frequency band a column
+    M         = np.reshape(M,(-1,1))
+    phi       = np.reshape(phi,(-1,1))
+    theta     = np.reshape(theta,(-1,1))
+    distance  = np.reshape(distance,(-1,1))
+    frequency = np.reshape(frequency,(1,-1))
 
     test   = frequency*cf/(velocity/Units.ft*(1-M*np.cos(theta)))
+    G      = np.zeros_like(test)
 
     if (slots==1 or slots==2):
-        for i in range (0,24):
-            if (test[i]<2):
-                G[i] = 99+10*np.log10(test[i])
-            elif (test[i]<20):
-                G[i] = 103.82-6*np.log10(test[i])
-            else:
-                G[i] = 135.04-30*np.log10(test[i])
+        G = np.where(test<2, 99+10*np.log10(test),
+            np.where(test<20, 103.82-6*np.log10(test),
+                              135.04-30*np.log10(test)))
 
     elif slots==3:
-        for i in range(0,24):
-            if(test[i]<2):
-                G[i] = 99+10*np.log10(test[i])
-            elif (test[i]<75):
-                G[i] = 102.61-2*np.log10(test[i])
-            else:
-                G[i] = 158.11-30*np.log10(test[i])
-
-    G = np.transpose(G)
+        G = np.where(test<2, 99+10*np.log10(test),
+            np.where(test<75, 102.61-2*np.log10(test),
+                              158.11-30*np.log10(test)))
     
-    if theta+deltaf>=np.pi:
-        directivity = 0.0
-    else:     
-        directivity = 20.0*np.log10(np.sin(theta)* (np.cos(phi))**2 * np.sin(theta+deltaf))
+    # No directivity once the flap is turned past the observer
+    behind      = (theta+deltaf>=np.pi)
+    directivity = np.where(behind,0.0,
+                           20.0*np.log10(np.where(behind,1.,np.sin(theta)* (np.cos(phi))**2 * np.sin(theta+deltaf))))
 
     SPL = G+10*np.log10(Sf*(np.sin(deltaf))**2/(distance**2))+ \
         60*np.log10((velocity/Units.kts)/100.0)+directivity
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -23,7 +24,7 @@ def atmospheric_attenuation(dist):
                     dist  -   Array with the distance vector from the aircraft (source) to the microphone position (observer) [m]
 
             Outputs: 
-                delta_spl -   The delta sound pressure level to be reduced from the lossless SPL condition [dB]
+                delta_spl -   The delta sound pressure level to be reduced from the lossless SPL condition [dB] (one row per distance when dist is an array)
 
             Assumptions:
                 SAE Model for a standard day."""
@@ -32,6 +33,6 @@ def atmospheric_attenuation(dist):
     Att_dB = np.array((0.09,0.11,0.14,0.17,0.22,0.28,0.35,0.44,0.55,0.7,0.88,1.11,1.42,1.78,2.24,2.88,3.64,4.6,5.89,7.63,8.68,11.08,14.87,20.61))
     
     #Calculates de delta SPL as a function of the distance
-    delta_spl = Att_dB*(dist)/1000
+    delta_spl = Att_dB*np.expand_dims(dist,-1)/1000
     
     return (delta_spl)
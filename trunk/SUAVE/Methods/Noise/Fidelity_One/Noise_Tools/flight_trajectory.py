@@ -3,6 +3,7 @@
 #
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -10,7 +11,8 @@
 
 import SUAVE
 import numpy as np
-from SUAVE.Core import Units
+from SUAVE.Core import Units, Data
+from SUAVE.Analyses.Mission.Segments.Conditions import Aerodynamics, Numerics
 
 from SUAVE.Methods.Propulsion.turbofan_sizing import turbofan_sizing
 
@@ -37,7 +39,9 @@ def flight_trajectory(configs,turbofan,analyses):
                 engine_data                       - Information regarding the engine performance data for the engine noise calculation
 
             Assumptions:
-                Assume the aircraft as a point source."""
+                Assume the aircraft as a point source.
+                The whole trajectory is laid out kinematically first and the engine is then evaluated
+                once over all of the time steps."""
     
     
      #unpack
@@ -66,34 +70,16 @@ def flight_trajectory(configs,turbofan,analyses):
         total_time = 60*Units.s #total time for noise calculation  
         n_steps    = np.int(total_time/dt +1)  #number of time steps (space discretization)
         
-        #Defining the necessary arrays for the flight trajectory procedure
-        theta = np.zeros(n_steps)
-        s     = np.zeros(n_steps)
-        dist  = np.zeros(n_steps)
-        time  = np.zeros(n_steps)
-        phi   = np.zeros(n_steps)
-        
-        #initial conditions
-        time[0]          = t0
-        s[0]             = s0    
-        altitute_flyover = altitute
-                
-        dist[0]          = np.sqrt(altitute**2+(s[0]-x0)**2)
-        theta[0]         = np.arctan(np.abs(altitute/s0))
-        phi[0]           = 0
-        altitute         = np.ones(n_steps)*altitute_flyover
-        
-    #Calculate flight path
-        for i in range(1,n_steps):           
-            s[i]         = s[i-1]+velocity*dt
-            dist[i]      = np.sqrt(altitute[i]**2+(s[i]-x0)**2)
-            theta[i]     = np.arctan(np.abs(altitute[i]/(s[i]-x0)))
-            phi[i]       = 0
-            time[i]      = time[i-1]+dt
-            
+        #Calculate flight path
+        time     = march(t0,dt,n_steps)
+        s        = march(s0,velocity*dt,n_steps)
+        altitute = np.ones(n_steps)*altitute
+        dist     = np.sqrt(altitute**2+(s-x0)**2)
+        theta    = np.arctan(np.abs(altitute/(s-x0)))
+        phi      = np.zeros(n_steps)
             
          #Determine the engine performance parameter for the velocity and altitute    
-        engine_data = engine_performnace(altitute,velocity,turbofan,analyses)  
+        engine_data = engine_performance(altitute,velocity,turbofan,analyses)  
         
     #----------------------------------------
     # APPROACH NOISE TRAJECTORY
@@ -106,37 +92,18 @@ def flight_trajectory(configs,turbofan,analyses):
         total_time = np.int(4000/velocity_x)    
         n_steps    = np.int(total_time/dt +1)  #number of time steps (space discretization)
         
-        #Defining the necessary arrays for the flight trajectory procedure
-        theta = np.zeros(n_steps)
-        s     = np.zeros(n_steps)
-        dist  = np.zeros(n_steps)
-        time  = np.zeros(n_steps)
-        phi   = np.zeros(n_steps)
-        
-        #initial conditions
-        time[0] = t0
-        s[0]    = s0
-        
         x0 = 0 #microphone reference position
         
-        altitute    = np.zeros(n_steps)
-        altitute[0] = 120+2000*np.tan(slope*np.pi/180) 
-        dist[0]     = np.sqrt(altitute[0]**2+(s[0]-x0)**2)
-        theta[0]    = np.arctan(np.abs(altitute[0]/s0))
-        phi[0]      = 0
-        
       #Calculate flight path
-        for i in range(1,n_steps):
-            s[i] = s[i-1]+velocity_x*dt
-            altitute[i] = altitute[i-1]-velocity_y*dt
-            dist[i]     = np.sqrt(altitute[i]**2+(s[i]-x0)**2)
-            theta[i]    = np.arctan(np.abs(altitute[i]/(s[i]-x0)))
-            phi[i]      = 0
-                           
-            time[i] = time[i-1]+dt
+        time     = march(t0,dt,n_steps)
+        s        = march(s0,velocity_x*dt,n_steps)
+        altitute = march(120+2000*np.tan(slope*np.pi/180),-velocity_y*dt,n_steps)
+        dist     = np.sqrt(altitute**2+(s-x0)**2)
+        theta    = np.arctan(np.abs(altitute/(s-x0)))
+        phi      = np.zeros(n_steps)
             
         #Determine the engine performance parameter for the velocity and altitute    
-        engine_data = engine_performnace(altitute,velocity,turbofan,analyses)
+        engine_data = engine_performance(altitute,velocity,turbofan,analyses)
         
     #----------------------------------------
     # FLYOVER NOISE TRAJECTORY
@@ -151,34 +118,16 @@ def flight_trajectory(configs,turbofan,analyses):
         total_time = np.int((x0+500)/velocity_x)    
         n_steps    = np.int(total_time/dt +1)  #number of time steps (space discretization)
         
-        #Defining the necessary arrays for the flight trajectory procedure
-        theta    = np.zeros(n_steps)
-        s        = np.zeros(n_steps)
-        dist     = np.zeros(n_steps)
-        time     = np.zeros(n_steps)
-        altitute = np.zeros(n_steps)
+        #Calculate flight path, starting from the lift-off position from the brake release
+        time     = march(t0,dt,n_steps)
+        s        = march(1061*Units.m,velocity_x*dt,n_steps)
+        altitute = march(35*Units.ft,velocity_y*dt,n_steps)
+        dist     = np.sqrt(altitute**2+(s-x0)**2)
+        theta    = np.arctan(np.abs(altitute/(s-x0)))
         phi      = np.zeros(n_steps)
-        
-        #initial conditions
-        time[0]     = t0
-        s[0]        = 1061*Units.m #Lift-off position from the brake release
-        altitute[0] = 35*Units.ft       
-                
-        dist[0]  = np.sqrt(altitute[0]**2+(x0-s[0])**2)
-        theta[0] = np.arctan(np.abs(altitute[0]/(x0-s[0])))
-        phi[0]   = 0
-        
-        #Calculate flight path
-        for i in range(1,n_steps):
-            s[i]        = s[i-1]+velocity_x*dt
-            altitute[i] = altitute[i-1]+velocity_y*dt
-            dist[i]     = np.sqrt(altitute[i]**2+(s[i]-x0)**2)
-            theta[i]    = np.arctan(np.abs(altitute[i]/(s[i]-x0)))
-            phi[i]      = 0
-            time[i]     = time[i-1]+dt
             
         #Determine the engine performance parameter for the velocity and altitute    
-        engine_data = engine_performnace(altitute,velocity,turbofan,analyses)
+        engine_data = engine_performance(altitute,velocity,turbofan,analyses)
         
     #----------------------------------------
     # SIDELINE NOISE TRAJECTORY
@@ -194,54 +143,58 @@ def flight_trajectory(configs,turbofan,analyses):
         total_time = np.int((6500+500)/velocity_x)    
         n_steps    = np.int(total_time/dt +1)  #number of time steps (space discretization)
         
-        #Defining the necessary arrays for the flight trajectory procedure
-        theta    = np.zeros(n_steps)
-        phi      = np.zeros(n_steps)
-        s        = np.zeros(n_steps)
-        dist     = np.zeros(n_steps)
-        time     = np.zeros(n_steps)
-        altitute = np.zeros(n_steps)
-        
-        #initial conditions        
-        time[0]     = t0
-        s[0]        = 1061*Units.m #Lift-off position from the brake release
-        altitute[0] = 35*Units.ft   
-        phi[0]      = np.arctan(z0/altitute[0])    
+        #Calculate flight path, starting from the lift-off position from the brake release
+        time     = march(t0,dt,n_steps)
+        s        = march(1061*Units.m,velocity_x*dt,n_steps)
+        altitute = march(35*Units.ft,velocity_y*dt,n_steps)
+        phi      = np.arctan(z0/altitute)
         
         x0 = s[0]+(1000-altitute[0])/np.tan(gama) #Position of the sideline microphone for the maximum take-off noise assumed to be at 1000ft of altitute
                 
-        dist[0]  = np.sqrt((450/np.sin(phi[0]))**2+(x0-s[0])**2)
-        theta[0] = np.arccos(np.abs((x0-s[0]))/dist[0])
-        
-        
-        
-        #Calculate flight path
-        for i in xrange(1,n_steps):
-            s[i]        = s[i-1]+velocity_x*dt
-            altitute[i] = altitute[i-1]+velocity_y*dt
-            phi[i]      = np.arctan(z0/altitute[i])
-            dist[i]     = np.sqrt((450/np.sin(phi[i]))**2+(s[i]-x0)**2)
-            theta[i]    = np.arccos(np.abs((x0-s[i])/dist[i]))
-            
-            time[i] = time[i-1]+dt
+        dist     = np.sqrt((450/np.sin(phi))**2+(s-x0)**2)
+        theta    = np.arccos(np.abs((x0-s)/dist))
 
         #Determine the engine performance parameter for the velocity and altitute
-        engine_data = engine_performnace(altitute,velocity,turbofan,analyses)
+        engine_data = engine_performance(altitute,velocity,turbofan,analyses)
     
     return(time,altitute,dist,theta,phi,engine_data)
 
+# ----------------------------------------------------------------------        
+#   March
+# ---------------------------------------------------------------------- 
+
+def march(start,step,n_steps):
+    """ SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.flight_trajectory.march(start,step,n_steps):
+            Steps a quantity forward with a constant increment. The increments are accumulated one after the other,
+            the same way as stepping through the trajectory point by point.
+
+            Inputs:
+                    start                            - Value at the first time step
+                    step                             - Increment per time step
+                    n_steps                          - Number of time steps
+
+            Outputs: 
+                    Array with the value at each time step"""
+    
+    increments    = np.ones(n_steps)*step
+    increments[0] = start
+    
+    return np.cumsum(increments)
+
 # ----------------------------------------------------------------------        
 #   Engine Performance
 # ---------------------------------------------------------------------- 
 
-def engine_performnace(altitude,velocity,turbofan,analyses):
-    """ SUAVE.Methods.Noise.Fidelity_One.engine_performnace(altitude,velocity,turbofan):
+def engine_performance(altitude,velocity,turbofan,analyses):
+    """ SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.flight_trajectory.engine_performance(altitude,velocity,turbofan,analyses):
             This routine generates the engine performance parameter for each point on the noise trajectory. 
+            All of the points are run through the turbofan network in a single evaluate_thrust call.
 
             Inputs:
-                    altitute
-                    velocity
-                    turbofan
+                    altitute                 -        Array with the altitude of each time step [m]
+                    velocity                 -        Aircraft speed [m/s]
+                    turbofan                 -        Turbofan network
+                    analyses                 -        Analyses with the atmosphere
 
             Outputs: 
                 velocity_primary        -        Core nozzle jet velocity [m/s]
@@ -253,44 +206,46 @@ def engine_performnace(altitude,velocity,turbofan,analyses):
                 pressure_secondary      -        Core nozzle jet stagnation pressure [Pa]
 
             Assumptions:
-                               ."""
+                Full throttle."""
     
     
     #Calculation of the Aircraft Mach number
     mach_number = velocity/340.3
     
     #Number of discrete points on the flight trajectory
-    n_steps = np.size(altitude)
+    altitude = np.reshape(altitude,(-1,1))
+    n_steps  = len(altitude)
+    ones     = np.ones((n_steps,1))
     
-    #Defining the necessary arrays for the engine performance procedure
-    velocity_primary      = np.zeros(n_steps)
-    temperature_primary   = np.zeros(n_steps)
-    pressure_primary      = np.zeros(n_steps)
-    velocity_secondary    = np.zeros(n_steps)
-    temperature_secondary = np.zeros(n_steps)
-    pressure_secondary    = np.zeros(n_steps)
-
-    #size the turbofan
-
-    for i in range (0,n_steps):
-        
-        atmo_data = analyses.atmosphere.compute_values(altitude[i])
-         
-         #call the atmospheric model to get the conditions at the specified altitude
-        atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
-        conditions = atmosphere.compute_values(altitude[i])
-        
-        #setup conditions
-        conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
-        
-        turbofan(conditions)
-      
-        velocity_primary[i]        = np.float(turbofan.core_nozzle.outputs.velocity)
-        temperature_primary[i]     = np.float(turbofan.core_nozzle.outputs.stagnation_temperature)
-        pressure_primary[i]        = np.float(turbofan.core_nozzle.outputs.stagnation_pressure)
+    #call the atmospheric model to get the conditions at the trajectory altitudes
+    atmo_data = analyses.atmosphere.compute_values(altitude)
+    
+    #setup conditions
+    state = Data()
+    state.conditions = Aerodynamics()
+    state.numerics   = Numerics()
+    conditions = state.conditions
+    conditions.expand_rows(n_steps)
+    
+    conditions.freestream.altitude          = altitude
+    conditions.freestream.velocity          = velocity*ones
+    conditions.freestream.mach_number       = mach_number*ones
+    conditions.freestream.pressure          = atmo_data.pressure
+    conditions.freestream.temperature       = atmo_data.temperature
+    conditions.freestream.density           = atmo_data.density
+    conditions.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+    conditions.freestream.speed_of_sound    = atmo_data.speed_of_sound
+    conditions.freestream.gravity           = 9.81*ones
+    conditions.propulsion.throttle          = 1.0*ones
     
-        velocity_secondary[i]      = np.float(turbofan.fan_nozzle.outputs.velocity)
-        temperature_secondary[i]   = np.float(turbofan.fan_nozzle.outputs.stagnation_temperature)
-        pressure_secondary[i]      = np.float(turbofan.fan_nozzle.outputs.stagnation_pressure) 
+    turbofan.evaluate_thrust(state)
+  
+    velocity_primary        = turbofan.core_nozzle.outputs.velocity[:,0]
+    temperature_primary     = turbofan.core_nozzle.outputs.stagnation_temperature[:,0]
+    pressure_primary        = turbofan.core_nozzle.outputs.stagnation_pressure[:,0]
+
+    velocity_secondary      = turbofan.fan_nozzle.outputs.velocity[:,0]
+    temperature_secondary   = turbofan.fan_nozzle.outputs.stagnation_temperature[:,0]
+    pressure_secondary      = turbofan.fan_nozzle.outputs.stagnation_pressure[:,0]
         
     return (velocity_primary,temperature_primary,pressure_primary,velocity_secondary,temperature_secondary,pressure_secondary)
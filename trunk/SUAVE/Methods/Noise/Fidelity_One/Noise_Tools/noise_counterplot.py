@@ -2,7 +2,7 @@
 # noise_counterplot.py
 # 
 # Created:  Feb 2016, C. Ilario
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -21,7 +21,7 @@ def noise_counterplot(noise_segment,analyses,config):
 
             Inputs:
                 noise_segment	 - SUAVE type vehicle
-                analyses
+                analyses         - with mic_array, the [x,y,z] coordinates of one microphone or an array of them (one row per microphone)
                 config
 
             Outputs:
@@ -29,39 +29,36 @@ def noise_counterplot(noise_segment,analyses,config):
                 theta           - Polar angle emission vector relatively to the aircraft to the microphone coordinates, [rad]
                 phi             - Azimuthal angle emission vector relatively to the aircraft to the microphone coordinates, [rad]
 
+                For an array of microphones each output has one row per microphone and one column per time step.
+
             Assumptions:
                 None."""
     
     #unpack
     position_vector = noise_segment.conditions.frames.inertial.position_vector
-    mic_position = analyses.mic_array
+    mic_position = np.array(analyses.mic_array,dtype=float)
     
     #X,Y,Z position of the aircraft
     x_aircraft = position_vector[:,0]
     altitude   = - position_vector[:,2]
     z_aircraft = position_vector[:,1]
-    
-
-    n_steps = len(altitude)  #number of time steps (space discretization)
-    
-    # Preparing the matrix: Angles
-    phi = np.zeros(n_steps)
-    theta = np.zeros(n_steps)  
-    
    
-    #X,Y,Z position of each microphone
-    x_mic = np.float(mic_position[0])
-    y_mic = np.float(mic_position[1])
-    z_mic = np.float(mic_position[2])
+    #X,Y,Z position of each microphone, as columns so every microphone is evaluated at every time step
+    x_mic = np.reshape(mic_position[...,0],(-1,1))
+    y_mic = np.reshape(mic_position[...,1],(-1,1))
+    z_mic = np.reshape(mic_position[...,2],(-1,1))
 
     dist = np.sqrt((x_aircraft-x_mic)**2+(altitude-y_mic)**2+(z_aircraft-z_mic)**2)
     phi   = np.arctan(np.abs(z_mic)/altitude)
 
-    for i in range (0,n_steps):
-        if (x_aircraft[i]-x_mic)< 0.:
-            theta[i] = np.arctan(np.abs(altitude[i]/(x_aircraft[i]-x_mic)))
-        else:
-            theta[i] = np.pi - np.arctan(np.abs(altitude[i]/(x_aircraft[i]-x_mic)))
+    theta = np.arctan(np.abs(altitude/(x_aircraft-x_mic)))
+    theta = np.where((x_aircraft-x_mic)<0.,theta,np.pi-theta)
+    
+    #A single microphone keeps the time step vectors
+    if mic_position.ndim==1:
+        dist  = dist[0]
+        theta = theta[0]
+        phi   = phi[0]
             
                 
     #Pack the results
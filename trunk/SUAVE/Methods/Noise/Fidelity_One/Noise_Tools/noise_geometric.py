@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -54,7 +55,6 @@ def noise_geometric(noise_segment,analyses,config):
         
         # Azimuthal angle is zero for approach condition
         phi = np.zeros(n_steps)
-        theta = np.zeros(n_steps)  
         
         #Microphone position from the approach threshold
         x0= 2000.
@@ -62,11 +62,8 @@ def noise_geometric(noise_segment,analyses,config):
         #Calculation of the distance vector and emission angle
         dist  = np.sqrt(altitude**2+(s-x0)**2)
 
-        for i in range(0, n_steps):
-            if (s[i]-x0)< 0.:
-                theta[i] = np.arctan(np.abs(altitude[i]/(s[i]-x0)))
-            else:
-                theta[i] = np.pi - np.arctan(np.abs(altitude[i]/(s[i]-x0)))
+        theta = np.arctan(np.abs(altitude/(s-x0)))
+        theta = np.where((s-x0)<0.,theta,np.pi-theta)
         
     elif flyover==1:
         
@@ -76,7 +73,6 @@ def noise_geometric(noise_segment,analyses,config):
         
         # Azimuthal angle is zero for flyover condition
         phi=np.zeros(n_steps)    
-        theta = np.zeros(n_steps)  
         
         #Lift-off position from the brake release    
         estimate_tofl = SUAVE.Methods.Performance.estimate_take_off_field_length
@@ -94,11 +90,8 @@ def noise_geometric(noise_segment,analyses,config):
         #Calculation of the distance vector and emission angle
         dist  = np.sqrt(altitude**2+(s-x0)**2)
 
-        for i in range(0, n_steps):
-            if (s[i]-x0)< 0.:
-                theta[i] = np.arctan(np.abs(altitude[i]/(s[i]-x0)))
-            else:
-                theta[i] = np.pi - np.arctan(np.abs(altitude[i]/(s[i]-x0)))        
+        theta = np.arctan(np.abs(altitude/(s-x0)))
+        theta = np.where((s-x0)<0.,theta,np.pi-theta)        
         
     else:
         
@@ -106,8 +99,6 @@ def noise_geometric(noise_segment,analyses,config):
         #-------------------SIDELINE CALCULATION-----------------
         #--------------------------------------------------------        
         
-        theta = np.zeros(n_steps) 
-
         z0 = 450.  #position on the z-direction of the sideline microphone (lateral coordinate)
         y0 =   0.  #position on the y-direction of the sideline microphone (altitude coordinate)
         
@@ -138,11 +129,8 @@ def noise_geometric(noise_segment,analyses,config):
         dist  = np.sqrt((z0/np.sin(phi))**2+(s-x0)**2)
         
         
-        for i in range(0, n_steps):
-            if (s[i]-x0)< 0.:
-                theta[i] = np.arccos(np.abs((x0-s[i])/dist[i]))
-            else:
-                theta[i] = np.pi - np.arccos(np.abs((x0-s[i])/dist[i])) 
+        theta = np.arccos(np.abs((x0-s)/dist))
+        theta = np.where((s-x0)<0.,theta,np.pi-theta)
                 
     
     #Pack the results in Noise Segments    
@@ -2,6 +2,7 @@
 # senel_noise.py
 # 
 # Created:  Jul 2015, C. Ilario
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -19,46 +20,39 @@ def senel_noise(SPLt_dBA_max):
      (Perceived Noise Level with Tone Correction).
 
         Inputs:
-                    PNLT                     - Perceived Noise Level with Tone Correction
+                    SPLt_dBA_max             - Maximum A-weighted Sound Pressure Level history (time steps, or time steps x signals)
 
                 Outputs: 
-                    EPNL                     - Effective Perceived Noise Level in EPNdB"""
+                    SENEL                    - Single Event Noise Exposure Level in dBA (one for each signal)"""
                     
+    SPLt_dBA_max = np.asarray(SPLt_dBA_max,dtype=float)
                     
     #Maximum PNLT on the time history data    
-    dBA_max = np.max(SPLt_dBA_max)
+    dBA_max = np.max(SPLt_dBA_max,axis=0)
     
     #Calculates the number of discrete points on the trajectory
     nsteps   = len(SPLt_dBA_max)    
-    
-    #Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
-    if all(SPLt_dBA_max==0):
-        SENEL = 0
-        return(SENEL)
+    steps    = np.arange(nsteps).reshape((nsteps,)+(1,)*(SPLt_dBA_max.ndim-1))
 
     #Finding the time duration for the noise history where PNL is higher than the maximum PNLT - 10 dB
-    i = 0
-    while SPLt_dBA_max[i]<=(dBA_max-10) and i<=nsteps:
-        i = i+1
-    t1 = i #t1 is the first time interval
-    i  = i+1
+    t1 = np.argmax(SPLt_dBA_max>(dBA_max-10),axis=0) #t1 is the first time interval
 
     #Correction for PNLTM-10 when it falls outside the limit of the data
-    if SPLt_dBA_max[nsteps-1]>=(dBA_max-10):
-        t2=nsteps-2
-    else:
-        while i<=nsteps and SPLt_dBA_max[i]>=(dBA_max-10):
-            i = i+1
-        t2 = i-1 #t2 is the last time interval
+    below = np.logical_and(steps>t1,SPLt_dBA_max<(dBA_max-10))
+    t2    = np.where(SPLt_dBA_max[nsteps-1]>=(dBA_max-10),nsteps-2,np.argmax(below,axis=0)-1) #t2 is the last time interval
                 
-    #The time duration where the noise is higher than the maximum PNLT - 10 dB is:
-    time_interval = (t2-t1)*0.5
-    
-    #Calculates the integral of the PNLT which between t1 and t2 points
-    sumation = 0
-    for i in range (t1-1,t2+1):
-        sumation = 10**(SPLt_dBA_max[i]/10)+sumation
+    #Calculates the integral of the PNLT which between t1 and t2 points, the point before t1 wraps around to 
+    #the end of the history when t1 is the first point
+    window   = np.logical_and(steps>=t1-1,steps<=t2)
+    window   = np.logical_or(window,np.logical_and(steps==nsteps-1,t1==0))
+    sumation = np.sum(np.where(window,10**(SPLt_dBA_max/10),0.),axis=0)
         
     SENEL = 10*np.log10(sumation)
     
-    return (SENEL)    
\ No newline at end of file
+    #Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
+    SENEL = np.where(np.all(SPLt_dBA_max==0,axis=0),0,SENEL)
+    
+    if np.ndim(SENEL)==0:
+        SENEL = SENEL[()]
+    
+    return (SENEL)    
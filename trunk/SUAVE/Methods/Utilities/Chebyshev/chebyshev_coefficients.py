@@ -0,0 +1,59 @@
+## @ingroup Methods-Utilities-Chebyshev
+# chebyshev_coefficients.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Chebyshev
+def chebyshev_coefficients(f):
+    """Finds the coefficients of the Chebyshev series that passes through
+    values at the cosine spaced points of chebyshev_data. How quickly the
+    coefficients fall off shows how well the points resolve the function;
+    the last coefficients are an estimate of the interpolation error.
+    
+    get the series back with f = sum_j a_j * T_j(1 - 2*x)
+
+    Assumptions:
+    The values are at the points of chebyshev_data, in the same order
+
+    Source:
+    Trefethen, L. N., "Approximation Theory and Approximation Practice", SIAM, 2013
+
+    Inputs:
+    f                      [-]        Values at the N points, a 1-d vector or an array with one column per function
+
+    Outputs:
+    a                      [-]        Coefficients, one row per Chebyshev polynomial from T_0 to T_N-1
+
+    Properties Used:
+    N/A
+    """       
+    
+    f = np.array(f,dtype=float)
+    N = len(f)
+    
+    if N == 1:
+        return f*1.
+    
+    # The points are t = cos(pi*k/(N-1)) in the Chebyshev variable
+    k = np.arange(0,N)
+    C = np.cos(np.pi*np.outer(k,k)/(N-1))
+    
+    # Trapezoidal weights, half at the ends
+    w = np.ones(N)
+    w[[0,-1]] = 0.5
+    
+    a = 2./(N-1) * np.dot(C*w,f)
+    a[[0,-1]] = a[[0,-1]] * 0.5
+    
+    return a
@@ -0,0 +1,68 @@
+## @ingroup Methods-Utilities-Chebyshev
+# chebyshev_interpolation.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities-Chebyshev
+def chebyshev_interpolation(N, x_new):
+    """Calculates the matrix that interpolates values at the N cosine
+    spaced points of chebyshev_data to new points, with the barycentric
+    formula. Every function sampled at the same points is interpolated
+    with the same matrix.
+    
+    get interpolated values with f_new = np.dot(P,f)
+        where f is either a 1-d vector or 2-d column array
+
+    Assumptions:
+    The new points are in the range [0,1]
+
+    Source:
+    Berrut, J. P., and Trefethen, L. N., "Barycentric Lagrange Interpolation", SIAM Review, 2004
+
+    Inputs:
+    N                      [-]        Number of points
+    x_new                  [-]        Points to interpolate to
+
+    Outputs:
+    P                      [-]        Interpolation matrix, len(x_new) by N
+
+    Properties Used:
+    N/A
+    """       
+    
+    N     = int(N)
+    x_new = np.array(x_new,dtype=float).flatten()
+    
+    if N == 1:
+        return np.ones((len(x_new),1))
+    
+    # the points of chebyshev_data
+    x = 0.5*(1 - np.cos(np.pi*np.arange(0,N)/(N-1)))
+    
+    # barycentric weights of the cosine spaced points
+    w = (-1.) ** np.arange(0,N)
+    w[[0,-1]] = w[[0,-1]] * 0.5
+    
+    dx    = x_new[:,None] - x[None,:]
+    exact = dx == 0.
+    dx[exact] = 1.
+    
+    P = w/dx
+    P = P/np.sum(P,axis=1)[:,None]
+    
+    # new points that land on a point take its value
+    hits = np.any(exact,axis=1)
+    P[hits,:] = exact[hits,:]*1.
+    
+    return P
@@ -0,0 +1,351 @@
+## @ingroup Optimization
+# Evaluation_Cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# suave imports
+from SUAVE.Core import Data
+from copy import deepcopy
+from collections import OrderedDict
+import cPickle as pickle
+import sqlite3
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Evaluation Cache Class
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+class Evaluation_Cache(Data):
+    """A store of the evaluations of a Nexus, keyed by the design vector. Each entry holds the values behind the
+        objective, the constraints and any other values chosen in stored_values. The Nexus checks the cache before
+        running its procedure.
+
+        The most recent evaluations are kept in memory, up to max_size of them. If a filename is given every
+        evaluation is also written to an SQLite database, so an interrupted optimization can be restarted from the
+        same point and will replay the designs it already ran from the database.
+
+        Assumptions:
+        The design vector is rounded to significant_digits for the key. A cache hit restores only the stored values
+        into the Nexus, the rest of the Nexus (results, vehicles) is left as it was.
+
+        Source:
+        N/A
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+        self.tag                = 'evaluation_cache'
+        self.max_size           = 1000
+        self.filename           = None
+        self.significant_digits = 12
+        self.stored_values      = []
+        self.hits               = 0
+        self.misses             = 0
+        self.evaluations        = OrderedDict()
+
+    def key(self,nexus):
+        """Makes the key of the current design of a Nexus: the rounded unscaled inputs and the fidelity level.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            nexus                                 [Nexus()]
+
+            Outputs:
+            key                                   [str]
+
+            Properties Used:
+            self.significant_digits               [int]
+        """
+
+        values = np.array(nexus.optimization_problem.inputs[:,1],dtype=float)
+        digits = self.significant_digits - 1
+
+        key = ','.join(['%.*e' % (digits,value) for value in values])
+        key = key + ';' + str(nexus.fidelity_level)
+
+        return key
+
+    def load(self,nexus):
+        """Looks up the current design of a Nexus. If it has been evaluated the stored values are put back into the
+            Nexus.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            nexus                                 [Nexus()]
+
+            Outputs:
+            found                                 [bool]
+
+            Properties Used:
+            self.evaluations                      [OrderedDict]
+            self.filename                         [str]
+        """
+
+        key    = self.key(nexus)
+        record = self.evaluations.pop(key,None)
+
+        if record is None and self.filename is not None:
+            record = self._read(key)
+
+        if record is None:
+            self.misses += 1
+            return False
+
+        # Most recently used goes to the end
+        self._remember(key,record)
+        self.hits += 1
+
+        for path,value in record.values.items():
+            set_value(nexus,path,deepcopy(value))
+
+        return True
+
+    def store(self,nexus):
+        """Stores the current design of a Nexus, which must have just been evaluated.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            nexus                                 [Nexus()]
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.stored_values                    [list of str]
+            self.filename                         [str]
+        """
+
+        problem = nexus.optimization_problem
+
+        names = list(np.array(problem.objective)[:,0])
+        if len(problem.constraints):
+            names = names + list(np.array(problem.constraints)[:,0])
+        names = names + list(self.stored_values)
+
+        # An alias stands for its path, anything else is already a path
+        paths = dict(problem.aliases)
+
+        record = Data()
+        record.inputs = np.array(problem.inputs[:,1],dtype=float)
+        record.values = Data()
+        for name in names:
+            path = paths.get(name,name)
+            record.values[path] = deepcopy(eval('nexus.'+path))
+
+        key = self.key(nexus)
+        self.evaluations.pop(key,None)
+        self._remember(key,record)
+
+        if self.filename is not None:
+            self._write(key,record)
+
+    def stored_evaluations(self):
+        """Gives all the evaluations in the store, from the database when there is one.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            records                               [list of Data()]
+              inputs                              [array]
+              values                              [Data()]
+
+            Properties Used:
+            self.evaluations                      [OrderedDict]
+            self.filename                         [str]
+        """
+
+        if self.filename is None:
+            return self.evaluations.values()
+
+        connection = self._connect()
+        rows = connection.execute('SELECT record FROM evaluations ORDER BY rowid').fetchall()
+        connection.close()
+
+        return [pickle.loads(str(row[0])) for row in rows]
+
+    def _remember(self,key,record):
+        """Puts a record at the end of the in memory store and drops the least recently used records past max_size.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            key                                   [str]
+            record                                [Data()]
+
+            Outputs:
+            None
+
+            Properties Used:
+            self.max_size                         [int]
+        """
+
+        self.evaluations[key] = record
+        while len(self.evaluations) > self.max_size:
+            self.evaluations.popitem(last=False)
+
+    def _connect(self):
+        """Opens the database, making the table if it is new. A connection is opened for each access so that the cache
+            can be copied and pickled with the Nexus.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            connection                            [sqlite3.Connection]
+
+            Properties Used:
+            self.filename                         [str]
+        """
+
+        connection = sqlite3.connect(self.filename)
+        connection.execute('CREATE TABLE IF NOT EXISTS evaluations (key TEXT PRIMARY KEY, record BLOB)')
+
+        return connection
+
+    def _read(self,key):
+        """Reads a record from the database.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            key                                   [str]
+
+            Outputs:
+            record                                [Data() or None]
+
+            Properties Used:
+            None
+        """
+
+        connection = self._connect()
+        row = connection.execute('SELECT record FROM evaluations WHERE key = ?',(key,)).fetchone()
+        connection.close()
+
+        if row is None:
+            return None
+
+        return pickle.loads(str(row[0]))
+
+    def _write(self,key,record):
+        """Writes a record to the database.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            key                                   [str]
+            record                                [Data()]
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        connection = self._connect()
+        with connection:
+            connection.execute('INSERT OR REPLACE INTO evaluations (key, record) VALUES (?,?)',
+                               (key,sqlite3.Binary(pickle.dumps(record,pickle.HIGHEST_PROTOCOL))))
+        connection.close()
+
+
+# ----------------------------------------------------------------------
+#  Set a Value
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+def set_value(dictionary,path,value):
+    """ Sets a value in a dictionary from a path string, the reverse of the lookup in helper_functions.get_values.
+        Missing plain keys along the way are made as Data.
+
+    Assumptions:
+    Indexed parts of the path must already exist
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    path             [str]
+    value            [float or array]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    keys = path.split('.')
+    data = dictionary
+    for key in keys[:-1]:
+        if '[' not in key and key not in data:
+            data[key] = Data()
+        data = eval('data.'+key)
+
+    if '[' in keys[-1]:
+        exec('data.'+keys[-1]+' = value')
+    else:
+        data[keys[-1]] = value
@@ -4,6 +4,7 @@
 # Created:  Jul 2015, E. Botero 
 # Modified: Feb 2016, M. Vegh
 #           Apr 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,6 +17,8 @@ from SUAVE.Analyses import Process
 from copy import deepcopy
 import helper_functions as help_fun
 import numpy as np
+import multiprocessing
+import traceback
 
 # ----------------------------------------------------------------------
 #  Nexus Class
@@ -67,10 +70,13 @@ class Nexus(Data):
         self.last_inputs            = None
         self.last_fidelity          = None
         self.evaluation_count       = 0
+        self.evaluation_cache       = None
+        self.compiled_aliases       = Data()
     
     def evaluate(self,x = None):
         """This function runs the problem you setup in SUAVE.
             If the last time you ran this the inputs were the same, a cache is used.
+            With an evaluation_cache the earlier evaluations are checked before running, and new ones are stored.
     
             Assumptions:
             None
@@ -94,10 +100,79 @@ class Nexus(Data):
         if np.all(self.optimization_problem.inputs==self.last_inputs) \
            and self.last_fidelity == self.fidelity_level:
             pass
+        elif self.evaluation_cache is not None and self.evaluation_cache.load(self):
+            self.last_inputs   = deepcopy(self.optimization_problem.inputs)
+            self.last_fidelity = self.fidelity_level
         else:
             self._really_evaluate()
+            if self.evaluation_cache is not None:
+                self.evaluation_cache.store(self)
         
     
+    def evaluate_batch(self,X,processes=1):
+        """Runs the problem for many designs, for sampling plans and population based optimizers.
+            The designs are split over a pool of worker processes, each with its own copy of the nexus.
+            A design that raises an error is marked as failed and does not stop the others.
+    
+            Assumptions:
+            The workers are forked, so anything the procedure changes in the nexus stays in the workers.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            X                  [array]  designs, one scaled input vector per row
+            processes          [int]    number of worker processes, the designs are run in this process when 1
+    
+            Outputs:
+            batch              [Data()]
+              inputs           [array]  the designs
+              objective        [array]  scaled objective of each design, nan if it failed
+              constraints      [array]  scaled constraints of each design (designs x constraints), nan if it failed
+              success          [array]  True for each design that ran
+              errors           [list]   the error of each design that failed, None if it ran
+    
+            Properties Used:
+            None
+        """
+        
+        X = np.atleast_2d(np.array(X,dtype=float))
+        
+        if processes > 1 and len(X) > 1:
+            pool = multiprocessing.Pool(processes,_batch_setup,(self,))
+            try:
+                results = pool.map(_batch_evaluate,X,chunksize=1)
+                pool.close()
+            except:
+                pool.terminate()
+                raise
+            finally:
+                pool.join()
+        else:
+            results = [_evaluate_design(self,x) for x in X]
+            
+        n_constraints = len(self.optimization_problem.constraints)
+        
+        batch = Data()
+        batch.inputs      = X
+        batch.objective   = np.zeros(len(X)) * np.nan
+        batch.constraints = np.zeros((len(X),n_constraints)) * np.nan
+        batch.success     = np.zeros(len(X),dtype=bool)
+        batch.errors      = []
+        
+        for ii,(objective,constraints,count,error) in enumerate(results):
+            if error is None:
+                batch.objective[ii]   = objective
+                batch.constraints[ii] = constraints
+                batch.success[ii]     = True
+            batch.errors.append(error)
+            
+            # Procedure runs made by the workers
+            if processes > 1 and len(X) > 1:
+                self.evaluation_count += count
+                
+        return batch
+    
     def _really_evaluate(self):
         """Tricky little function you're not supposed to use. Doesn't check if the last inputs were already run.
             This steps through like a process through the nexus, and stores the results.
@@ -159,7 +234,7 @@ class Nexus(Data):
         objective   = self.optimization_problem.objective
         results     = self.results
     
-        objective_value  = help_fun.get_values(self,objective,aliases)  
+        objective_value  = help_fun.get_values(self,objective,aliases,self.alias_accessors(objective[:,0]))  
         scaled_objective = help_fun.scale_obj_values(objective,objective_value)
         
         return scaled_objective
@@ -199,7 +274,7 @@ class Nexus(Data):
         if iqconstraints == []:
             scaled_constraints = []
         else:
-            constraint_values = help_fun.get_values(self,iqconstraints,aliases)
+            constraint_values = help_fun.get_values(self,iqconstraints,aliases,self.alias_accessors(iqconstraints[:,0]))
             constraint_values[iqconstraints[:,1]=='<'] = -constraint_values[iqconstraints[:,1]=='<']
             bnd_constraints   = constraint_values - help_fun.scale_const_bnds(iqconstraints)
             scaled_constraints = help_fun.scale_const_values(iqconstraints,constraint_values)
@@ -243,7 +318,7 @@ class Nexus(Data):
         if eqconstraints == []:
             scaled_constraints = []
         else:
-            constraint_values = help_fun.get_values(self,eqconstraints,aliases) - help_fun.scale_const_bnds(eqconstraints)
+            constraint_values = help_fun.get_values(self,eqconstraints,aliases,self.alias_accessors(eqconstraints[:,0])) - help_fun.scale_const_bnds(eqconstraints)
             scaled_constraints = help_fun.scale_const_values(eqconstraints,constraint_values)
 
         return scaled_constraints   
@@ -273,7 +348,7 @@ class Nexus(Data):
         constraints = self.optimization_problem.constraints
         results     = self.results
     
-        constraint_values  = help_fun.get_values(self,constraints,aliases) 
+        constraint_values  = help_fun.get_values(self,constraints,aliases,self.alias_accessors(constraints[:,0])) 
         scaled_constraints = help_fun.scale_const_values(constraints,constraint_values)
     
         return scaled_constraints     
@@ -310,7 +385,36 @@ class Nexus(Data):
         aliases = self.optimization_problem.aliases
         vehicle = self.vehicle_configurations
         
-        self    = help_fun.set_values(self,inputs,converted_values,aliases)     
+        self    = help_fun.set_values(self,inputs,converted_values,aliases,self.alias_accessors(inputs[:,0]))     
+    
+    def alias_accessors(self,names):
+        """Gives the accessors of a list of input or output names. The aliases are resolved the first
+            time the names are used and kept in compiled_aliases. Clear compiled_aliases if the aliases,
+            or the keys under their wildcards, change.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            names              [list of str]
+    
+            Outputs:
+            accessors          [list of Alias_Accessor()]
+    
+            Properties Used:
+            None
+        """
+        
+        key = ','.join(names)
+        
+        if key not in self.compiled_aliases:
+            aliases = self.optimization_problem.aliases
+            self.compiled_aliases[key] = help_fun.compile_aliases(self,names,aliases)
+        
+        return self.compiled_aliases[key]
     
     def constraints_individual(self,x = None):
         """Put's the values of the problem in the right place.
@@ -425,7 +529,90 @@ class Nexus(Data):
         print const_table
         
         return inpu,const_table
-                               
-        
+
+
+# ----------------------------------------------------------------------
+#  Batch Evaluation
+# ----------------------------------------------------------------------
+
+# The nexus evaluated by the batch functions, one in each worker process
+_batch_nexus = None
+
+def _batch_setup(nexus):
+    """Sets the nexus used by _batch_evaluate. It is the initializer of the worker processes.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        nexus              [Nexus()]
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """
+    
+    global _batch_nexus
+    _batch_nexus = nexus
+
+def _batch_evaluate(x):
+    """Runs one design of a batch on the nexus of this worker process.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        x                  [vector]
+
+        Outputs:
+        objective          [float]
+        constraints        [vector]
+        count              [int]     procedure runs made for this design
+        error              [str]     the traceback, None if the design ran
+
+        Properties Used:
+        None
+    """
+    
+    return _evaluate_design(_batch_nexus,x)
+
+def _evaluate_design(nexus,x):
+    """Runs one design of a batch, catching any error so the rest of the batch carries on.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        nexus              [Nexus()]
+        x                  [vector]
+
+        Outputs:
+        objective          [float]
+        constraints        [vector]
+        count              [int]     procedure runs made for this design
+        error              [str]     the traceback, None if the design ran
+
+        Properties Used:
+        None
+    """
+    
+    start = nexus.evaluation_count
+    
+    try:
+        objective   = nexus.objective(x)[0]
+        constraints = nexus.all_constraints(x)
+    except Exception:
+        return None, None, nexus.evaluation_count - start, traceback.format_exc()
     
- 
+    return objective, constraints, nexus.evaluation_count - start, None
@@ -3,6 +3,7 @@
 #
 # Created:  Apr 2017, T. MacDonald
 # Modified: Jun 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -18,6 +19,7 @@ from SUAVE.Core import Data
 from SUAVE.Optimization import helper_functions as help_fun
 import os
 import sys
+import multiprocessing
 
 # ----------------------------------------------------------------------
 #  Trust Region Optimization Class
@@ -65,6 +67,7 @@ class Trust_Region_Optimization(Data):
         self.fidelity_levels                    = 2     # only two are currently supported
         self.evaluation_order                   = [1,2] # currently this order is necessary for proper functionality   
         self.optimizer                          = 'SNOPT'
+        self.processes                          = 1     # worker processes for the fidelity levels and their finite differences
         
     def optimize(self,problem,print_output=False):
         """Optimizes the problem
@@ -97,7 +100,7 @@ class Trust_Region_Optimization(Data):
           trust_region_max_iterations         [-]    
           fidelity_levels                     [-]
           evaluation_order                    List of the fidelity level order
-          evaluate_model(..)
+          evaluate_levels(..)
           calculate_correction(..)
           calculate_constraint_violation(..)
           optimizer                           <string> Determines what optimizer is used
@@ -158,9 +161,9 @@ class Trust_Region_Optimization(Data):
             g    = [None]*self.fidelity_levels
             dg   = [None]*self.fidelity_levels            
             
+            level_results = self.evaluate_levels(problem,x)
             for level in self.evaluation_order:
-                problem.fidelity_level = level
-                res = self.evaluate_model(problem,x)
+                res = level_results[level]
                 f[level-1]  = res[0]    # objective value
                 df[level-1] = res[1]    # objective derivate vector
                 g[level-1]  = res[2]    # constraints vector
@@ -385,6 +388,85 @@ class Trust_Region_Optimization(Data):
         return (f,df,g,dg)
 
 
+    def evaluate_levels(self,problem,x):
+        """Evaluates every fidelity level, with derivatives, at the trust region center. With more than one
+        process the levels and all of their finite difference steps are run at the same time on a pool of
+        worker processes, each with its own copy of the nexus. The derivatives are put together in the
+        same way as the serial finite differences, so the results match the serial run.
+
+        Assumptions:
+        An evaluation does not depend on the evaluations run before it
+
+        Source:
+        N/A
+
+        Inputs:
+        problem                  <Nexus class>
+        x                        <numpy array>
+
+        Outputs:
+        results                  <dict> (f,df,g,dg) of each fidelity level, see evaluate_model
+
+        Properties Used:
+        self.
+          evaluation_order       List of the fidelity level order
+          difference_interval    [-]
+          processes              [-]
+        """ 
+        
+        results = dict()
+        
+        if self.processes <= 1:
+            for level in self.evaluation_order:
+                problem.fidelity_level = level
+                results[level] = self.evaluate_model(problem,x)
+            return results
+        
+        # the center and each finite difference step, as in Nexus.finite_difference
+        fd_step = self.difference_interval
+        points  = [x]
+        for ii in xrange(0,len(x)):
+            newx     = np.asarray(x)*1.0
+            newx[ii] = newx[ii] + fd_step
+            points.append(newx)
+            
+        tasks = [(level,point) for level in self.evaluation_order for point in points]
+        
+        pool = multiprocessing.Pool(self.processes,_level_setup,(problem,))
+        try:
+            outputs = pool.map(_level_evaluate,tasks,chunksize=1)
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+        
+        for level in self.evaluation_order:
+            level_outputs = outputs[:len(points)]
+            outputs       = outputs[len(points):]
+            
+            f, g = level_outputs[0][0:2]
+            
+            grad_obj = np.zeros(len(x))
+            jac_con  = np.zeros((len(x),len(g)))
+            con2     = (g*np.ones_like(jac_con))
+            
+            for ii in xrange(0,len(x)):
+                grad_obj[ii]  = level_outputs[ii+1][0]
+                jac_con[ii,:] = level_outputs[ii+1][1]
+                
+            grad_obj = (grad_obj - f)/fd_step
+            jac_con  = (jac_con - con2).T/fd_step
+            
+            results[level] = (f,grad_obj.astype(float),g,jac_con.astype(float))
+            
+            # Procedure runs made by the workers
+            problem.evaluation_count += sum([output[2] for output in level_outputs])
+            
+        return results
+
+
     def evaluate_corrected_model(self,x,problem=None,corrections=None,tr=None):
         """Evaluates the SUAVE nexus problem and applies corrections to the results.
         
@@ -705,4 +787,66 @@ class Trust_Region_Optimization(Data):
             tr_action = 2
             print 'Trust region size remains the same at %f\n\n' % tr.size        
             
-        return tr_action
\ No newline at end of file
+        return tr_action
+
+
+# ----------------------------------------------------------------------
+#  Worker functions for the fidelity levels
+# ----------------------------------------------------------------------
+
+# The nexus of this process, set by _level_setup
+_level_nexus = None
+
+def _level_setup(problem):
+    """Stores the nexus in the process that will run the fidelity levels.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    problem                  <Nexus class>
+
+    Outputs:
+    None
+
+    Properties Used:
+    None
+    """
+    
+    global _level_nexus
+    _level_nexus = problem
+
+def _level_evaluate(task):
+    """Runs one fidelity level at one point.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    task                     <tuple> fidelity level and point
+
+    Outputs:
+    f                        objective
+    g                        constraints
+    count                    [-] procedure runs made for this point
+
+    Properties Used:
+    None
+    """
+    
+    level, x = task
+    
+    nexus = _level_nexus
+    start = nexus.evaluation_count
+    
+    nexus.fidelity_level = level
+    f = nexus.objective(x)
+    g = nexus.all_constraints(x)
+    
+    return f, g, nexus.evaluation_count - start
@@ -3,6 +3,7 @@
 #
 # Created:  Apr 2017, T. MacDonald
 # Modified: Jun 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -28,7 +29,8 @@ import sys
 
 ## @ingroup Optimization-Package_Setups
 def Additive_Solve(problem,num_fidelity_levels=2,num_samples=10,max_iterations=10,
-                   tolerance=1e-6,opt_type='basic',num_starts=3,print_output=True):
+                   tolerance=1e-6,opt_type='basic',num_starts=3,print_output=True,
+                   num_candidates=2000,processes=1):
     """Solves a multifidelity problem using an additive corrections
 
     Assumptions:
@@ -46,6 +48,8 @@ def Additive_Solve(problem,num_fidelity_levels=2,num_samples=10,max_iterations=1
     opt_type            [str]
     num_starts          [int]
     print_output        [bool]
+    num_candidates      [int]    candidate points in the expected improvement search
+    processes           [int]    worker processes for the low fidelity runs of the search
     
     Outputs:
     (fOpt,xOpt)  [tuple]
@@ -128,24 +132,14 @@ def Additive_Solve(problem,num_fidelity_levels=2,num_samples=10,max_iterations=1
 
         elif opt_type == 'MEI': # Next point determined by maximum expected improvement
             fstar = np.min(f[1,:])
-            opt_prob = pyOpt.Optimization('SUAVE',evaluate_expected_improvement, \
-                                      obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate,fstar=fstar)     
-            
-            # Set up opt_prob
-            initialize_opt_vals(opt_prob,obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,None)     
-               
-            # Use a global optimizer
-            opt = pyOpt.pyALPSO.ALPSO()    
-            opt.setOption('maxOuterIter',value=20)
-            opt.setOption('seed',value=1.)
             
             problem.fidelity_level = 1
             
-            outputs = opt(opt_prob,problem=problem, \
-                          obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate,fstar=fstar,cons=con)#, sens_step = sense_step)
-            fOpt  = np.nan 
-            imOpt = outputs[0]
-            xOpt  = outputs[1]
+            # Batched candidate search with a multistart local refinement
+            imOpt, xOpt = maximize_expected_improvement(problem,f_additive_surrogate,g_additive_surrogate,fstar,con, \
+                                                        x_low_bound,x_up_bound,num_candidates=num_candidates, \
+                                                        num_starts=num_starts,processes=processes)
+            fOpt  = np.nan
         
         # ---------------------------------
         
@@ -205,7 +199,7 @@ def Additive_Solve(problem,num_fidelity_levels=2,num_samples=10,max_iterations=1
                 min_ind = np.argmin(f[1])
                 x_eval = x_samples[min_ind]
             
-                initalize_opt_vals(opt_prob,obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval)    
+                initialize_opt_vals(opt_prob,obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval)    
             
                 opt = pyOpt.pySNOPT.SNOPT()      
             
@@ -338,39 +332,257 @@ def evaluate_expected_improvement(x,problem=None,obj_surrogate=None,cons_surroga
     
     """    
 
-    obj   = problem.objective(x)
-    const = problem.all_constraints(x).tolist()
-    fail  = np.array(np.isnan(obj.tolist()) or np.isnan(np.array(const).any())).astype(int)
+    EI, const, success = evaluate_expected_improvement_batch(np.atleast_2d(x),problem,obj_surrogate, \
+                                                             cons_surrogate,fstar,cons)
+    EI    = EI[0]
+    const = const[0].tolist()
+    fail  = int(not success[0])
+
+    print 'Inputs'
+    print x
+    print 'Obj'
+    print -EI
+    print 'Con'
+    print const
+        
+    return -EI,const,fail
+
+## @ingroup Optimization-Package_Setups
+def evaluate_expected_improvement_batch(X,problem,obj_surrogate,cons_surrogate,fstar,cons,processes=1):
+    """Evaluates the expected improvement of many points at once. The low fidelity model is run at each point and
+    the surrogates are queried for all of the points in a single call.
+
+    Assumptions:
+    The fidelity level of the problem is already set to the low fidelity model
+
+    Source:
+    N/A
+
+    Inputs:
+    X              [array]  scaled points, one per row
+    problem        [nexus()]
+    obj_surrogate  [fun()]
+    cons_surrogate [fun()]
+    fstar          [float]
+    cons           [array]
+    processes      [int]
+    
+    Outputs:
+    EI             [array]
+    const          [array]  corrected constraints, points x constraints, feasible when <= 0
+    success        [array]
+
+    Properties Used:
+    N/A    
+    
+    """   
+    
+    X = np.atleast_2d(X)
+    
+    batch = problem.evaluate_batch(X,processes=processes)
     
     # Get uncertainty information
-    obj_addition, obj_sigma   = obj_surrogate.predict(x,return_std=True)
-    cons_addition, cons_sigma = cons_surrogate.predict(x,return_std=True)
+    obj_addition, obj_sigma = obj_surrogate.predict(X,return_std=True)
+    cons_addition           = cons_surrogate.predict(X)
     
-    fhat  = obj[0] + obj_addition
-    # Calculate expected improvement (based on Schonlau, Computer Experiments and Global Optimization, 1997)
-    EI    = (fstar-fhat)*norm.cdf((fstar-fhat)/obj_sigma) + obj_sigma*norm.pdf((fstar-fhat)/obj_sigma)
-    const = const + cons_addition
+    fhat  = batch.objective + obj_addition
+    EI    = expected_improvement(fhat,obj_sigma,fstar)
+    const = batch.constraints + np.reshape(cons_addition,np.shape(batch.constraints))
+    
+    # Adjust signs so that feasible constraints are negative
+    signs, offset = constraint_signs(cons)
+    const = const*signs - offset*signs
+    
+    # A failed point gives no improvement
+    EI[~batch.success] = 0.
+    
+    return EI, const, batch.success
+
+## @ingroup Optimization-Package_Setups
+def expected_improvement(fhat,sigma,fstar):
+    """Calculates the expected improvement over fstar of points with a predicted value fhat and a standard
+    deviation sigma
+
+    Assumptions:
+    Points with no uncertainty improve by the amount they are below fstar
+
+    Source:
+    Schonlau, Computer Experiments and Global Optimization, 1997
+
+    Inputs:
+    fhat           [array]
+    sigma          [array]
+    fstar          [float]
+    
+    Outputs:
+    EI             [array]
+
+    Properties Used:
+    N/A    
+    
+    """   
+    
+    fhat  = np.atleast_1d(fhat)
+    sigma = np.atleast_1d(sigma)
+    
+    improvement = fstar - fhat
+    EI          = np.maximum(improvement,0.)
+    
+    uncertain     = sigma > 0.
+    z             = improvement[uncertain]/sigma[uncertain]
+    EI[uncertain] = improvement[uncertain]*norm.cdf(z) + sigma[uncertain]*norm.pdf(z)
+    
+    return EI
+
+## @ingroup Optimization-Package_Setups
+def constraint_signs(cons):
+    """Gives the signs and offsets that turn the scaled constraints into the form g <= 0
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    cons           [array]
+    
+    Outputs:
+    signs          [array]
+    offset         [array]
+
+    Properties Used:
+    N/A    
+    
+    """ 
     
-    # Adjust signs for optimizer (this is specific to ALPSO)
     signs  = np.ones([1,len(cons)])
     offset = np.zeros([1,len(cons)])
     for ii,con in enumerate(cons):
         if cons[ii][1] == '>':
             signs[0,ii] = -1
-        offset[0,ii] = cons[ii][2]
-    
+            
+    # The edges are scaled like the constraints
+    if len(cons):
+        offset[0,:] = help_fun.scale_const_values(cons,help_fun.scale_const_bnds(cons))
+        
+    return signs, offset
+
+## @ingroup Optimization-Package_Setups
+def maximize_expected_improvement(problem,obj_surrogate,cons_surrogate,fstar,cons,x_low_bound,x_up_bound,
+                                  num_candidates=2000,num_starts=3,max_iterations=20,step_tolerance=1e-3,
+                                  processes=1):
+    """Finds the point of maximum expected improvement. A latin hypercube of candidates is evaluated in one
+    batch, then the best candidates are refined together by a compass search where each step tries every
+    coordinate direction of every start in one batch.
+
+    Assumptions:
+    The fidelity level of the problem is already set to the low fidelity model
+    Feasible candidates are ranked above infeasible ones, which are ranked by their constraint violation
+
+    Source:
+    N/A
+
+    Inputs:
+    problem        [nexus()]
+    obj_surrogate  [fun()]
+    cons_surrogate [fun()]
+    fstar          [float]
+    cons           [array]
+    x_low_bound    [array]
+    x_up_bound     [array]
+    num_candidates [int]
+    num_starts     [int]
+    max_iterations [int]
+    step_tolerance [float]  smallest step as a fraction of the bounds
+    processes      [int]
     
-    const = const*signs - offset*signs
-    const = const.tolist()[0]
+    Outputs:
+    EI             [float]
+    x              [array]
 
-    print 'Inputs'
-    print x
-    print 'Obj'
-    print -EI
-    print 'Con'
-    print const
+    Properties Used:
+    N/A    
+    
+    """     
+    
+    x_low_bound = np.array(x_low_bound,dtype=float)
+    x_up_bound  = np.array(x_up_bound,dtype=float)
+    num_dims    = len(x_low_bound)
+    
+    # Global candidate search
+    X = latin_hypercube_sampling(num_dims,num_candidates,bounds=(x_low_bound,x_up_bound),criterion='random')
+    
+    EI, const, success = evaluate_expected_improvement_batch(X,problem,obj_surrogate,cons_surrogate,fstar,cons,processes)
+    merit = improvement_merit(EI,const,success)
+    
+    # Local refinement of the best candidates
+    order = np.argsort(-merit)[:num_starts]
+    x     = X[order]
+    merit = merit[order]
+    step  = np.tile(0.1*(x_up_bound-x_low_bound),(len(x),1))
+    
+    directions = np.vstack((np.eye(num_dims),-np.eye(num_dims)))
+    
+    for ii in xrange(max_iterations):
+        active = np.any(step > step_tolerance*(x_up_bound-x_low_bound),axis=1)
+        if not np.any(active):
+            break
         
-    return -EI,const,fail
+        # Every direction of every active start
+        trials = x[active][:,None,:] + directions[None,:,:]*step[active][:,None,:]
+        trials = np.clip(trials,x_low_bound,x_up_bound)
+        trials = np.reshape(trials,(-1,num_dims))
+        
+        trial_EI, trial_const, trial_success = evaluate_expected_improvement_batch(trials,problem,obj_surrogate, \
+                                                                                   cons_surrogate,fstar,cons,processes)
+        trial_merit = np.reshape(improvement_merit(trial_EI,trial_const,trial_success),(-1,len(directions)))
+        trials      = np.reshape(trials,(-1,len(directions),num_dims))
+        
+        # Move the starts that improved, shrink the step of the others
+        best     = np.argmax(trial_merit,axis=1)
+        rows     = np.arange(len(best))
+        improved = trial_merit[rows,best] > merit[active]
+        
+        index                  = np.where(active)[0]
+        x[index[improved]]     = trials[rows[improved],best[improved]]
+        merit[index[improved]] = trial_merit[rows[improved],best[improved]]
+        step[index[~improved]] = step[index[~improved]]*0.5
+    
+    best = np.argmax(merit)
+    EI, const, success = evaluate_expected_improvement_batch(x[best],problem,obj_surrogate,cons_surrogate,fstar,cons)
+    
+    return EI[0], x[best]
+
+## @ingroup Optimization-Package_Setups
+def improvement_merit(EI,const,success):
+    """Ranks points by their expected improvement when they are feasible and by their constraint violation when
+    they are not
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    EI             [array]
+    const          [array]  feasible when <= 0
+    success        [array]
+    
+    Outputs:
+    merit          [array]  the expected improvement of feasible points, minus the violation of the others
+
+    Properties Used:
+    N/A    
+    
+    """ 
+    
+    violation = np.sum(np.maximum(const,0.),axis=1)
+    merit     = np.where(violation > 0.,-violation,EI)
+    merit[~success] = -np.inf
+    
+    return merit
 
 ## @ingroup Optimization-Package_Setups
 def expected_improvement_carpet(lbs,ubs,problem,obj_surrogate,cons_surrogate,fstar,show_log_improvement=False):
@@ -409,25 +621,15 @@ def expected_improvement_carpet(lbs,ubs,problem,obj_surrogate,cons_surrogate,fst
     x0s = np.linspace(lbs[0],ubs[0],linspace_num)
     x1s = np.linspace(lbs[1],ubs[1],linspace_num) 
         
-    EI = np.zeros([linspace_num,linspace_num])        
-        
-    for ii,x0 in enumerate(x0s):
-        for jj,x1 in enumerate(x1s):
-            x = [x0,x1]
-            obj   = problem.objective(x)
-            const = problem.all_constraints(x).tolist()    
-        
-            obj_addition, obj_sigma   = obj_surrogate.predict(x,return_std=True)
-            cons_addition, cons_sigma = cons_surrogate.predict(x,return_std=True)
-            
-            fhat      = obj[0] + obj_addition
-            EI[jj,ii] = (fstar-fhat)*norm.cdf((fstar-fhat)/obj_sigma) + obj_sigma*norm.pdf((fstar-fhat)/obj_sigma)
-            const     = const + cons_addition
-            const     = const.tolist()[0]
-            
-            print ii
-            print jj
-            print 'Expected Improvement: ' + str(EI[ii,jj])
+    x0_grid, x1_grid = np.meshgrid(x0s,x1s)
+    X = np.vstack((x0_grid.flatten(),x1_grid.flatten())).T
+    
+    batch = problem.evaluate_batch(X)
+    
+    obj_addition, obj_sigma = obj_surrogate.predict(X,return_std=True)
+    
+    fhat = batch.objective + obj_addition
+    EI   = np.reshape(expected_improvement(fhat,obj_sigma,fstar),[linspace_num,linspace_num])
             
     import matplotlib.pyplot as plt
             
@@ -3,6 +3,7 @@
 #
 #Created:  Jul 2016, M. Vegh
 #Modified: Feb 2017, M. Vegh
+#          Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -59,6 +60,8 @@ class Surrogate_Optimization(Data):
         self.optimization_filename = None #where you keep track of results
         self.number_of_points      = 0.
         self.max_iterations        = 100
+        self.processes             = 1   #worker processes for the initial sample
+        self.kriging_retrain_interval = 5 #added points between full retrains of the Kriging hyperparameters, 0 to never retrain
         
     def build_surrogate(self):
         """Builds a surrogate for the problem
@@ -108,11 +111,16 @@ class Surrogate_Optimization(Data):
             Xsample = self.sample_plan(scaled_bounds,npoints)
     
             #now run; results will be written to file, which can be read later
-            for i in range(0,npoints):
-        
-                opt_prob.inputs[:,1] = Xsample[i,:]*scl#/base_units
+            if self.processes > 1:
+                #the workers write to the file as they finish, so the points may not be in sample order
+                batch = problem.evaluate_batch(Xsample,self.processes)
+                print 'failed sample points = ', np.sum(~batch.success)
+            else:
+                for i in range(0,npoints):
             
-                problem.objective()
+                    opt_prob.inputs[:,1] = Xsample[i,:]*scl#/base_units
+                
+                    problem.objective()
         return 
         
         
@@ -163,11 +171,18 @@ class Surrogate_Optimization(Data):
                     
                 else:       #add to existing surrogate to improve code speed
                     xt1= time.time()
+                    #addPoint updates the model with the current hyperparameters, a full retrain
+                    #of the hyperparameters is only done every kriging_retrain_interval points
+                    interval        = self.kriging_retrain_interval
+                    retrain         = interval > 0 and j % interval == 0
+                    constraints_out = problem.all_constraints()
                     obj_surrogate.addPoint(x_out, output_real[0])
-                    obj_surrogate.train()
+                    if retrain:
+                        obj_surrogate.train()
                     for k in range(len(constraints_surrogates)):
-                        constraints_surrogates[k].addPoint(x_out,problem.all_constraints()[k])
-                        constraints_surrogates[k].train()
+                        constraints_surrogates[k].addPoint(x_out,constraints_out[k])
+                        if retrain:
+                            constraints_surrogates[k].train()
                     xt2= time.time()
                     #reassign to surrogate_function
                     surrogate_function.obj_surrogate  = obj_surrogate
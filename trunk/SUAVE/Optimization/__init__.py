@@ -2,9 +2,10 @@
 # The files that help you setup an optimization problem.
 
 from Nexus import Nexus
+from Evaluation_Cache import Evaluation_Cache
 import helper_functions
 import Package_Setups
-from read_optimization_outputs import read_optimization_outputs
+from read_optimization_outputs import read_optimization_outputs, convert_optimization_outputs
 from write_optimization_outputs import write_optimization_outputs
 from carpet_plot import carpet_plot
 from line_plot import line_plot
@@ -0,0 +1,125 @@
+## @ingroup Optimization
+# binary_history.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import os
+
+# A history file starts with this, then the number of columns as an int64,
+# then one record of float64 values per row
+history_marker = 'SUAVEHST'
+header_size    = len(history_marker) + 8
+
+# ----------------------------------------------------------------------
+#  is_binary_history
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+def is_binary_history(filename):
+    """Checks if a history file is in the binary format. A file that does not exist yet is binary if its
+    extension is .bin
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        filename          [str]
+
+        Outputs:
+        binary            [bool]
+
+        Properties Used:
+        None
+    """
+
+    if not os.path.exists(filename) or os.path.getsize(filename) == 0:
+        return os.path.splitext(filename)[1] == '.bin'
+
+    file_in = open(filename, 'rb')
+    marker  = file_in.read(len(history_marker))
+    file_in.close()
+
+    return marker == history_marker
+
+# ----------------------------------------------------------------------
+#  write_history_record
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+def write_history_record(filename, record):
+    """Appends a record, or an array with one record per row, to a binary history file, starting the file
+    if it is new
+
+        Assumptions:
+        Every record of a file has the same length
+
+        Source:
+        N/A
+
+        Inputs:
+        filename          [str]
+        record            [array]
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """
+
+    record   = np.atleast_2d(np.array(record, dtype = np.float64))
+    new_file = not os.path.exists(filename) or os.path.getsize(filename) == 0
+
+    file_out = open(filename, 'ab')
+    if new_file:
+        file_out.write(history_marker)
+        np.array([record.shape[1]], dtype = np.int64).tofile(file_out)
+    record.tofile(file_out)
+    file_out.close()
+
+    return
+
+# ----------------------------------------------------------------------
+#  read_history
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+def read_history(filename):
+    """Maps a binary history file into memory without reading it. Rows are only read from disk when they
+    are used.
+
+        Assumptions:
+        A partial last record, from an interrupted write, is left out
+
+        Source:
+        N/A
+
+        Inputs:
+        filename          [str]
+
+        Outputs:
+        records           [array]  read only, one row per record
+
+        Properties Used:
+        None
+    """
+
+    if not is_binary_history(filename):
+        raise ValueError(filename + ' is not a binary history file')
+
+    columns = np.fromfile(filename, dtype = np.int64, count = 2)[1]
+    rows    = (os.path.getsize(filename) - header_size)//(8*columns)
+
+    if rows == 0:
+        return np.zeros((0, columns))
+
+    return np.memmap(filename, dtype = np.float64, mode = 'r', offset = header_size, shape = (rows, columns))
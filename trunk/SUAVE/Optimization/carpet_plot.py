@@ -3,26 +3,39 @@
 #
 # Created : Feb 2016, M. Vegh 
 # Modified : Feb 2017, M. Vegh
+#            Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # -------------------------------------------
  
 from SUAVE.Core import Data
+from SUAVE.Methods.Missions.warm_start import segment_templates, restore_templates, segment_unknowns, seed_unknowns
 import numpy as np
 import matplotlib.pyplot as plt
+import multiprocessing
+import itertools
+import traceback
+import os
 
 # ----------------------------------------------------------------------
 #  carpet_plot
 # ----------------------------------------------------------------------
 
 ## @ingroup Optimization
-def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_index_0=0, sweep_index_1=1): 
+def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_index_0=0, sweep_index_1=1, processes=1, filename=None, warm_start=True): 
     """ Takes in an optimization problem and runs a carpet plot of the first 2 variables
         sweep_index_0, sweep_index_1 is index of variables you want to run carpet plot (i.e. sweep_index_0=0 means you want to sweep first variable, sweep_index_0 = 4 is the 5th variable)
+        
+        The grid is run along a serpentine path, one column of cells after another. With warm_start the segments of
+        the missions of the problem start from the unknowns of the cell next to it, when that cell was the last one run
+        in the same process. The columns can be split over worker processes. With a filename each finished cell is
+        written to the file straight away, after a header with the grid, and the cells already in the file are not run
+        again. Cells that failed are run again.
     
         Assumptions:
-        N/A
+        The missions of the problem are in problem.missions, and their solved states are left in mission.state.
+        The segments of the missions are left as they were.
     
         Source:
         N/A
@@ -34,6 +47,9 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
         plot_const         [int]
         sweep_index_0      [int]
         sweep_index_1      [int]
+        processes          [int]
+        filename           [str]
+        warm_start         [bool]
         
         Outputs:
         Beautiful Beautiful Plots!
@@ -73,15 +89,71 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
     inputs[1,:] = np.linspace(bnd[idx1][0], bnd[idx1][1], number_of_points)
 
     
-    #inputs defined; now run sweep
+    #serpentine path through the grid, the columns alternate direction
+    cells = []
     for i in range(0, number_of_points):
-        for j in range(0,number_of_points):
-            #problem.optimization_problem.inputs=base_inputs  #overwrite any previous modification
-            opt_prob.inputs[:,1][idx0]= inputs[0,i]
-            opt_prob.inputs[:,1][idx1]= inputs[1,j]
-   
-            obj[j,i]             = problem.objective()*obj_scaling
-            constraint_val[:,j,i]= problem.all_constraints().tolist()
+        column = range(0,number_of_points)
+        if i % 2:
+            column = column[::-1]
+        for j in column:
+            cells.append((i,j))
+            
+    #cells finished by an earlier run, a cell can be in the file more than once
+    header = carpet_plot_header(number_of_points, idx0, idx1, inputs)
+    if filename is not None and os.path.exists(filename):
+        #an interrupted write can leave a partial last line, new cells go after it
+        lines = open(filename).readlines()
+        if lines and not lines[-1].endswith('\n'):
+            open(filename,'w').writelines(lines[:-1])
+    if filename is not None and os.path.exists(filename) and os.path.getsize(filename) > 0:
+        file_header, file_cells = read_carpet_plot(filename)
+        if file_header is None or np.any(file_header != header):
+            raise ValueError('carpet plot file ' + filename + ' holds a different grid')
+        done = set()
+        for i,j,objective,constraints in file_cells:
+            if np.isnan(objective):
+                continue
+            obj[j,i]             = objective
+            constraint_val[:,j,i]= constraints
+            done.add((i,j))
+        cells = [cell for cell in cells if cell not in done]
+    elif filename is not None:
+        write_carpet_plot_header(filename, header)
+    
+    #inputs defined; now run sweep
+    if processes > 1 and len(cells) > 1:
+        pool    = multiprocessing.Pool(processes,_carpet_setup,(problem,idx0,idx1,inputs,warm_start))
+        results = pool.imap_unordered(_carpet_cell,cells,chunksize=number_of_points)
+    else:
+        pool    = None
+        _carpet_setup(problem,idx0,idx1,inputs,warm_start)
+        results = itertools.imap(_carpet_cell,cells)
+        
+    try:
+        for (i,j),objective,constraints,error in results:
+            if error is not None:
+                print 'carpet plot cell ' + str((i,j)) + ' failed:'
+                print error
+                objective   = np.nan
+                constraints = np.zeros(constraint_num) * np.nan
+                
+            obj[j,i]             = objective*obj_scaling
+            constraint_val[:,j,i]= constraints
+            
+            if filename is not None:
+                write_carpet_plot(filename,i,j,obj[j,i],constraint_val[:,j,i])
+                
+        if pool is not None:
+            pool.close()
+    except:
+        if pool is not None:
+            pool.terminate()
+        raise
+    finally:
+        if pool is not None:
+            pool.join()
+        else:
+            _carpet_restore()
   
     if plot_obj==1:
         plt.figure(0)
@@ -111,5 +183,278 @@ def carpet_plot(problem, number_of_points,  plot_obj=1, plot_const=0, sweep_inde
     outputs.constraint_val = constraint_val
     
     return outputs
+
+
+# ----------------------------------------------------------------------
+#  Carpet Plot Files
+# ----------------------------------------------------------------------
+
+## @ingroup Optimization
+def carpet_plot_header(number_of_points, sweep_index_0, sweep_index_1, inputs):
+    """ Gives the values that describe the grid of a carpet plot: the number of points, the sweep indices and the
+        bounds of the two swept inputs
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        number_of_points   [int]
+        sweep_index_0      [int]
+        sweep_index_1      [int]
+        inputs             [array]
+        
+        Outputs:
+        header             [array]
+    
+        Properties Used:
+        N/A
+    """
+    
+    return np.array([number_of_points, sweep_index_0, sweep_index_1,
+                     inputs[0,0], inputs[0,-1], inputs[1,0], inputs[1,-1]],dtype=float)
+
+## @ingroup Optimization
+def write_carpet_plot_header(filename, header):
+    """ Starts a carpet plot file with a line that describes the grid
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        filename           [str]
+        header             [array]
+        
+        Outputs:
+        N/A
+    
+        Properties Used:
+        N/A
+    """
+    
+    file = open(filename,'w')
+    file.write('# ' + ' '.join([repr(float(value)) for value in header]) + '\n')
+    file.close()
+
+## @ingroup Optimization
+def write_carpet_plot(filename, i, j, objective, constraints):
+    """ Appends one cell of a carpet plot to a file, one line per cell
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        filename           [str]
+        i                  [int]
+        j                  [int]
+        objective          [float]
+        constraints        [array]
+        
+        Outputs:
+        N/A
+    
+        Properties Used:
+        N/A
+    """
+    
+    values = [repr(float(value)) for value in np.append(objective,constraints)]
+    
+    file = open(filename,'a')
+    file.write(str(i) + ' ' + str(j) + ' ' + ' '.join(values) + '\n')
+    file.close()
+    
+## @ingroup Optimization
+def read_carpet_plot(filename):
+    """ Reads the header and the cells of a carpet plot written by write_carpet_plot
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        filename           [str]
+        
+        Outputs:
+        header             [array]  None if the file has no header
+        cells              [list of (i, j, objective, constraints)]
+    
+        Properties Used:
+        N/A
+    """
+    
+    header = None
+    cells  = []
+    
+    file = open(filename)
+    for line in file.readlines():
+        if line.startswith('#'):
+            header = np.array(line.split()[1:],dtype=float)
+            continue
+        values = line.split()
+        # an interrupted write can leave a partial last line
+        if len(values) < 3 or not line.endswith('\n'):
+            continue
+        i,j    = int(values[0]),int(values[1])
+        values = np.array(values[2:],dtype=float)
+        cells.append((i,j,values[0],values[1:]))
+    file.close()
+    
+    return header, cells
+
+
+# ----------------------------------------------------------------------
+#  Carpet Plot Cells
+# ----------------------------------------------------------------------
+
+# The sweep run by _carpet_cell, one in each worker process
+_carpet_sweep = None
+
+def _carpet_setup(problem, idx0, idx1, inputs, warm_start):
+    """ Sets the problem and grid used by _carpet_cell, and keeps the unknowns of the segments of the missions to
+        start cold cells from. It is the initializer of the worker processes.
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        problem            [Nexus Class]
+        idx0               [int]
+        idx1               [int]
+        inputs             [array]
+        warm_start         [bool]
+        
+        Outputs:
+        N/A
+    
+        Properties Used:
+        N/A
+    """
+    
+    global _carpet_sweep
+    _carpet_sweep = Data()
+    _carpet_sweep.problem    = problem
+    _carpet_sweep.indices    = (idx0, idx1)
+    _carpet_sweep.inputs     = inputs
+    _carpet_sweep.warm_start = warm_start
+    _carpet_sweep.last_cell  = None
+    _carpet_sweep.unknowns   = Data()
+    _carpet_sweep.templates  = Data()
+    
+    for tag,mission in _carpet_missions(problem):
+        _carpet_sweep.templates[tag] = segment_templates(mission)
+    
+def _carpet_restore():
+    """ Puts the unknowns of the segments of the missions back as they were before the sweep
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        N/A
+        
+        Outputs:
+        N/A
+    
+        Properties Used:
+        N/A
+    """
+    
+    for tag,mission in _carpet_missions(_carpet_sweep.problem):
+        restore_templates(mission, _carpet_sweep.templates[tag])
+    
+def _carpet_missions(problem):
+    """ Lists the missions of a problem that have segments
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        problem            [Nexus Class]
+        
+        Outputs:
+        missions           [list of (str, Mission)]
+    
+        Properties Used:
+        N/A
+    """
+    
+    missions = problem.get('missions',None)
+    if missions is None:
+        return []
+    
+    return [(tag,mission) for tag,mission in missions.items() if mission.has_key('segments')]
+    
+def _carpet_cell(cell):
+    """ Runs one cell of a carpet plot, catching any error so the rest of the grid carries on
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        cell               [(int, int)]
+        
+        Outputs:
+        cell               [(int, int)]
+        objective          [float]
+        constraints        [array]
+        error              [str]
+    
+        Properties Used:
+        N/A
+    """
+    
+    problem    = _carpet_sweep.problem
+    idx0, idx1 = _carpet_sweep.indices
+    inputs     = _carpet_sweep.inputs
+    opt_prob   = problem.optimization_problem
+    i, j       = cell
+    
+    #start from the last cell when it is next to this one
+    last = _carpet_sweep.last_cell
+    if _carpet_sweep.warm_start and last is not None and abs(last[0]-i) + abs(last[1]-j) == 1:
+        for tag,mission in _carpet_missions(problem):
+            seed_unknowns(mission, 0., [(0., _carpet_sweep.unknowns[tag])], False)
+    else:
+        _carpet_restore()
+    _carpet_sweep.last_cell = None
+    
+    try:
+        opt_prob.inputs[:,1][idx0]= inputs[0,i]
+        opt_prob.inputs[:,1][idx1]= inputs[1,j]
+        
+        objective   = problem.objective()
+        constraints = np.array(problem.all_constraints().tolist())
+    except Exception:
+        return cell, None, None, traceback.format_exc()
+    
+    #keep the solved unknowns for the next cell
+    _carpet_sweep.last_cell = cell
+    for tag,mission in _carpet_missions(problem):
+        if mission.state.has_key('segments'):
+            _carpet_sweep.unknowns[tag] = segment_unknowns(mission.state)
+        else:
+            _carpet_sweep.last_cell = None
     
-    
\ No newline at end of file
+    return cell, objective, constraints, None
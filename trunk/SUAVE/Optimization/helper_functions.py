@@ -3,6 +3,7 @@
 # 
 # Created:  May 2015, E. Botero
 # Modified: Feb 2015, M. Vegh
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -15,7 +16,7 @@ import numpy as np
 # ----------------------------------------------------------------------    
 
 ## @ingroup Optimization
-def set_values(dictionary,input_dictionary,converted_values,aliases):
+def set_values(dictionary,input_dictionary,converted_values,aliases,accessors=None):
     """ This method regresses through a dictionary to set the required values.
         dictionary is the base class that will be modified, input_dictionary is
         the set of inputs to be used, converted_values are values to be set in the
@@ -23,7 +24,7 @@ def set_values(dictionary,input_dictionary,converted_values,aliases):
         the names link to
 
     Assumptions:
-    N/A
+    The accessors, if given, come from compile_aliases for the names of the inputs
 
     Source:
     N/A
@@ -33,6 +34,7 @@ def set_values(dictionary,input_dictionary,converted_values,aliases):
     input_dictionary [Data()]
     converted_values [Data()]
     aliases          [list of str]
+    accessors        [list of Alias_Accessor()]
 
     Outputs:
     None
@@ -41,43 +43,11 @@ def set_values(dictionary,input_dictionary,converted_values,aliases):
     N/A
     """      
     
-    provided_names = input_dictionary[:,0]
-        
-    # Correspond aliases to inputs
-    pointer = []
-    for ii in xrange(0,len(provided_names)):
-        for jj in xrange(0,len(aliases)):
-            if provided_names[ii] == aliases[jj][0]:
-                pointer.append(aliases[jj][1])
+    if accessors is None:
+        accessors = compile_aliases(dictionary,input_dictionary[:,0],aliases)
 
-    for ii in xrange(0,len(pointer)):
-        pointers = pointer[ii][:]
-        if isinstance(pointers,str):
-            length = 0
-            if '*' in pointers:
-                newstrings = find_a_star(dictionary,pointer[ii])
-                for jj in xrange(0,len(newstrings)):
-                    localstrs = newstrings[jj].split('.')
-                    correctname = '.'.join(localstrs[0:])
-                    dictionary.deep_set(correctname,converted_values[ii])
-                    
-            elif '*' not in pointers:
-                localstrs = pointers.split('.')
-                correctname = '.'.join(localstrs[0:])
-                dictionary.deep_set(correctname,converted_values[ii])              
-        else:
-            for zz in xrange(1,len(pointers)+1):
-                if '*' in pointers[zz-1]:
-                    newstrings = find_a_star(dictionary,pointer[ii][zz-1])
-                    for jj in xrange(0,len(newstrings)):
-                        localstrs = newstrings[jj].split('.')
-                        correctname = '.'.join(localstrs[0:])
-                        dictionary.deep_set(correctname,converted_values[ii])
-                        
-                elif '*' not in pointers[zz-1]:
-                    localstrs = pointers[zz-1].split('.')
-                    correctname = '.'.join(localstrs[0:])
-                    dictionary.deep_set(correctname,converted_values[ii])            
+    for ii in xrange(0,len(accessors)):
+        accessors[ii].set(dictionary,converted_values[ii])
             
     return dictionary
         
@@ -119,6 +89,147 @@ def find_a_star(dictionary,string):
         
     return newstrings
 
+## @ingroup Optimization
+def compile_aliases(dictionary,names,aliases):
+    """ Resolves the aliases of a list of input or output names once, so they can be set or
+        retrieved without searching the aliases or parsing the paths again. Wildcards are
+        expanded against the dictionary as it is now.
+
+    Assumptions:
+    The keys under a wildcard do not change after this is called
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    names            [list of str]
+    aliases          [list of str]
+
+    Outputs:
+    accessors        [list of Alias_Accessor()]
+
+    Properties Used:
+    N/A
+    """
+    
+    # Correspond aliases to names
+    pointer = []
+    for ii in xrange(0,len(names)):
+        for jj in xrange(0,len(aliases)):
+            if names[ii] == aliases[jj][0]:
+                pointer.append(aliases[jj][1])
+                
+    accessors = []
+    for pointers in pointer:
+        if isinstance(pointers,str):
+            pointers = [pointers]
+            
+        paths = []
+        for path in pointers:
+            if '*' in path:
+                paths.extend(find_a_star(dictionary,path))
+            else:
+                paths.append(path)
+                
+        accessors.append(Alias_Accessor(paths))
+    
+    return accessors
+
+## @ingroup Optimization
+class Alias_Accessor(object):
+    """ Sets or retrieves the value behind one alias. The paths are split into keys once.
+        Values are set through the keys as in Data.deep_set and retrieved as attributes,
+        paths with indexing or calls are evaluated as written.
+        
+        The keys are walked from the dictionary on each call rather than holding on to the
+        Data objects at the end of the path, since procedures can replace those between
+        evaluations.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+    """
+    
+    def __init__(self,paths):
+        """ Splits the paths into keys.
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        paths            [list of str]
+    
+        Outputs:
+        None
+    
+        Properties Used:
+        N/A
+        """
+        
+        self.paths = paths
+        self.keys  = [tuple(path.split('.')) for path in paths]
+        self.plain = ('[' not in paths[0]) and ('(' not in paths[0])
+        
+    def set(self,dictionary,value):
+        """ Sets the value at every path.
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        dictionary       [Data()]
+        value            [float]
+    
+        Outputs:
+        None
+    
+        Properties Used:
+        N/A
+        """
+        
+        for keys in self.keys:
+            data = dictionary
+            for key in keys[:-1]:
+                data = data[key]
+            data[keys[-1]] = value
+            
+    def get(self,dictionary):
+        """ Retrieves the value at the first path.
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        dictionary       [Data()]
+    
+        Outputs:
+        value            [float]
+    
+        Properties Used:
+        N/A
+        """
+        
+        if not self.plain:
+            return eval('dictionary.'+self.paths[0])
+        
+        value = dictionary
+        for key in self.keys[0]:
+            value = getattr(value,key)
+            
+        return value
+
 ## @ingroup Optimization
 def scale_input_values(inputs,x):
     """ Scales the values according to the a provided scale
@@ -181,11 +292,11 @@ def convert_values(inputs):
 # ----------------------------------------------------------------------  
 
 ## @ingroup Optimization
-def get_values(dictionary,outputs,aliases):
+def get_values(dictionary,outputs,aliases,accessors=None):
     """ Retrieves values saved in a dictionary 
 
     Assumptions:
-    N/A
+    The accessors, if given, come from compile_aliases for the names of the outputs
 
     Source:
     N/A
@@ -194,6 +305,7 @@ def get_values(dictionary,outputs,aliases):
     dictionary       [Data()]
     outputs          [Data()]
     aliases          [list of str]
+    accessors        [list of Alias_Accessor()]
 
     Outputs:
     values           [float]
@@ -202,20 +314,13 @@ def get_values(dictionary,outputs,aliases):
     N/A
     """     
     
-    npoutputs   = np.array(outputs)
-    output_names = npoutputs[:,0]
-        
-    # Correspond aliases to outputs
-    pointer = []
-    for ii in xrange(0,len(output_names)):
-        for jj in xrange(0,len(aliases)):
-            if output_names[ii] == aliases[jj][0]:
-                pointer.append(aliases[jj][1])    
+    if accessors is None:
+        npoutputs = np.array(outputs)
+        accessors = compile_aliases(dictionary,npoutputs[:,0],aliases)
                 
     values = np.zeros(len(outputs))
     for ii in xrange(0,len(outputs)):
-        splitstring = pointer[ii].split('.')
-        values[ii]  = eval('dictionary.'+'.'.join(splitstring[0:]))
+        values[ii]  = accessors[ii].get(dictionary)
     
     return values
 
@@ -2,12 +2,14 @@
 # read_optimization_outputs.py
 #
 # Created:  May 2016, M. Vegh
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 import numpy as np
+import os
+from binary_history import is_binary_history, write_history_record, read_history
 
 # ----------------------------------------------------------------------
 #  read_optimization_outputs_inputs
@@ -59,7 +61,8 @@ def format_input_data(data):
     
 ## @ingroup Optimization
 def read_optimization_outputs(filename, base_inputs, constraint_inputs):
-    """Reads in the outputs of an optimization problem
+    """Reads in the outputs of an optimization problem. A binary file is mapped into memory rather than
+        read, so the outputs are read only arrays.
 
         Assumptions:
         None
@@ -84,10 +87,13 @@ def read_optimization_outputs(filename, base_inputs, constraint_inputs):
     """      
     #need vector of initial inputs to determine where to separate 
     #inputs from constraints in text file
-    file_in = open(filename)
-    data = file_in.readlines()
-    file_in.close()
-    data = format_input_data(data)
+    if is_binary_history(filename):
+        data = read_history(filename)
+    else:
+        file_in = open(filename)
+        data = file_in.readlines()
+        file_in.close()
+        data = format_input_data(data)
     
     #unpack data
     iterations    = data[:,0]
@@ -97,4 +103,36 @@ def read_optimization_outputs(filename, base_inputs, constraint_inputs):
     inputs        = data[:,2:inp_end_idx]
     constraints   = data[:,inp_end_idx:const_end_idx] #cannot use [-1] because it takes second to last value in list
     return iterations, obj_values, inputs, constraints
-    
\ No newline at end of file
+
+## @ingroup Optimization
+def convert_optimization_outputs(text_filename, binary_filename, base_inputs, constraint_inputs):
+    """Converts the outputs of an optimization problem written as text into a binary file
+
+        Assumptions:
+        The binary file is started over
+
+        Source:
+        N/A
+
+        Inputs:
+        text_filename     [str]
+        binary_filename   [str]
+        base_inputs       [data]
+        constraint_inputs [data]
+
+        Outputs:
+        None
+
+        Properties Used:
+        None
+    """      
+    
+    iterations, obj_values, inputs, constraints = read_optimization_outputs(text_filename, base_inputs, constraint_inputs)
+    
+    if os.path.exists(binary_filename):
+        os.remove(binary_filename)
+    
+    records = np.hstack((iterations[:,None], obj_values[:,None], inputs, constraints))
+    write_history_record(binary_filename, records)
+        
+    return
@@ -2,7 +2,7 @@
 # write_optimization_outputs.py
 #
 # Created:  May 2016, M. Vegh
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -10,6 +10,8 @@
 # ----------------------------------------------------------------------
 
 from helper_functions import get_values, scale_obj_values, scale_const_values
+from binary_history import is_binary_history, write_history_record
+import numpy as np
 
 # ----------------------------------------------------------------------
 #  write_optimization_outputs
@@ -18,7 +20,8 @@ from helper_functions import get_values, scale_obj_values, scale_const_values
 
 ## @ingroup Optimization
 def write_optimization_outputs(nexus, filename):
-    """ Writes the optimization outputs to a file
+    """ Writes the optimization outputs to a file. A file with a .bin extension, or one that is already
+    binary, gets a binary record of the iteration, objective, inputs and constraints instead of a line of text.
 
     Assumptions:
     N/A
@@ -48,13 +51,18 @@ def write_optimization_outputs(nexus, filename):
     scaled_inputs      = unscaled_inputs/input_scaling
     
     #objective
-    objective_value    = get_values(nexus,objective,aliases)
+    objective_value    = get_values(nexus,objective,aliases,nexus.alias_accessors(objective[:,0]))
     scaled_objective   = scale_obj_values(objective , objective_value)
     
     #constraints
-    constraint_values  = get_values(nexus,constraints,aliases) 
+    constraint_values  = get_values(nexus,constraints,aliases,nexus.alias_accessors(constraints[:,0])) 
     scaled_constraints = scale_const_values(constraints,constraint_values)
     
+    if is_binary_history(filename):
+        record = np.hstack(([nexus.total_number_of_iterations, scaled_objective[0]], scaled_inputs, scaled_constraints))
+        write_history_record(filename, record)
+        return
+    
     problem_inputs  = []
     problem_constraints = []
     for value in scaled_inputs:
@@ -0,0 +1,244 @@
+## @ingroup Sizing
+#Sizing_Database.py
+#Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from read_sizing_inputs import read_sizing_inputs
+from sklearn.base import clone
+import scipy.spatial as spatial
+import numpy as np
+import os
+
+
+## @ingroup Sizing
+class Sizing_Database(Data):
+    def __defaults__(self):
+        """
+        Data class that holds the closed sizing variables of every design the sizing loop has run, so the
+        sizing loop can start from a good initial guess. The entries are kept in memory and mirrored to a
+        binary append-only file: a header with the number of inputs and outputs, then one record of
+        float64 values per entry. Nearest neighbor queries use a KD-tree, rebuilt only when
+        tree_buffer_size new entries have been added; newer entries are searched directly. Regressors
+        fit to the database are only refit every refit_interval new entries.
+        """
+
+        self.filename         = None  #binary file that mirrors the database
+        self.tree_buffer_size = 32    #number of entries added before the KD-tree is rebuilt
+        self.refit_interval   = 5     #number of entries added before a regressor is refit
+        self.number_of_fits   = 0
+        self.loaded           = False
+        self.size             = 0
+        self.inputs           = np.zeros((0,0))
+        self.outputs          = np.zeros((0,0))
+        self.tree             = None
+        self.tree_size        = 0
+        self.regressors       = Data()
+
+    def load(self, number_of_inputs, number_of_outputs, text_filename = None):
+        """
+        Reads the binary file into memory. If there is no binary file yet, the entries of a text file
+        written by write_sizing_outputs are read instead and written to a new binary file. Given a
+        text file, the binary file only mirrors it: it is removed when the text file is missing and
+        rebuilt when the text file has been changed since
+
+        Inputs:
+        number_of_inputs    [int]
+        number_of_outputs   [int]
+        text_filename       [str]
+
+        Outputs:
+        None
+
+        """
+
+        self.size       = 0
+        self.inputs     = np.zeros((16, number_of_inputs))
+        self.outputs    = np.zeros((16, number_of_outputs))
+        self.tree       = None
+        self.tree_size  = 0
+        self.regressors = Data()
+        self.loaded     = True
+
+        #the text file is written before the binary file, so a newer text file was changed by hand
+        if self.filename is not None and text_filename is not None and os.path.exists(self.filename):
+            if not os.path.exists(text_filename) or os.path.getmtime(text_filename) > os.path.getmtime(self.filename):
+                os.remove(self.filename)
+
+        if self.filename is not None and os.path.exists(self.filename):
+            header  = np.fromfile(self.filename, dtype = np.int64, count = 2)
+            if header[0] != number_of_inputs or header[1] != number_of_outputs:
+                raise ValueError('sizing database ' + self.filename + ' holds a different problem')
+            records = np.fromfile(self.filename, dtype = np.float64)[2:]
+
+            #an interrupted write can leave a partial last record
+            width   = number_of_inputs + number_of_outputs
+            records = records[:(len(records)//width)*width].reshape((-1, width))
+            for record in records:
+                self._insert(record[:number_of_inputs], record[number_of_inputs:])
+
+        elif text_filename is not None and os.path.exists(text_filename):
+            text_loop                 = Data()
+            text_loop.output_filename = text_filename
+            text_loop.default_y       = np.zeros(number_of_outputs)
+            data_inputs, data_outputs, read_success = read_sizing_inputs(text_loop, np.zeros(number_of_inputs))
+            if read_success:
+                for k in range(len(data_inputs)):
+                    self.append(data_inputs[k], data_outputs[k])
+
+        return
+
+    def append(self, inputs, outputs):
+        """
+        Adds an entry to the database and to the end of the binary file
+
+        Inputs:
+        inputs              [array]
+        outputs             [array]
+
+        Outputs:
+        None
+
+        """
+
+        inputs  = np.array(inputs, dtype = np.float64)
+        outputs = np.array(outputs, dtype = np.float64)
+
+        if self.filename is not None:
+            new_file = not os.path.exists(self.filename)
+            file_out = open(self.filename, 'ab')
+            if new_file:
+                np.array([len(inputs), len(outputs)], dtype = np.int64).tofile(file_out)
+            np.hstack((inputs, outputs)).tofile(file_out)
+            file_out.close()
+
+        self._insert(inputs, outputs)
+
+        return
+
+    def nearest(self, x, number_of_neighbors = 1):
+        """
+        Finds the entries closest to x
+
+        Inputs:
+        x                   [array]
+        number_of_neighbors [int]
+
+        Outputs:
+        distances           [array]
+        indices             [array]
+
+        """
+
+        x = np.array(x, dtype = np.float64)
+        k = min(number_of_neighbors, self.size)
+
+        if self.size - self.tree_size > self.tree_buffer_size:
+            self.tree      = spatial.cKDTree(self.inputs[:self.size])
+            self.tree_size = self.size
+
+        distances = np.zeros(0)
+        indices   = np.zeros(0, dtype = int)
+        if self.tree_size > 0:
+            distances, indices = self.tree.query(x, min(k, self.tree_size))
+            distances = np.atleast_1d(distances)
+            indices   = np.atleast_1d(indices)
+
+        #entries added since the last rebuild
+        if self.size > self.tree_size:
+            buffer_distances = np.linalg.norm(self.inputs[self.tree_size:self.size] - x, axis = 1)
+            distances        = np.hstack((distances, buffer_distances))
+            indices          = np.hstack((indices, np.arange(self.tree_size, self.size)))
+
+        order = np.argsort(distances, kind = 'mergesort')[:k]
+
+        return distances[order], indices[order]
+
+    def neighbors_prediction(self, x, number_of_neighbors, weighted_distance = False):
+        """
+        Averages the outputs of the entries closest to x, as sklearn's KNeighborsRegressor
+
+        Inputs:
+        x                   [array]
+        number_of_neighbors [int]
+        weighted_distance   [bool]
+
+        Outputs:
+        y                   [array]
+
+        """
+
+        distances, indices = self.nearest(x, number_of_neighbors)
+        outputs            = self.outputs[indices]
+
+        if not weighted_distance:
+            return np.mean(outputs, axis = 0)
+
+        #an exact match takes all of the weight
+        if np.any(distances == 0.):
+            return np.mean(outputs[distances == 0.], axis = 0)
+
+        weights = 1./distances
+
+        return np.dot(weights, outputs)/np.sum(weights)
+
+    def regressor_prediction(self, x, tag, make_regressor):
+        """
+        Predicts the outputs at x with a regressor fit to each output of the database. The fit for
+        tag is kept, and only refit once refit_interval entries have been added
+
+        Inputs:
+        x                   [array]
+        tag                 [str]
+        make_regressor      function that returns an sklearn regressor, only called to refit
+
+        Outputs:
+        y                   [array]
+
+        """
+
+        fit = self.regressors.get(tag, None)
+        if fit is None or self.size - fit.size >= self.refit_interval:
+            fit        = Data()
+            fit.size   = self.size
+            fit.models = []
+            regressor  = make_regressor()
+            for j in range(len(self.outputs[0,:])):
+                model = clone(regressor)
+                model.fit(self.inputs[:self.size], self.outputs[:self.size, j])
+                fit.models.append(model)
+            self.regressors[tag] = fit
+            self.number_of_fits += 1
+
+        x = np.atleast_2d(x)
+        y = []
+        for model in fit.models:
+            y.append(model.predict(x)[0])
+
+        return np.array(y)
+
+    def _insert(self, inputs, outputs):
+        """
+        Adds an entry in memory, doubling the storage when it is full
+
+        Inputs:
+        inputs              [array]
+        outputs             [array]
+
+        Outputs:
+        None
+
+        """
+
+        if self.size == len(self.inputs):
+            self.inputs  = np.vstack((self.inputs, np.zeros(np.shape(self.inputs))))
+            self.outputs = np.vstack((self.outputs, np.zeros(np.shape(self.outputs))))
+
+        self.inputs[self.size]  = inputs
+        self.outputs[self.size] = outputs
+        self.size += 1
+
+        return
@@ -2,6 +2,7 @@
 #Sizing_Loop.py
 #Created:  Jun 2016, M. Vegh
 #Modified: Feb 2017, M. Vegh
+#          Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -9,6 +10,7 @@
 
 from SUAVE.Core import Data
 from SUAVE.Surrogate.svr_surrogate_functions import check_svr_accuracy
+from SUAVE.Optimization.binary_history import write_history_record
 import scipy.interpolate as interpolate
 
 import sklearn.svm as svm
@@ -18,9 +20,12 @@ import sklearn.linear_model as linear_model
 import sklearn.neighbors as neighbors
 from write_sizing_outputs import write_sizing_outputs
 from read_sizing_inputs import read_sizing_inputs
+from Sizing_Database import Sizing_Database
 import numpy as np
 import scipy as sp
 import time
+import multiprocessing
+import os
 
 
 ## @ingroup Sizing
@@ -41,7 +46,9 @@ class Sizing_Loop(Data):
         self.default_y             = None  #default inputs in case the guess is very far from 
         self.default_scaling       = None  #scaling value to make sizing parameters ~1
         self.maximum_iterations    = None  #cutoff point for sizing loop to close
-        self.output_filename       = None  #stores optimization parameters and closed sizing parameters
+        self.output_filename       = None  #stores optimization parameters and closed sizing parameters; mirrored to the same name with a .bin extension, which is removed or rebuilt when this file is deleted or changed
+        self.error_filename        = None  #binary history of the function calls and errors of every iteration, e.g. 'y_err_values.bin'
+        self.database              = Sizing_Database() #in memory copy of the closed sizing parameters, for the initial step
         self.sizing_evaluation     = None  #defined in the Procedure script
         self.write_threshhold      = 9     #number of iterations before it writes, regardless of how close it is to currently written values (i.e. this step is hard to converge)
         
@@ -58,6 +65,10 @@ class Sizing_Loop(Data):
         self.iteration_options.min_surrogate_length              = 4                #minimum number data points needed before SVR is used
         self.iteration_options.number_of_surrogate_calls         = 0
         self.iteration_options.newton_raphson_damping_threshhold = 5E-5
+        self.iteration_options.jacobian_processes                = 1                #number of processes used to finite difference the Jacobian columns
+        self.iteration_options.reuse_jacobian                    = True             #keep the Jacobian between calls, with Broyden updates after each Newton step
+        self.iteration_options.jacobian_stall_ratio              = .5               #finite difference a new Jacobian when a Newton step reduces the residual less than this
+        self.iteration_options.jacobian                          = None             #last Jacobian
         
 
     def evaluate(self, nexus):
@@ -97,89 +108,66 @@ class Sizing_Loop(Data):
         #determine the initial step
         min_norm = 1000.
         if self.initial_step != 'Default':
-            data_inputs, data_outputs, read_success = read_sizing_inputs(self, scaled_inputs)
+            database = self.load_database(len(scaled_inputs))
             
-            if read_success:
-                           
-                diff = np.subtract(scaled_inputs, data_inputs) #check how close inputs are to tabulated values  
-                #find minimum entry and corresponding index 
-                imin_dist = -1 
-                for k in range(len(diff[:,-1])):
-                    row = diff[k,:]
-                    row_norm = np.linalg.norm(row)
-                    if row_norm < min_norm:
-                        min_norm = row_norm
-                        imin_dist = k*1 
+            if database.size > 0:
+                
+                #check how close inputs are to tabulated values
+                distances, indices = database.nearest(scaled_inputs)
+                min_norm  = distances[0]
+                imin_dist = indices[0]
 
                 if min_norm<iteration_options.max_initial_step: #make sure data is close to current guess
-                    if self.initial_step == 'Table' or min_norm<iteration_options.min_surrogate_step or len(data_outputs[:,0])< iteration_options.min_surrogate_length:
-                        regr    = neighbors.KNeighborsRegressor( n_neighbors = 1)
-                        '''
-                        '''
-                        #interp = interpolate.griddata(data_inputs, data_outputs, scaled_inputs, method = 'nearest') 
-                        #y      = interp[0]  #different data type here
-                        '''
-                        y = []
-                        for j in range(len(data_outputs[0,:])):
-                            y_surrogate = regr.fit(data_inputs, data_outputs[:,j])
-                            y.append(y_surrogate.predict(scaled_inputs)[0])
-                        y = np.array(y)
-                        '''
-                    else:
-                        print 'running surrogate method'
-                        if self.initial_step == 'SVR':
-                            #for SVR, can optimize parameters C and eps for closest point
-                            print 'optimizing svr parameters'
-                            x = [2.,-1.] #initial guess for 10**C, 10**eps
+                    if self.initial_step == 'Table' or min_norm<iteration_options.min_surrogate_step or database.size< iteration_options.min_surrogate_length:
+                        y = database.outputs[imin_dist]*1.
                         
-                            t1=time.time()
-                            out = sp.optimize.minimize(check_svr_accuracy, x, method='Nelder-Mead', args=(data_inputs, data_outputs, imin_dist))
-                            t2=time.time()
-                            c_out = 10**out.x[0]
-                            eps_out = 10**out.x[1]
-                            if c_out > 1E10:
-                                c_out = 1E10
-                            if eps_out<1E-8:
-                                eps_out = 1E-8
-                 
-             
-                            
-                            regr        = svm.SVR(C=c_out,  epsilon = eps_out)
-                            
-                        elif self.initial_step == 'GradientBoosting':
-                            regr        = ensemble.GradientBoostingRegressor()
-                            
-                        elif self.initial_step == 'ExtraTrees':
-                            regr        = ensemble.ExtraTreesRegressor()
+                    elif self.initial_step == 'Neighbors':
+                        print 'running surrogate method'
+                        y = database.neighbors_prediction(scaled_inputs, iteration_options.n_neighbors, iteration_options.neighbors_weighted_distance == True)
+                        iteration_options.number_of_surrogate_calls += 1
                         
-                        elif self.initial_step == 'RandomForest':
-                            regr        = ensemble.RandomForestRegressor()
+                    else:
+                        print 'running surrogate method'
+                        data_inputs  = database.inputs[:database.size]
+                        data_outputs = database.outputs[:database.size]
                         
-                        elif self.initial_step == 'Bagging':
-                            regr        = ensemble.BaggingRegressor()
+                        def make_regressor():
+                            if self.initial_step == 'SVR':
+                                #for SVR, can optimize parameters C and eps for closest point
+                                print 'optimizing svr parameters'
+                                x = [2.,-1.] #initial guess for 10**C, 10**eps
                             
-                        elif self.initial_step == 'GPR':
-                            regr        = gaussian_process.GaussianProcess()
+                                out = sp.optimize.minimize(check_svr_accuracy, x, method='Nelder-Mead', args=(data_inputs, data_outputs, imin_dist))
+                                c_out = 10**out.x[0]
+                                eps_out = 10**out.x[1]
+                                if c_out > 1E10:
+                                    c_out = 1E10
+                                if eps_out<1E-8:
+                                    eps_out = 1E-8
+                                
+                                return svm.SVR(C=c_out,  epsilon = eps_out)
+                                
+                            elif self.initial_step == 'GradientBoosting':
+                                return ensemble.GradientBoostingRegressor()
+                                
+                            elif self.initial_step == 'ExtraTrees':
+                                return ensemble.ExtraTreesRegressor()
                             
-                        elif self.initial_step == 'RANSAC':
-                            regr        = linear_model.RANSACRegressor()
-                        
-                        elif self.initial_step == 'Neighbors':
-                            n_neighbors = min(iteration_options.n_neighbors, len(data_outputs))
-                            if iteration_options.neighbors_weighted_distance  == True:
-                                regr    = neighbors.KNeighborsRegressor( n_neighbors = n_neighbors ,weights = 'distance')
+                            elif self.initial_step == 'RandomForest':
+                                return ensemble.RandomForestRegressor()
                             
-                            else:  
-                                regr    = neighbors.KNeighborsRegressor( n_neighbors = n_neighbors)
+                            elif self.initial_step == 'Bagging':
+                                return ensemble.BaggingRegressor()
+                                
+                            elif self.initial_step == 'GPR':
+                                return gaussian_process.GaussianProcess()
+                                
+                            elif self.initial_step == 'RANSAC':
+                                return linear_model.RANSACRegressor()
                         
-                        #now run the fits/guesses  
-                    
+                        #now run the fits/guesses; the fits are kept until enough new data is written
+                        y = database.regressor_prediction(scaled_inputs, self.initial_step, make_regressor)
                         iteration_options.number_of_surrogate_calls += 1
-                    y = []    
-                    for j in range(len(data_outputs[0,:])):
-                        y_surrogate = regr.fit(data_inputs, data_outputs[:,j])
-                        y.append(y_surrogate.predict(scaled_inputs)[0])    
-                    y = np.array(y)
                     
         # initialize previous sizing values
         y_save   = 2*y  #save values to detect oscillation
@@ -262,15 +250,11 @@ class Sizing_Loop(Data):
             print 'y_save = ', y_save
             
             print 'err = ', err
-            '''
-            #uncomment this when you want to write error at each iteration
-            file=open('y_err_values.txt', 'ab')
-            file.write(str(i))
-            file.write(', ')
-            file.write(str(err.tolist()))
-            file.write('\n') 
-            file.close()
-            '''
+            
+            #write error at each iteration
+            if self.error_filename != None:
+                write_history_record(self.error_filename, np.hstack(([i], err)))
+            
             j+=1
             
             if i>max_iter: #
@@ -284,7 +268,9 @@ class Sizing_Loop(Data):
             if converged and (min_norm>self.iteration_options.min_write_step or i>self.write_threshhold): #now output to file, writing when it's either not a FD step, or it takes a long time to converge
             #make sure they're in right format      
             #use y_save2, as it makes derivatives consistent
+                database = self.load_database(len(problem_inputs))
                 write_sizing_outputs(self, y_save2, problem_inputs)
+                database.append(problem_inputs, y_save2)
                 
 
         nexus.total_number_of_iterations += i
@@ -308,6 +294,27 @@ class Sizing_Loop(Data):
         
         
         
+    def load_database(self, number_of_inputs):
+        """
+        Gives the sizing database, reading it on first use. The binary file is output_filename
+        with a .bin extension unless database.filename is set; written text outputs without a
+        binary file are read into it, and deleting the text outputs also resets the binary file
+        
+        Inputs:
+        number_of_inputs    [int]
+        
+        Outputs:
+        database            [Sizing_Database()]
+        """
+        
+        database = self.database
+        if not database.loaded:
+            if database.filename is None and self.output_filename is not None:
+                database.filename = os.path.splitext(self.output_filename)[0] + '.bin'
+            database.load(number_of_inputs, len(self.default_y), self.output_filename)
+        
+        return database
+    
     def successive_substitution_update(self,y, err, sizing_evaluation, nexus, scaling, iter, iteration_options):
         """
         Uses a successive substitution update to try to zero the residual
@@ -324,9 +331,7 @@ class Sizing_Loop(Data):
         tries to use that to zero the residual
         """
         
-        h = iteration_options.h
-        print '###begin Finite Differencing###'
-        J, iter = Finite_Difference_Gradient(y,err, sizing_evaluation, nexus, scaling, iter, h)
+        J, iter = self.jacobian(y, err, sizing_evaluation, nexus, scaling, iter, iteration_options)
         try:
             
             Jinv =np.linalg.inv(J)  
@@ -344,6 +349,8 @@ class Sizing_Loop(Data):
             err_out, y_out = sizing_evaluation(y_update, nexus, scaling)
             iter += 1 
             
+            self.update_jacobian(J, p, err, err_out, iteration_options)
+            
             #save these values in case of Broyden update
             iteration_options.Jinv     = Jinv 
             iteration_options.y_save   = y
@@ -389,9 +396,7 @@ class Sizing_Loop(Data):
     def damped_newton_update(self,y, err, sizing_evaluation, nexus, scaling, iter, iteration_options):
         #uses newton raphson, does backtracking linesearch if it goes too far
         tol = self.tolerance
-        h = iteration_options.h
-        print '###begin Finite Differencing###'
-        J, iter = Finite_Difference_Gradient(y,err, sizing_evaluation, nexus, scaling, iter, h)
+        J, iter = self.jacobian(y, err, sizing_evaluation, nexus, scaling, iter, iteration_options)
         try:  
             Jinv =np.linalg.inv(J)  
             p = -np.dot(Jinv,err)
@@ -409,6 +414,8 @@ class Sizing_Loop(Data):
             iter += 1 
             norm_error =np.linalg.norm(err_out)
             
+            self.update_jacobian(J, p, err, err_out, iteration_options)
+            
             if norm_error<self.iteration_options.newton_raphson_damping_threshhold:
                     old_norm = np.linalg.norm(err)
                     ydamp = y+.5*p #halve the step
@@ -429,6 +436,40 @@ class Sizing_Loop(Data):
         return err_out, y_update, iter
         
 
+    def jacobian(self,y, err, sizing_evaluation, nexus, scaling, iter, iteration_options):
+        """
+        Gives the Jacobian for a Newton step: the one kept from the last Newton step when there is one,
+        otherwise a new finite difference Jacobian
+        """
+        
+        J = iteration_options.jacobian
+        if iteration_options.reuse_jacobian and J is not None and np.shape(J) == (len(y), len(y)):
+            print '###reuse Jacobian###'
+            return J, iter
+        
+        print '###begin Finite Differencing###'
+        J, iter = Finite_Difference_Gradient(y,err, sizing_evaluation, nexus, scaling, iter, iteration_options.h, iteration_options.jacobian_processes)
+        
+        return J, iter
+    
+    def update_jacobian(self,J, p, err, err_out, iteration_options):
+        """
+        Keeps the Jacobian for the next Newton step with a Broyden update from the step p. If the step
+        stalled the Jacobian is dropped, so the next one is finite differenced
+        """
+        
+        if not iteration_options.reuse_jacobian:
+            return
+        
+        df = err_out - err
+        if np.linalg.norm(err_out) > iteration_options.jacobian_stall_ratio*np.linalg.norm(err) or np.isnan(df).any():
+            iteration_options.jacobian = None
+            return
+        
+        iteration_options.jacobian = J + np.outer(df - np.dot(J,p), p)/np.dot(p,p)
+        
+        return
+
     __call__ = evaluate
     
 
@@ -436,9 +477,11 @@ class Sizing_Loop(Data):
 
 
 ## @ingroup Sizing    
-def Finite_Difference_Gradient(x,f , my_function, inputs, scaling, iter, h):
+def Finite_Difference_Gradient(x,f , my_function, inputs, scaling, iter, h, processes=1):
     """
-    Uses a first-order finite difference step to calculate the Jacobian
+    Uses a first-order finite difference step to calculate the Jacobian. The columns are
+    evaluated on worker processes when processes is more than one, each with its own copy
+    of the inputs
     
     Inputs:
     x               [array]
@@ -448,27 +491,58 @@ def Finite_Difference_Gradient(x,f , my_function, inputs, scaling, iter, h):
     scaling         [array]
     iter            [int]
     h               [float]
+    processes       [int]
     
     """
 
-    J=np.nan*np.ones([len(x), len(x)])
+    steps = []
     for i in range(len(x)):
         xu=1.*x;
         xu[i]=x[i]+h *x[i]  #use FD step of H*x
-        fu, y_out = my_function(xu, inputs,scaling)
-        
-        print 'fbase=', f
-        J[:,i] = (fu-f)/(xu[i]-x[i])
+        steps.append(xu)
+    
+    if processes > 1 and len(x) > 1:
+        pool = multiprocessing.Pool(min(processes, len(x)), _difference_setup, (my_function, inputs, scaling))
+        try:
+            fus = pool.map(_difference_evaluate, steps, chunksize=1)
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+    else:
+        fus  = [my_function(xu, inputs, scaling)[0] for xu in steps]
+    
+    print 'fbase=', f
+    J=np.nan*np.ones([len(x), len(x)])
+    for i in range(len(x)):
+        J[:,i] = (fus[i]-f)/(steps[i][i]-x[i])
         iter=iter+1
-        
-
-
 
     return J, iter
 
+# ----------------------------------------------------------------------
+#  Worker functions for the finite difference columns
+# ----------------------------------------------------------------------
 
+# The sizing problem of this process, set by _difference_setup
+_difference_problem = None
 
-        
-        
-        
-    
\ No newline at end of file
+def _difference_setup(my_function, inputs, scaling):
+    """
+    Stores the sizing problem in the process that will evaluate the columns
+    """
+    
+    global _difference_problem
+    _difference_problem = (my_function, inputs, scaling)
+    
+def _difference_evaluate(xu):
+    """
+    Evaluates one finite difference step
+    """
+    
+    my_function, inputs, scaling = _difference_problem
+    fu, y_out = my_function(xu, inputs, scaling)
+    
+    return fu
@@ -2,5 +2,7 @@
 # Sizing provides methods to size a vehicle's mass, battery energy(s), and power based on its geometric properties and mission
 
 from Sizing_Loop import Sizing_Loop
+from Sizing_Database import Sizing_Database
 from read_sizing_inputs import read_sizing_inputs
 from write_sizing_outputs import write_sizing_outputs
+from read_sizing_errors import read_sizing_errors, convert_sizing_errors
@@ -0,0 +1,93 @@
+## @ingroup Sizing
+#read_sizing_errors.py
+
+# Created: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ---------------
+
+import numpy as np
+import os
+from SUAVE.Optimization.binary_history import is_binary_history, write_history_record, read_history
+
+
+# ----------------------------------------------------------------------
+#  read_sizing_errors
+# ----------------------------------------------------------------------
+
+## @ingroup Sizing
+def read_sizing_errors(filename):
+    """
+    This function reads the errors written at each iteration of a sizing 
+    loop, either from the binary file of Sizing_Loop.error_filename or from 
+    a y_err_values.txt text file. A binary file is mapped into memory 
+    rather than read.
+    
+    Inputs:
+    filename
+    
+    Outputs:
+    iterations
+    errors
+    
+    """
+    
+    if is_binary_history(filename):
+        data = read_history(filename)
+    else:
+        data = format_error_data(open(filename).readlines())
+    
+    iterations = data[:,0]
+    errors     = data[:,1:]
+    
+    return iterations, errors
+
+## @ingroup Sizing
+def convert_sizing_errors(text_filename, binary_filename):
+    """
+    Converts a y_err_values.txt text file into a binary file that
+    read_sizing_errors maps into memory
+    
+    Inputs:
+    text_filename
+    binary_filename
+    
+    Outputs:
+    None
+    
+    """
+    
+    iterations, errors = read_sizing_errors(text_filename)
+    
+    if os.path.exists(binary_filename):
+        os.remove(binary_filename)
+    
+    write_history_record(binary_filename, np.hstack((iterations[:,None], errors)))
+    
+    return
+
+## @ingroup Sizing    
+def format_error_data(data):
+    """
+    Formats the lines of a y_err_values.txt file, "iteration, [errors]", 
+    as an array of floats
+    
+    Inputs:
+    data
+    
+    Outputs:
+    data_out
+    
+    """
+    
+    data_out=[]
+    for line in data:
+        line=line.replace('[','')
+        line=line.replace(']','')
+        line=line.replace(',',' ')
+        data_out.append([float(number) for number in line.split()])
+        
+    data_out=np.array(data_out)  #change into numpy array to work with later
+
+    return data_out